@@ -0,0 +1,8 @@
+-- Migration: Add partial index for live events per source and date
+-- Date: 2026-10-15
+-- Description: Backs the COUNT/list queries filtered by source_id and event_date
+--              on non-deleted events, so Postgres can answer them from the index
+
+CREATE INDEX IF NOT EXISTS idx_events_source_date_live
+    ON events(source_id, event_date)
+    WHERE deleted_at IS NULL;
@@ -0,0 +1,9 @@
+-- Migration: Add trigram extension for substring search
+-- Date: 2026-10-15
+-- Description: ILIKE '%suche%' on events.title, locations.raw_name and
+--              locations.city cannot use a B-tree index; pg_trgm provides
+--              GIN indexes for these searches. The indexes themselves are
+--              created on lower(...) in 005, so 004 only enables the extension
+--              (plain-column indexes here would be dropped again right away)
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
@@ -0,0 +1,20 @@
+-- Migration: Rebuild trigram search indexes on lower()
+-- Date: 2026-10-15
+-- Description: Search filters now use lower(column) LIKE lower('%term%')
+--              instead of ILIKE; the trigram indexes from 004 are replaced by
+--              expression indexes on lower(...) so the planner can match them
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+DROP INDEX IF EXISTS idx_events_title_trgm;
+DROP INDEX IF EXISTS idx_locations_raw_name_trgm;
+DROP INDEX IF EXISTS idx_locations_city_trgm;
+
+CREATE INDEX IF NOT EXISTS idx_events_title_lower_trgm
+    ON events USING gin (lower(title) gin_trgm_ops);
+
+CREATE INDEX IF NOT EXISTS idx_locations_raw_name_lower_trgm
+    ON locations USING gin (lower(raw_name) gin_trgm_ops);
+
+CREATE INDEX IF NOT EXISTS idx_locations_city_lower_trgm
+    ON locations USING gin (lower(city) gin_trgm_ops);
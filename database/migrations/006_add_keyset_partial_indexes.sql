@@ -0,0 +1,14 @@
+-- Migration: Add partial indexes for the keyset-paginated list views
+-- Date: 2026-10-15
+-- Description: The events list seeks on (event_date, id) over live events and
+--              the pending locations list on (created_at DESC, id DESC); the
+--              partial indexes match those filters and sort orders exactly.
+--              (source_id, event_date) for live events exists since 003.
+
+CREATE INDEX IF NOT EXISTS idx_events_date_id_live
+    ON events(event_date, id)
+    WHERE deleted_at IS NULL;
+
+CREATE INDEX IF NOT EXISTS idx_locations_pending_created
+    ON locations(created_at DESC, id DESC)
+    WHERE status = 'pending';
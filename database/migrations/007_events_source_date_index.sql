@@ -0,0 +1,11 @@
+-- Migration: Composite index on events(source_id, event_date)
+-- Date: 2026-10-15
+-- Description: Per-source date queries that include soft-deleted rows (stats,
+--              admin views) get a composite index. It replaces the plain
+--              source_id index, which is a prefix of it. The partial index
+--              for live events exists since 003.
+
+CREATE INDEX IF NOT EXISTS idx_events_source_date
+    ON events(source_id, event_date);
+
+DROP INDEX IF EXISTS idx_events_source;
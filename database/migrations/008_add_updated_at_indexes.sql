@@ -0,0 +1,8 @@
+-- Migration: Indexes on updated_at for events and locations
+-- Date: 2026-10-15
+-- Description: List and export ETags are built from the table-wide
+--              MAX(updated_at) instead of COUNT/MAX over the filtered rows.
+--              With these indexes the aggregate is a single index lookup.
+
+CREATE INDEX IF NOT EXISTS idx_events_updated_at ON events(updated_at);
+CREATE INDEX IF NOT EXISTS idx_locations_updated_at ON locations(updated_at);
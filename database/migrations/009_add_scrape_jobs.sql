@@ -0,0 +1,20 @@
+-- Migration: Store API background jobs in the database
+-- Date: 2026-10-15
+-- Description: Job status was kept in memory per API process, so with
+--              several uvicorn workers a status poll could hit a worker
+--              that did not know the job. The partial unique index allows
+--              only one open job per name (e.g. a single "run all").
+
+CREATE TABLE IF NOT EXISTS scrape_jobs (
+    id              VARCHAR(32) PRIMARY KEY,
+    name            VARCHAR(100) NOT NULL,
+    status          VARCHAR(20) NOT NULL,
+    created_at      TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
+    started_at      TIMESTAMP WITH TIME ZONE,
+    finished_at     TIMESTAMP WITH TIME ZONE,
+    result          JSON,
+    error           TEXT
+);
+
+CREATE UNIQUE INDEX IF NOT EXISTS uq_scrape_jobs_active_name ON scrape_jobs(name)
+    WHERE status IN ('queued', 'running');
@@ -4,6 +4,9 @@
 -- Extension für UUID-Generierung
 CREATE EXTENSION IF NOT EXISTS "uuid-ossp";
 
+-- Extension für Trigram-Indizes (Teilstring-Suche mit führendem Wildcard)
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
 -- ===========================================
 -- SOURCES: Welche Websites werden gescraped
 -- ===========================================
@@ -59,6 +62,10 @@ CREATE TABLE locations (
 -- Index für schnelles Matching
 CREATE INDEX idx_locations_source_raw_name ON locations(source_id, raw_name);
 CREATE INDEX idx_locations_status ON locations(status);
+CREATE INDEX idx_locations_pending_created ON locations(created_at DESC, id DESC) WHERE status = 'pending';
+CREATE INDEX idx_locations_raw_name_lower_trgm ON locations USING gin (lower(raw_name) gin_trgm_ops);
+CREATE INDEX idx_locations_city_lower_trgm ON locations USING gin (lower(city) gin_trgm_ops);
+CREATE INDEX idx_locations_updated_at ON locations(updated_at);
 
 -- ===========================================
 -- EVENTS: Die eigentlichen Veranstaltungen
@@ -97,9 +104,13 @@ CREATE TABLE events (
 
 -- Indices für häufige Queries
 CREATE INDEX idx_events_date ON events(event_date);
-CREATE INDEX idx_events_source ON events(source_id);
+CREATE INDEX idx_events_source_date ON events(source_id, event_date);
 CREATE INDEX idx_events_location ON events(location_id);
 CREATE INDEX idx_events_deleted ON events(deleted_at) WHERE deleted_at IS NULL;
+CREATE INDEX idx_events_source_date_live ON events(source_id, event_date) WHERE deleted_at IS NULL;
+CREATE INDEX idx_events_date_id_live ON events(event_date, id) WHERE deleted_at IS NULL;
+CREATE INDEX idx_events_title_lower_trgm ON events USING gin (lower(title) gin_trgm_ops);
+CREATE INDEX idx_events_updated_at ON events(updated_at);
 
 -- ===========================================
 -- SCRAPE_LOGS: Protokollierung der Scrape-Läufe
@@ -129,6 +140,26 @@ CREATE TABLE scrape_logs (
 
 CREATE INDEX idx_scrape_logs_source ON scrape_logs(source_id);
 
+-- ===========================================
+-- SCRAPE_JOBS: Hintergrund-Jobs der API
+-- ===========================================
+CREATE TABLE scrape_jobs (
+    id              VARCHAR(32) PRIMARY KEY,         -- UUID (hex)
+    name            VARCHAR(100) NOT NULL,           -- Scraper-Name oder "all"
+    status          VARCHAR(20) NOT NULL,            -- queued, running, finished, failed
+
+    created_at      TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
+    started_at      TIMESTAMP WITH TIME ZONE,
+    finished_at     TIMESTAMP WITH TIME ZONE,
+
+    result          JSON,
+    error           TEXT
+);
+
+-- Höchstens ein offener Job pro Name (auch über mehrere API-Worker)
+CREATE UNIQUE INDEX uq_scrape_jobs_active_name ON scrape_jobs(name)
+    WHERE status IN ('queued', 'running');
+
 -- ===========================================
 -- TRIGGER: Automatisches updated_at
 -- ===========================================
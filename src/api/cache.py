@@ -0,0 +1,70 @@
+"""
+In-Process Response-Cache für lesende API-Endpoints.
+
+Gecacht wird der Rückgabewert des Endpoints, Schlüssel sind Präfix,
+Funktionsname und die Query-Parameter. Schreibende Endpoints rufen
+invalidate() mit dem betroffenen Präfix auf.
+
+Hinweis: Der Cache lebt pro Prozess. Bei mehreren Uvicorn-Workern oder
+Scrapes außerhalb der API (Scheduler, CLI) greift die Invalidierung nicht
+prozessübergreifend. Gecachte Funktionen bekommen deshalb den Datenstand
+(ETag bzw. etag.data_version) als Parameter, der so Teil des Schlüssels ist.
+"""
+
+import threading
+import time
+from functools import wraps
+from typing import Any, Callable, Dict, Tuple
+
+from sqlalchemy.orm import Session
+
+# Ab dieser Größe werden abgelaufene Einträge beim Schreiben aufgeräumt
+MAX_ENTRIES = 1024
+
+_store: Dict[str, Tuple[float, Any]] = {}
+_lock = threading.Lock()
+
+
+def cached(ttl: int, key_prefix: str) -> Callable:
+    """
+    Decorator für synchrone Endpoints: cacht das Ergebnis für `ttl` Sekunden.
+
+    Der Decorator muss unter @router.get(...) stehen, damit FastAPI die
+    ursprüngliche Signatur (via functools.wraps) sieht.
+    """
+
+    def decorator(func: Callable) -> Callable:
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            params = sorted(
+                (name, value) for name, value in kwargs.items()
+                if not isinstance(value, Session)
+            )
+            key = f"{key_prefix}:{func.__name__}:{params!r}"
+            now = time.monotonic()
+
+            with _lock:
+                entry = _store.get(key)
+            if entry and entry[0] > now:
+                return entry[1]
+
+            result = func(*args, **kwargs)
+
+            with _lock:
+                if len(_store) >= MAX_ENTRIES:
+                    for expired in [k for k, (exp, _) in _store.items() if exp <= now]:
+                        del _store[expired]
+                _store[key] = (now + ttl, result)
+
+            return result
+
+        return wrapper
+
+    return decorator
+
+
+def invalidate(*prefixes: str) -> None:
+    """Entfernt alle Einträge, deren Schlüssel mit einem der Präfixe beginnt."""
+    with _lock:
+        for key in [k for k in _store if k.split(":", 1)[0] in prefixes]:
+            del _store[key]
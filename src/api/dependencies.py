@@ -2,17 +2,30 @@
 FastAPI Dependencies.
 """
 
-from typing import Generator
-from sqlalchemy.orm import Session
+from typing import Generator, List
+from sqlalchemy.orm import Session, raiseload
+from sqlalchemy.orm.interfaces import LoaderOption
 
+from src.config import get_settings
 from src.models import get_session_factory
 
 
 def get_db() -> Generator[Session, None, None]:
-    """Dependency für Datenbank-Session."""
-    SessionFactory = get_session_factory()
-    session = SessionFactory()
+    """Dependency für Datenbank-Session (Factory ist pro Prozess gecacht)."""
+    session = get_session_factory()()
     try:
         yield session
     finally:
         session.close()
+
+
+def strict_loads() -> List[LoaderOption]:
+    """
+    Loader-Optionen gegen versteckte N+1-Queries.
+
+    Mit DB_STRICT_LOADS=true wirft jeder Zugriff auf eine nicht explizit
+    geladene Relationship eine Exception, statt still nachzuladen.
+    """
+    if get_settings().db_strict_loads:
+        return [raiseload("*")]
+    return []
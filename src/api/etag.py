@@ -0,0 +1,56 @@
+"""
+Conditional GET (ETag / 304) für Listen und Exporte.
+
+Das ETag wird aus MAX(updated_at) der beteiligten Tabellen gebildet (je ein
+Index-Lookup, Migration 008) plus den Query-Parametern als Salt. Es ist damit
+gröber als die Liste selbst - jede Änderung an der Tabelle erzeugt ein neues
+ETag -, kostet aber keinen Scan über die gefilterten Zeilen. Zeilen werden nie
+hart gelöscht (Events per deleted_at), daher reicht MAX(updated_at).
+"""
+
+import hashlib
+from typing import Any, Iterable
+
+from fastapi import Request, Response
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+
+def data_version(db: Session, *aggregates: Any) -> tuple:
+    """
+    Werte von Aggregaten verschiedener Tabellen, z.B. func.max(Source.updated_at).
+
+    Jedes Aggregat wird zur Skalar-Subquery, alles in einem Roundtrip.
+    """
+    row = db.query(*(select(aggregate).scalar_subquery() for aggregate in aggregates)).one()
+    return tuple(row)
+
+
+def table_etag(db: Session, *models: Any, salt: str = "") -> str:
+    """ETag aus MAX(updated_at) der Tabellen `models`, `salt` z.B. die Query-Parameter."""
+    return aggregate_etag(db, *(func.max(model.updated_at) for model in models), salt=salt)
+
+
+def aggregate_etag(db: Session, *aggregates: Any, salt: str = "") -> str:
+    """ETag aus Aggregaten verschiedener Tabellen (siehe data_version)."""
+    return _etag(data_version(db, *aggregates), salt)
+
+
+def _etag(values: Iterable[Any], salt: str) -> str:
+    digest = hashlib.md5(repr((tuple(values), salt)).encode()).hexdigest()
+    return f'"{digest}"'
+
+
+def not_modified(request: Request, etag: str) -> bool:
+    """True, wenn der Client das ETag bereits per If-None-Match kennt."""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    return header.strip() == "*" or etag in (
+        tag.strip().removeprefix("W/") for tag in header.split(",")
+    )
+
+
+def not_modified_response(etag: str) -> Response:
+    """Leere 304-Antwort mit ETag."""
+    return Response(status_code=304, headers={"ETag": etag})
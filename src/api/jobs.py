@@ -0,0 +1,148 @@
+"""
+Hintergrund-Jobs für lang laufende Scraper-Aufrufe.
+
+Die Endpoints reichen den Scrape an einen Thread-Pool weiter und antworten
+sofort mit 202 und einer Job-ID; den Status fragt der Client über
+/api/scraper/jobs/{id} ab.
+
+Der Status steht in der Tabelle scrape_jobs, damit jeder Uvicorn-Worker ihn
+beantworten kann - ausgeführt wird der Job im Worker, der ihn angenommen hat.
+Pro Name ist höchstens ein Job offen (Unique-Index); ein zweiter Aufruf
+bekommt die ID des laufenden Jobs. Stirbt ein Worker mitten im Job, bleibt
+dieser offen, bis er nach STALE_JOB_AGE als abgebrochen gilt.
+"""
+
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, Optional
+
+from sqlalchemy.exc import IntegrityError
+
+from src.config import get_settings
+from src.models import ACTIVE_JOB_STATUSES, ScrapeJob, get_session
+
+# Abgeschlossene Jobs bleiben so lange abrufbar
+FINISHED_JOB_RETENTION = timedelta(days=7)
+
+# Offene Jobs, die älter sind, gelten als abgebrochen (z.B. Worker-Neustart)
+STALE_JOB_AGE = timedelta(hours=6)
+
+_lock = threading.Lock()
+_executor: Optional[ThreadPoolExecutor] = None
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    with _lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=get_settings().scrape_concurrency,
+                thread_name_prefix="scrape-job",
+            )
+        return _executor
+
+
+def _update(job_id: str, **fields: Any) -> None:
+    session = get_session()
+    try:
+        session.query(ScrapeJob).filter(ScrapeJob.id == job_id).update(fields)
+        if "finished_at" in fields:
+            # Alte abgeschlossene Jobs verwerfen
+            session.query(ScrapeJob).filter(
+                ScrapeJob.status.notin_(ACTIVE_JOB_STATUSES),
+                ScrapeJob.finished_at < fields["finished_at"] - FINISHED_JOB_RETENTION,
+            ).delete(synchronize_session=False)
+        session.commit()
+    finally:
+        session.close()
+
+
+def _run(job_id: str, func: Callable[..., Any], args: tuple) -> None:
+    _update(job_id, status="running", started_at=datetime.now(timezone.utc))
+    try:
+        result = func(*args)
+    except Exception as e:
+        _update(job_id, status="failed", error=str(e), finished_at=datetime.now(timezone.utc))
+    else:
+        _update(job_id, status="finished", result=result, finished_at=datetime.now(timezone.utc))
+
+
+def _claim(name: str) -> Optional[str]:
+    """
+    Neuen Job unter `name` anlegen und dessen ID liefern.
+
+    Ist bereits einer offen, liefert die Funktion None; ein veralteter offener
+    Job wird dabei als abgebrochen markiert, damit der nächste Versuch klappt.
+    """
+    job_id = uuid.uuid4().hex
+    session = get_session()
+    try:
+        session.add(ScrapeJob(id=job_id, name=name, status="queued"))
+        session.commit()
+        return job_id
+    except IntegrityError:
+        session.rollback()
+        now = datetime.now(timezone.utc)
+        session.query(ScrapeJob).filter(
+            ScrapeJob.name == name,
+            ScrapeJob.status.in_(ACTIVE_JOB_STATUSES),
+            ScrapeJob.created_at < now - STALE_JOB_AGE,
+        ).update(
+            {"status": "failed", "error": "Abgebrochen", "finished_at": now},
+            synchronize_session=False,
+        )
+        session.commit()
+        return None
+    finally:
+        session.close()
+
+
+def _active_job_id(name: str) -> Optional[str]:
+    session = get_session()
+    try:
+        return session.query(ScrapeJob.id).filter(
+            ScrapeJob.name == name, ScrapeJob.status.in_(ACTIVE_JOB_STATUSES)
+        ).scalar()
+    finally:
+        session.close()
+
+
+def submit(name: str, func: Callable[..., Any], *args: Any) -> str:
+    """
+    Job einreihen und dessen ID zurückgeben.
+
+    Läuft unter `name` schon ein Job (in irgendeinem Worker), kommt dessen ID
+    zurück, statt den Scrape ein zweites Mal zu starten.
+    """
+    while True:
+        job_id = _claim(name)
+        if job_id is not None:
+            _get_executor().submit(_run, job_id, func, args)
+            return job_id
+        # Zwischen Konflikt und Abfrage kann der offene Job fertig geworden sein
+        active_id = _active_job_id(name)
+        if active_id is not None:
+            return active_id
+
+
+def get_job(job_id: str) -> Optional[Dict[str, Any]]:
+    """Momentaufnahme eines Jobs oder None, wenn unbekannt."""
+    session = get_session()
+    try:
+        job = session.get(ScrapeJob, job_id)
+        if job is None:
+            return None
+        return {
+            "id": job.id,
+            "name": job.name,
+            "status": job.status,
+            "created_at": job.created_at,
+            "started_at": job.started_at,
+            "finished_at": job.finished_at,
+            "result": job.result,
+            "error": job.error,
+        }
+    finally:
+        session.close()
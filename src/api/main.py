@@ -3,24 +3,38 @@ FastAPI REST API für den Event Scraper.
 """
 
 import os
+from contextlib import asynccontextmanager
 
+import anyio
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from fastapi.staticfiles import StaticFiles
-from fastapi.templating import Jinja2Templates
-from pathlib import Path
 
 from src.config import get_settings
+from src.models import get_engine
 from .routers import events, locations, sources, scraper, scrape_logs
 from .views import pages
 
 settings = get_settings()
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Threadpool dimensionieren und Templates vorkompilieren."""
+    limiter = anyio.to_thread.current_default_thread_limiter()
+    limiter.total_tokens = settings.api_threadpool_size
+    pages.precompile_templates()
+    yield
+
+
 # Swagger Docs: hinter Caddy Basic Auth sichtbar, aber nicht extra exponiert
 app = FastAPI(
     title="Event Scraper API",
     description="API zum Verwalten und Anzeigen von gescrapten Events",
     version="1.0.0",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 # CORS - aus Settings laden
@@ -33,10 +47,6 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Templates
-templates_path = Path(__file__).parent / "templates"
-templates = Jinja2Templates(directory=str(templates_path))
-
 # API Routers
 app.include_router(events.router, prefix="/api/events", tags=["Events"])
 app.include_router(locations.router, prefix="/api/locations", tags=["Locations"])
@@ -49,7 +59,7 @@ app.include_router(pages.router, tags=["Pages"])
 
 
 @app.get("/api")
-def api_root():
+async def api_root():
     """API Übersicht."""
     return {
         "message": "Event Scraper API",
@@ -62,3 +72,16 @@ def api_root():
         },
         "docs": "/docs",
     }
+
+
+@app.get("/health/pool")
+def pool_status():
+    """Auslastung des DB-Connection-Pools."""
+    pool = get_engine().pool
+    return {
+        "size": pool.size(),
+        "checked_out": pool.checkedout(),
+        "overflow": pool.overflow(),
+        "checked_in": pool.checkedin(),
+        "status": pool.status(),
+    }
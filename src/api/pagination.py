@@ -0,0 +1,44 @@
+"""
+Keyset-Pagination ("Seek") für Listen-Endpoints.
+
+Statt OFFSET wird der Sortierschlüssel des letzten Eintrags als opaker
+Cursor weitergegeben; die nächste Seite beginnt direkt dahinter. Die
+Antwort bleibt eine Liste, der Cursor kommt im Header X-Next-Cursor.
+"""
+
+import base64
+import binascii
+import json
+from typing import Any, Callable, Sequence, Tuple
+
+from fastapi import HTTPException, Response
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def encode_cursor(*values: Any) -> str:
+    """Sortierschlüssel (date/datetime/int) als URL-sicheren String kodieren."""
+    raw = json.dumps([v.isoformat() if hasattr(v, "isoformat") else v for v in values])
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def decode_cursor(cursor: str, *parsers: Callable[[Any], Any]) -> Tuple:
+    """Cursor dekodieren, pro Schlüsselteil mit dem passenden Parser."""
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        if not isinstance(values, list) or len(values) != len(parsers):
+            raise ValueError(cursor)
+        return tuple(parse(value) for parse, value in zip(parsers, values))
+    except (ValueError, TypeError, binascii.Error):
+        raise HTTPException(status_code=400, detail="Ungültiger Cursor")
+
+
+def set_next_cursor(
+    response: Response,
+    items: Sequence,
+    limit: int,
+    key: Callable[[Any], Tuple],
+) -> None:
+    """Setzt X-Next-Cursor, wenn die Seite voll ist (es also weitergehen kann)."""
+    if items and len(items) == limit:
+        response.headers[NEXT_CURSOR_HEADER] = encode_cursor(*key(items[-1]))
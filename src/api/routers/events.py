@@ -2,14 +2,18 @@
 API Endpoints für Events.
 """
 
-from datetime import date
+from datetime import date, datetime, timezone
 from typing import List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from sqlalchemy import func, tuple_
 from sqlalchemy.orm import Session, joinedload
 
-from src.models import Event, Source, Location
-from ..dependencies import get_db
+from src.models import Event, Location, Source
+from ..cache import cached, invalidate
+from ..dependencies import get_db, strict_loads
+from ..etag import data_version, table_etag, not_modified, not_modified_response
+from ..pagination import decode_cursor, set_next_cursor
 from ..schemas import EventResponse, EventListResponse, EventUpdate
 
 router = APIRouter()
@@ -17,8 +21,11 @@ router = APIRouter()
 
 @router.get("", response_model=List[EventListResponse])
 def list_events(
-    skip: int = Query(0, ge=0),
+    request: Request,
+    response: Response,
+    skip: int = Query(0, ge=0, deprecated=True, description="Veraltet: stattdessen `after` nutzen"),
     limit: int = Query(50, ge=1, le=10000),
+    after: Optional[str] = Query(None, description="Cursor aus dem X-Next-Cursor-Header der vorigen Seite"),
     source_id: Optional[int] = None,
     from_date: Optional[date] = None,
     to_date: Optional[date] = None,
@@ -26,49 +33,101 @@ def list_events(
     has_location: Optional[bool] = None,
     db: Session = Depends(get_db),
 ):
-    """Liste aller Events mit Filteroptionen."""
-    query = db.query(Event).filter(Event.deleted_at == None)
+    """Liste aller Events mit Filteroptionen (Keyset-Pagination über `after`)."""
+    # Source-Name und Ort stehen mit in der Liste, daher fließen sie ins ETag ein
+    etag = table_etag(db, Event, Source, Location, salt=request.url.query)
+    if not_modified(request, etag):
+        return not_modified_response(etag)
+
+    # Das ETag gehört zum Cache-Schlüssel: Scrapes außerhalb der API rufen
+    # kein invalidate() auf, sonst gäbe es neues ETag zu altem Inhalt
+    result = _list_events(
+        skip=skip, limit=limit, after=after, source_id=source_id,
+        from_date=from_date, to_date=to_date, search=search,
+        has_location=has_location, etag=etag, db=db,
+    )
+    set_next_cursor(response, result, limit, lambda e: (e.event_date, e.id))
+    response.headers["ETag"] = etag
+    return result
+
+
+def _event_filters(
+    source_id: Optional[int],
+    from_date: Optional[date],
+    to_date: Optional[date],
+    search: Optional[str],
+    has_location: Optional[bool],
+) -> list:
+    """WHERE-Bedingungen der Event-Liste."""
+    filters = [Event.deleted_at == None]
 
     if source_id:
-        query = query.filter(Event.source_id == source_id)
+        filters.append(Event.source_id == source_id)
 
     if has_location is True:
-        query = query.filter(Event.location_id != None)
+        filters.append(Event.location_id != None)
     elif has_location is False:
-        query = query.filter(Event.location_id == None)
+        filters.append(Event.location_id == None)
 
     if from_date:
-        query = query.filter(Event.event_date >= from_date)
+        filters.append(Event.event_date >= from_date)
 
     if to_date:
-        query = query.filter(Event.event_date <= to_date)
+        filters.append(Event.event_date <= to_date)
 
     if search:
-        query = query.filter(Event.title.ilike(f"%{search}%"))
-
-    query = query.order_by(Event.event_date.asc())
-    events = query.offset(skip).limit(limit).all()
-
-    # Manuelles Mapping für die Liste
-    result = []
-    for event in events:
-        source = db.query(Source).filter(Source.id == event.source_id).first()
-        location = db.query(Location).filter(Location.id == event.location_id).first() if event.location_id else None
-
-        result.append(EventListResponse(
-            id=event.id,
-            title=event.title,
-            event_date=event.event_date,
-            event_time=event.event_time,
-            url=event.url,
-            raw_location=event.raw_location,
-            source_id=event.source_id,
-            source_name=source.name if source else None,
-            location_id=event.location_id,
-            location_city=location.city if location else None,
-        ))
+        # lower() + LIKE nutzt den pg_trgm-GIN-Index auf lower(title) (Migration 005)
+        filters.append(func.lower(Event.title).like(f"%{search.lower()}%"))
+
+    return filters
+
+
+@cached(ttl=60, key_prefix="events")
+def _list_events(
+    *,
+    skip: int,
+    limit: int,
+    after: Optional[str],
+    source_id: Optional[int],
+    from_date: Optional[date],
+    to_date: Optional[date],
+    search: Optional[str],
+    has_location: Optional[bool],
+    etag: str,  # nur Teil des Cache-Schlüssels
+    db: Session,
+) -> List[EventListResponse]:
+    # Nur die Spalten der Listenansicht, keine ORM-Objekte
+    query = (
+        db.query(
+            Event.id,
+            Event.title,
+            Event.event_date,
+            Event.event_time,
+            Event.url,
+            Event.raw_location,
+            Event.source_id,
+            Source.name.label("source_name"),
+            Event.location_id,
+            Location.city.label("location_city"),
+        )
+        .outerjoin(Source, Event.source_id == Source.id)
+        .outerjoin(Location, Event.location_id == Location.id)
+        .filter(*_event_filters(source_id, from_date, to_date, search, has_location))
+    )
 
-    return result
+    if after:
+        after_date, after_id = decode_cursor(after, date.fromisoformat, int)
+        query = query.filter(tuple_(Event.event_date, Event.id) > (after_date, after_id))
+        # Cursor und Offset nicht mischen: das veraltete `skip` entfällt
+        skip = 0
+
+    query = query.order_by(Event.event_date.asc(), Event.id.asc())
+
+    # Die Daten kommen typisiert aus der DB, daher ohne erneute Validierung
+    return [
+        EventListResponse.model_construct(**row._mapping)
+        for row in query.offset(skip).limit(limit).all()
+    ]
 
 
 @router.get("/count")
@@ -79,7 +138,23 @@ def count_events(
     db: Session = Depends(get_db),
 ):
     """Anzahl der Events."""
-    query = db.query(Event).filter(Event.deleted_at == None)
+    # Der Datenstand gehört zum Cache-Schlüssel (Invalidierung ist pro Worker)
+    return _count_events(
+        source_id=source_id, from_date=from_date, to_date=to_date,
+        version=data_version(db, func.max(Event.updated_at)), db=db,
+    )
+
+
+@cached(ttl=60, key_prefix="events")
+def _count_events(
+    *,
+    source_id: Optional[int],
+    from_date: Optional[date],
+    to_date: Optional[date],
+    version: tuple,  # nur Teil des Cache-Schlüssels
+    db: Session,
+) -> dict:
+    query = db.query(func.count(Event.id)).filter(Event.deleted_at == None)
 
     if source_id:
         query = query.filter(Event.source_id == source_id)
@@ -90,7 +165,7 @@ def count_events(
     if to_date:
         query = query.filter(Event.event_date <= to_date)
 
-    return {"count": query.count()}
+    return {"count": query.scalar()}
 
 
 @router.get("/{event_id}", response_model=EventResponse)
@@ -98,7 +173,7 @@ def get_event(event_id: int, db: Session = Depends(get_db)):
     """Einzelnes Event mit Details."""
     event = (
         db.query(Event)
-        .options(joinedload(Event.source), joinedload(Event.location))
+        .options(joinedload(Event.source), joinedload(Event.location), *strict_loads())
         .filter(Event.id == event_id)
         .first()
     )
@@ -112,15 +187,14 @@ def get_event(event_id: int, db: Session = Depends(get_db)):
 @router.delete("/{event_id}")
 def delete_event(event_id: int, db: Session = Depends(get_db)):
     """Event soft-löschen."""
-    from datetime import datetime
-
     event = db.query(Event).filter(Event.id == event_id).first()
 
     if not event:
         raise HTTPException(status_code=404, detail="Event nicht gefunden")
 
-    event.deleted_at = datetime.utcnow()
+    event.deleted_at = datetime.now(timezone.utc)
     db.commit()
+    invalidate("events", "stats")
 
     return {"message": "Event gelöscht", "id": event_id}
 
@@ -130,7 +204,7 @@ def update_event(event_id: int, update: EventUpdate, db: Session = Depends(get_d
     """Event aktualisieren."""
     event = (
         db.query(Event)
-        .options(joinedload(Event.source), joinedload(Event.location))
+        .options(joinedload(Event.source), joinedload(Event.location), *strict_loads())
         .filter(Event.id == event_id)
         .first()
     )
@@ -143,6 +217,10 @@ def update_event(event_id: int, update: EventUpdate, db: Session = Depends(get_d
         setattr(event, field, value)
 
     db.commit()
-    db.refresh(event)
+    # updated_at setzt der DB-Trigger; location nach geänderter location_id
+    # neu laden (expire_on_commit=False hält sonst die alte Location)
+    refresh = ["updated_at", "location"] if "location_id" in update_data else ["updated_at"]
+    db.refresh(event, attribute_names=refresh)
+    invalidate("events", "stats")
 
     return event
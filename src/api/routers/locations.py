@@ -7,14 +7,19 @@ import io
 import json
 from datetime import datetime, timezone
 from decimal import Decimal
-from typing import List, Optional
+from typing import Iterator, List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query, UploadFile, File
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, UploadFile, File
 from fastapi.responses import StreamingResponse
-from sqlalchemy.orm import Session
+from sqlalchemy import func, tuple_, update
+from sqlalchemy.orm import Session, contains_eager
 
-from src.models import Location, LocationStatus, Source
+from src.models import Location, LocationStatus, Source, get_session
+from ..cache import cached, invalidate
 from ..dependencies import get_db
+from ..etag import data_version, table_etag, not_modified, not_modified_response
+from ..pagination import decode_cursor, set_next_cursor
 from ..schemas import LocationResponse, LocationUpdate
 
 router = APIRouter()
@@ -26,29 +31,86 @@ LOCATION_CSV_FIELDS = [
     "latitude", "longitude", "status"
 ]
 
+# Maximale Anzahl IDs pro IN (...)-Abfrage beim Import
+IMPORT_BATCH_SIZE = 1000
+
+# Spalten, die LocationResponse braucht (Listen laden nur diese)
+_LOCATION_RESPONSE_COLUMNS = tuple(
+    getattr(Location, field) for field in LocationResponse.model_fields
+)
+
 
 @router.get("", response_model=List[LocationResponse])
 def list_locations(
-    skip: int = Query(0, ge=0),
+    request: Request,
+    response: Response,
+    skip: int = Query(0, ge=0, deprecated=True, description="Veraltet: stattdessen `after` nutzen"),
     limit: int = Query(50, ge=1, le=10000),
+    after: Optional[str] = Query(None, description="Cursor aus dem X-Next-Cursor-Header der vorigen Seite"),
     status: Optional[str] = None,
     search: Optional[str] = None,
     db: Session = Depends(get_db),
 ):
-    """Liste aller Locations."""
-    query = db.query(Location)
+    """Liste aller Locations (neueste zuerst, Keyset-Pagination über `after`)."""
+    etag = table_etag(db, Location, salt=request.url.query)
+    if not_modified(request, etag):
+        return not_modified_response(etag)
+
+    # Das ETag gehört zum Cache-Schlüssel: Scrapes außerhalb der API rufen
+    # kein invalidate() auf, sonst gäbe es neues ETag zu altem Inhalt
+    result = _list_locations(
+        skip=skip, limit=limit, after=after, status=status, search=search,
+        etag=etag, db=db,
+    )
+    set_next_cursor(response, result, limit, lambda loc: (loc.created_at, loc.id))
+    response.headers["ETag"] = etag
+    return result
+
+
+def _location_filters(status: Optional[str], search: Optional[str]) -> list:
+    """WHERE-Bedingungen der Location-Liste."""
+    filters = []
 
     if status:
-        query = query.filter(Location.status == status)
+        filters.append(Location.status == status)
 
     if search:
-        query = query.filter(
-            (Location.raw_name.ilike(f"%{search}%")) |
-            (Location.city.ilike(f"%{search}%"))
+        # Beide Spalten haben einen pg_trgm-GIN-Index auf lower() (Migration 005)
+        pattern = f"%{search.lower()}%"
+        filters.append(
+            (func.lower(Location.raw_name).like(pattern)) |
+            (func.lower(Location.city).like(pattern))
         )
 
-    query = query.order_by(Location.created_at.desc())
-    return query.offset(skip).limit(limit).all()
+    return filters
+
+
+@cached(ttl=60, key_prefix="locations")
+def _list_locations(
+    *,
+    skip: int,
+    limit: int,
+    after: Optional[str],
+    status: Optional[str],
+    search: Optional[str],
+    etag: str,  # nur Teil des Cache-Schlüssels
+    db: Session,
+) -> List[LocationResponse]:
+    query = db.query(*_LOCATION_RESPONSE_COLUMNS).filter(*_location_filters(status, search))
+
+    if after:
+        after_created, after_id = decode_cursor(after, datetime.fromisoformat, int)
+        query = query.filter(tuple_(Location.created_at, Location.id) < (after_created, after_id))
+        # Cursor und Offset nicht mischen: das veraltete `skip` entfällt
+        skip = 0
+
+    query = query.order_by(Location.created_at.desc(), Location.id.desc())
+    # Als Schema-Objekte cachen, nicht als (später detachte) ORM-Instanzen.
+    # model_construct spart die Validierung der ohnehin typisierten DB-Werte.
+    return [
+        LocationResponse.model_construct(**row._mapping)
+        for row in query.offset(skip).limit(limit).all()
+    ]
 
 
 @router.get("/pending", response_model=List[LocationResponse])
@@ -71,15 +133,27 @@ def list_pending_locations(
 @router.get("/count")
 def count_locations(
     status: Optional[str] = None,
+    search: Optional[str] = None,
     db: Session = Depends(get_db),
 ):
     """Anzahl der Locations."""
-    query = db.query(Location)
+    # Der Datenstand gehört zum Cache-Schlüssel (Invalidierung ist pro Worker)
+    return _count_locations(
+        status=status, search=search,
+        version=data_version(db, func.max(Location.updated_at)), db=db,
+    )
 
-    if status:
-        query = query.filter(Location.status == status)
 
-    return {"count": query.count()}
+@cached(ttl=60, key_prefix="locations")
+def _count_locations(
+    *,
+    status: Optional[str],
+    search: Optional[str],
+    version: tuple,  # nur Teil des Cache-Schlüssels
+    db: Session,
+) -> dict:
+    query = db.query(func.count(Location.id)).filter(*_location_filters(status, search))
+    return {"count": query.scalar()}
 
 
 @router.get("/{location_id}", response_model=LocationResponse)
@@ -110,122 +184,168 @@ def update_location(
         setattr(location, key, value)
 
     db.commit()
-    db.refresh(location)
+    # updated_at setzt der DB-Trigger, alles andere ist bereits aktuell
+    db.refresh(location, attribute_names=["updated_at"])
+    invalidate("locations", "stats")
 
     return location
 
 
-@router.post("/{location_id}/confirm", response_model=LocationResponse)
-def confirm_location(location_id: int, db: Session = Depends(get_db)):
-    """Location als 'confirmed' markieren."""
-    location = db.query(Location).filter(Location.id == location_id).first()
+def _set_location_status(db: Session, location_id: int, status: str) -> Location:
+    """Status per UPDATE ... RETURNING setzen - ein Roundtrip statt SELECT, UPDATE und Refresh."""
+    location = db.execute(
+        update(Location)
+        .where(Location.id == location_id)
+        .values(status=status)
+        .returning(Location)
+    ).scalar_one_or_none()
 
     if not location:
         raise HTTPException(status_code=404, detail="Location nicht gefunden")
 
-    location.status = LocationStatus.CONFIRMED.value
     db.commit()
-    db.refresh(location)
+    invalidate("locations", "stats")
 
     return location
 
 
+@router.post("/{location_id}/confirm", response_model=LocationResponse)
+def confirm_location(location_id: int, db: Session = Depends(get_db)):
+    """Location als 'confirmed' markieren."""
+    return _set_location_status(db, location_id, LocationStatus.CONFIRMED.value)
+
+
 @router.post("/{location_id}/ignore", response_model=LocationResponse)
 def ignore_location(location_id: int, db: Session = Depends(get_db)):
     """Location als 'ignored' markieren."""
-    location = db.query(Location).filter(Location.id == location_id).first()
+    return _set_location_status(db, location_id, LocationStatus.IGNORED.value)
 
-    if not location:
-        raise HTTPException(status_code=404, detail="Location nicht gefunden")
 
-    location.status = LocationStatus.IGNORED.value
-    db.commit()
-    db.refresh(location)
+class _Echo:
+    """Pseudo-Buffer für csv.writer: gibt die geschriebene Zeile direkt zurück."""
 
-    return location
+    def write(self, value):
+        return value
+
+
+def _location_export_row(loc: Location) -> dict:
+    """Eine Location als Export-Zeile (CSV/JSON)."""
+    return {
+        "id": loc.id,
+        "source_id": loc.source_id,
+        "source_name": loc.source.name if loc.source else "",
+        "raw_name": loc.raw_name,
+        "display_name": loc.display_name or "",
+        "street": loc.street or "",
+        "house_number": loc.house_number or "",
+        "postal_code": loc.postal_code or "",
+        "city": loc.city or "",
+        "country": loc.country or "Deutschland",
+        "latitude": str(loc.latitude) if loc.latitude else "",
+        "longitude": str(loc.longitude) if loc.longitude else "",
+        "status": loc.status,
+    }
+
+
+def _iter_export_locations(status: Optional[str]) -> Iterator[Location]:
+    """
+    Liefert die zu exportierenden Locations in Batches von 500.
+
+    Der Generator öffnet eine eigene Session, da er erst während des
+    Streamings der Response läuft - also nach dem Ende von get_db.
+    """
+    session = get_session()
+    try:
+        query = (
+            session.query(Location)
+            .join(Source)
+            .options(contains_eager(Location.source))
+        )
+
+        if status:
+            query = query.filter(Location.status == status)
+
+        query = query.order_by(Source.name, Location.raw_name)
+        yield from query.yield_per(500)
+    finally:
+        session.close()
+
+
+def _export_etag(db: Session, status: Optional[str], fmt: str) -> str:
+    """ETag eines Exports (Source-Namen sind Teil der Zeilen)."""
+    return table_etag(db, Location, Source, salt=f"{status}:{fmt}")
 
 
 @router.get("/export/csv")
 def export_locations_csv(
+    request: Request,
     status: Optional[str] = None,
     db: Session = Depends(get_db),
 ):
-    """Exportiert alle Locations als CSV-Datei."""
-    query = db.query(Location).join(Source)
+    """Exportiert alle Locations als CSV-Datei (gestreamt, mit ETag)."""
+    etag = _export_etag(db, status, "csv")
+    if not_modified(request, etag):
+        return not_modified_response(etag)
+
+    writer = csv.DictWriter(_Echo(), fieldnames=LOCATION_CSV_FIELDS, delimiter=";")
+
+    def rows():
+        yield writer.writeheader()
+        for loc in _iter_export_locations(status):
+            yield writer.writerow(_location_export_row(loc))
 
-    if status:
-        query = query.filter(Location.status == status)
-
-    locations = query.order_by(Source.name, Location.raw_name).all()
-
-    # CSV erstellen
-    buffer = io.StringIO()
-    writer = csv.DictWriter(buffer, fieldnames=LOCATION_CSV_FIELDS, delimiter=";")
-    writer.writeheader()
-
-    for loc in locations:
-        writer.writerow({
-            "id": loc.id,
-            "source_id": loc.source_id,
-            "source_name": loc.source.name if loc.source else "",
-            "raw_name": loc.raw_name,
-            "display_name": loc.display_name or "",
-            "street": loc.street or "",
-            "house_number": loc.house_number or "",
-            "postal_code": loc.postal_code or "",
-            "city": loc.city or "",
-            "country": loc.country or "Deutschland",
-            "latitude": str(loc.latitude) if loc.latitude else "",
-            "longitude": str(loc.longitude) if loc.longitude else "",
-            "status": loc.status,
-        })
-
-    # Als Download zurückgeben
-    buffer.seek(0)
     return StreamingResponse(
-        iter([buffer.getvalue()]),
+        rows(),
         media_type="text/csv",
-        headers={"Content-Disposition": "attachment; filename=locations.csv"}
+        headers={"Content-Disposition": "attachment; filename=locations.csv", "ETag": etag}
     )
 
 
 @router.get("/export/json")
 def export_locations_json(
+    request: Request,
     status: Optional[str] = None,
     db: Session = Depends(get_db),
 ):
-    """Exportiert alle Locations als JSON-Datei."""
-    query = db.query(Location).join(Source)
-
-    if status:
-        query = query.filter(Location.status == status)
-
-    locations = query.order_by(Source.name, Location.raw_name).all()
-
-    data = []
-    for loc in locations:
-        data.append({
-            "id": loc.id,
-            "source_id": loc.source_id,
-            "source_name": loc.source.name if loc.source else "",
-            "raw_name": loc.raw_name,
-            "display_name": loc.display_name or "",
-            "street": loc.street or "",
-            "house_number": loc.house_number or "",
-            "postal_code": loc.postal_code or "",
-            "city": loc.city or "",
-            "country": loc.country or "Deutschland",
-            "latitude": str(loc.latitude) if loc.latitude else "",
-            "longitude": str(loc.longitude) if loc.longitude else "",
-            "status": loc.status,
-        })
-
-    json_str = json.dumps(data, indent=2, ensure_ascii=False)
+    """Exportiert alle Locations als JSON-Datei (gestreamt, mit ETag)."""
+    etag = _export_etag(db, status, "json")
+    if not_modified(request, etag):
+        return not_modified_response(etag)
+
+    def rows():
+        yield b"["
+        separator = b"\n"
+        for loc in _iter_export_locations(status):
+            yield separator + orjson.dumps(_location_export_row(loc))
+            separator = b",\n"
+        yield b"\n]\n"
 
     return StreamingResponse(
-        iter([json_str]),
+        rows(),
         media_type="application/json",
-        headers={"Content-Disposition": "attachment; filename=locations.json"}
+        headers={"Content-Disposition": "attachment; filename=locations.json", "ETag": etag}
+    )
+
+
+@router.get("/export/jsonl")
+def export_locations_jsonl(
+    request: Request,
+    status: Optional[str] = None,
+    db: Session = Depends(get_db),
+):
+    """Exportiert alle Locations als JSON Lines (ein Objekt pro Zeile, gestreamt)."""
+    etag = _export_etag(db, status, "jsonl")
+    if not_modified(request, etag):
+        return not_modified_response(etag)
+
+    def rows():
+        for loc in _iter_export_locations(status):
+            yield orjson.dumps(_location_export_row(loc)) + b"\n"
+
+    return StreamingResponse(
+        rows(),
+        media_type="application/x-ndjson",
+        headers={"Content-Disposition": "attachment; filename=locations.jsonl", "ETag": etag}
     )
 
 
@@ -259,67 +379,63 @@ async def import_locations(
     skipped = 0
     errors = []
 
+    # Erster Durchlauf: referenzierte IDs sammeln und in einem Rutsch prüfen
+    ids = set()
     for row in data:
         try:
             location_id = int(row.get("id", 0))
+        except Exception:
+            continue
+        if location_id:
+            ids.add(location_id)
+
+    existing_ids = set()
+    id_list = list(ids)
+    for i in range(0, len(id_list), IMPORT_BATCH_SIZE):
+        batch = id_list[i:i + IMPORT_BATCH_SIZE]
+        existing_ids.update(
+            row_id for (row_id,) in db.query(Location.id).filter(Location.id.in_(batch))
+        )
 
-            if not location_id:
-                skipped += 1
-                continue
+    # Zweiter Durchlauf: Änderungen sammeln, danach ein Bulk-UPDATE
+    now = datetime.now(timezone.utc)
+    mappings = []
 
-            location = db.query(Location).filter(Location.id == location_id).first()
+    for row in data:
+        try:
+            location_id = int(row.get("id", 0))
 
-            if not location:
+            if not location_id or location_id not in existing_ids:
                 skipped += 1
                 continue
 
-            # Felder aktualisieren
-            changed = False
-
-            if row.get("display_name"):
-                location.display_name = row["display_name"]
-                changed = True
-
-            if row.get("street"):
-                location.street = row["street"]
-                changed = True
-
-            if row.get("house_number"):
-                location.house_number = row["house_number"]
-                changed = True
-
-            if row.get("postal_code"):
-                location.postal_code = row["postal_code"]
-                changed = True
-
-            if row.get("city"):
-                location.city = row["city"]
-                changed = True
+            # Felder aktualisieren (nur wenn Wert vorhanden)
+            changes = {}
 
-            if row.get("country"):
-                location.country = row["country"]
-                changed = True
+            for field in ("display_name", "street", "house_number", "postal_code", "city", "country"):
+                if row.get(field):
+                    changes[field] = row[field]
 
             if row.get("latitude"):
-                location.latitude = Decimal(row["latitude"])
-                changed = True
+                changes["latitude"] = Decimal(row["latitude"])
 
             if row.get("longitude"):
-                location.longitude = Decimal(row["longitude"])
-                changed = True
+                changes["longitude"] = Decimal(row["longitude"])
 
             if row.get("status") and row["status"] in ["pending", "confirmed", "ignored"]:
-                location.status = row["status"]
-                changed = True
+                changes["status"] = row["status"]
 
-            if changed:
-                location.updated_at = datetime.now(timezone.utc)
+            if changes:
+                mappings.append({"id": location_id, **changes, "updated_at": now})
                 updated += 1
 
         except Exception as e:
             errors.append(f"ID {row.get('id', '?')}: {str(e)}")
 
+    if mappings:
+        db.bulk_update_mappings(Location, mappings)
     db.commit()
+    invalidate("locations", "stats")
 
     return {
         "message": "Import abgeschlossen",
@@ -2,28 +2,68 @@
 API Endpoints für Scrape Logs.
 """
 
+from datetime import datetime
 from typing import List, Optional
 
-from fastapi import APIRouter, Depends, Query
-from sqlalchemy.orm import Session, joinedload
+from fastapi import APIRouter, Depends, Query, Response
+from sqlalchemy import func, tuple_
+from sqlalchemy.orm import Session
 
-from src.models import ScrapeLog, Source
+from src.models import ScrapeLog
 from ..dependencies import get_db
+from ..pagination import decode_cursor, set_next_cursor
 from ..schemas import ScrapeLogResponse
 
 router = APIRouter()
 
+# Spalten, die ScrapeLogResponse braucht
+_SCRAPE_LOG_COLUMNS = tuple(
+    getattr(ScrapeLog, field) for field in ScrapeLogResponse.model_fields
+)
+
 
 @router.get("", response_model=List[ScrapeLogResponse])
 def list_scrape_logs(
-    skip: int = Query(0, ge=0),
+    response: Response,
+    skip: int = Query(0, ge=0, deprecated=True, description="Veraltet: stattdessen `after` nutzen"),
     limit: int = Query(50, ge=1, le=500),
+    after: Optional[str] = Query(None, description="Cursor aus dem X-Next-Cursor-Header der vorigen Seite"),
+    source_id: Optional[int] = None,
+    status: Optional[str] = None,
+    db: Session = Depends(get_db),
+):
+    """Liste aller Scrape Logs (neueste zuerst, Keyset-Pagination über `after`)."""
+    query = db.query(*_SCRAPE_LOG_COLUMNS)
+
+    if after:
+        after_started, after_id = decode_cursor(after, datetime.fromisoformat, int)
+        query = query.filter(tuple_(ScrapeLog.started_at, ScrapeLog.id) < (after_started, after_id))
+        # Cursor und Offset nicht mischen: das veraltete `skip` entfällt
+        skip = 0
+
+    if source_id:
+        query = query.filter(ScrapeLog.source_id == source_id)
+
+    if status:
+        query = query.filter(ScrapeLog.status == status)
+
+    query = query.order_by(ScrapeLog.started_at.desc(), ScrapeLog.id.desc())
+    logs = [
+        ScrapeLogResponse.model_construct(**row._mapping)
+        for row in query.offset(skip).limit(limit).all()
+    ]
+    set_next_cursor(response, logs, limit, lambda log: (log.started_at, log.id))
+    return logs
+
+
+@router.get("/count")
+def count_scrape_logs(
     source_id: Optional[int] = None,
     status: Optional[str] = None,
     db: Session = Depends(get_db),
 ):
-    """Liste aller Scrape Logs."""
-    query = db.query(ScrapeLog)
+    """Anzahl der Scrape Logs."""
+    query = db.query(func.count(ScrapeLog.id))
 
     if source_id:
         query = query.filter(ScrapeLog.source_id == source_id)
@@ -31,5 +71,4 @@ def list_scrape_logs(
     if status:
         query = query.filter(ScrapeLog.status == status)
 
-    query = query.order_by(ScrapeLog.started_at.desc())
-    return query.offset(skip).limit(limit).all()
\ No newline at end of file
+    return {"count": query.scalar()}
@@ -2,128 +2,162 @@
 API Endpoints für Scraper-Steuerung.
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from typing import List
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Response
+from sqlalchemy import case, func
 from sqlalchemy.orm import Session
 
-from src.models import Source, Event, Location, LocationStatus
-from src.scrapers import MulfingenScraper, DoerzbachScraper, IngelfingenScraper, KuenzelsauScraper, ForchtenbergScraper, BretzfeldScraper, KrautheimScraper, KupferzellScraper, NeuensteinScraper, NiedernhallScraper, OehringenScraper, PfedelbachScraper, SchoentralScraper, WaldenburgScraper, WeissbachScraper, ZweiflingenScraper
-from src.scrapers import BlaufeldenScraper, BraunsbachScraper, CrailsheimScraper, GaildorfScraper, GerabronnScraper, LangenburgScraper, MainhardtScraper, MichelfeldScraper, SchrozbergScraper, SchwaebischHallScraper, UntermuenkheimScraper
-from src.scrapers import BadMergentheimScraper, BoxbergScraper, CrelingenScraper, IgersheimScraper, NiederstettenScraper, WeikersheimScraper
+from src.cli import SCRAPER_REGISTRY, load_scraper
+from src.config import get_settings
+from src.models import Source, Event, Location, LocationStatus, get_session
+from .. import jobs
+from ..cache import cached, invalidate
 from ..dependencies import get_db
-from ..schemas import ScrapeRequest, ScrapeResponse, StatsResponse
+from ..etag import data_version
+from ..schemas import JobResponse, ScrapeRequest, ScrapeResponse, StatsResponse
 
 router = APIRouter()
 
-# Registry der verfügbaren Scraper
-SCRAPER_REGISTRY = {
-    # Hohenlohekreis
-    "mulfingen": MulfingenScraper,
-    "doerzbach": DoerzbachScraper,
-    "ingelfingen": IngelfingenScraper,
-    "kuenzelsau": KuenzelsauScraper,
-    "forchtenberg": ForchtenbergScraper,
-    "bretzfeld": BretzfeldScraper,
-    "krautheim": KrautheimScraper,
-    "kupferzell": KupferzellScraper,
-    "neuenstein": NeuensteinScraper,
-    "niedernhall": NiedernhallScraper,
-    "oehringen": OehringenScraper,
-    "pfedelbach": PfedelbachScraper,
-    "schoental": SchoentralScraper,
-    "waldenburg": WaldenburgScraper,
-    "weissbach": WeissbachScraper,
-    "zweiflingen": ZweiflingenScraper,
-    # Schwäbisch Hall
-    "blaufelden": BlaufeldenScraper,
-    "braunsbach": BraunsbachScraper,
-    "crailsheim": CrailsheimScraper,
-    "gaildorf": GaildorfScraper,
-    "gerabronn": GerabronnScraper,
-    "langenburg": LangenburgScraper,
-    "mainhardt": MainhardtScraper,
-    "michelfeld": MichelfeldScraper,
-    "schwaebisch_hall": SchwaebischHallScraper,
-    "schrozberg": SchrozbergScraper,
-    "untermuenkheim": UntermuenkheimScraper,
-    # Main-Tauber-Kreis
-    "bad_mergentheim": BadMergentheimScraper,
-    "boxberg": BoxbergScraper,
-    "creglingen": CrelingenScraper,
-    "igersheim": IgersheimScraper,
-    "niederstetten": NiederstettenScraper,
-    "weikersheim": WeikersheimScraper,
-}
+# Einmal beim Import berechnet - die Registry ändert sich zur Laufzeit nicht
+AVAILABLE_SCRAPERS = tuple(SCRAPER_REGISTRY)
+_AVAILABLE_PAYLOAD = {"scrapers": list(AVAILABLE_SCRAPERS)}
+_AVAILABLE_MSG = f"Verfügbar: {list(AVAILABLE_SCRAPERS)}"
 
 
 @router.get("/available")
 def list_available_scrapers():
     """Liste aller verfügbaren Scraper."""
-    return {
-        "scrapers": list(SCRAPER_REGISTRY.keys()),
-    }
+    return _AVAILABLE_PAYLOAD
 
 
-@router.post("/run", response_model=ScrapeResponse)
-def run_scraper(request: ScrapeRequest, db: Session = Depends(get_db)):
-    """Scraper manuell ausführen."""
+def _run_one(spec: str) -> dict:
+    """Führt einen Scraper mit eigener DB-Session aus (eine Session pro Thread)."""
+    scraper_class = load_scraper(spec)
+    session = get_session()
+    try:
+        return scraper_class(session).run()
+    finally:
+        session.close()
+
+
+def _scrape_one(source_name: str) -> dict:
+    """Job: einen Scraper ausführen."""
+    result = _run_one(SCRAPER_REGISTRY[source_name])
+    invalidate("events", "locations", "stats")
+    return result
+
+
+def _scrape_all() -> dict:
+    """Job: alle Scraper parallel ausführen (begrenzt durch SCRAPE_CONCURRENCY)."""
+    with ThreadPoolExecutor(max_workers=get_settings().scrape_concurrency) as executor:
+        futures = {
+            name: executor.submit(_run_one, spec)
+            for name, spec in SCRAPER_REGISTRY.items()
+        }
+
+    results = []
+    for name, future in futures.items():
+        error = future.exception()
+        if error is not None:
+            results.append({"source": name, "status": "error", "error": str(error)})
+        else:
+            results.append(future.result())
+
+    invalidate("events", "locations", "stats")
+    return {"results": results}
+
+
+def _set_job_location(response: Response, job_id: str) -> None:
+    """Location-Header der 202-Antwort auf den Job-Status setzen."""
+    response.headers["Location"] = f"/api/scraper/jobs/{job_id}"
+
+
+@router.post("/run", response_model=ScrapeResponse, status_code=202)
+def run_scraper(request: ScrapeRequest, response: Response):
+    """Scraper im Hintergrund starten; Ergebnis über /jobs/{job_id}."""
     source_name = request.source_name.lower()
 
     if source_name not in SCRAPER_REGISTRY:
         raise HTTPException(
             status_code=400,
-            detail=f"Unbekannter Scraper: {source_name}. Verfügbar: {list(SCRAPER_REGISTRY.keys())}",
+            detail=f"Unbekannter Scraper: {source_name}. {_AVAILABLE_MSG}",
         )
 
-    scraper_class = SCRAPER_REGISTRY[source_name]
-    scraper = scraper_class(db)
+    job_id = jobs.submit(source_name, _scrape_one, source_name)
+    _set_job_location(response, job_id)
 
-    result = scraper.run()
+    return ScrapeResponse(status="queued", source=source_name, job_id=job_id)
 
-    return ScrapeResponse(**result)
 
+@router.post("/run-all", status_code=202)
+def run_all_scrapers(response: Response):
+    """
+    Alle Scraper im Hintergrund starten; Ergebnis über /jobs/{job_id}.
 
-@router.post("/run-all")
-def run_all_scrapers(db: Session = Depends(get_db)):
-    """Alle aktiven Scraper ausführen."""
-    results = []
+    Läuft schon ein Gesamtlauf, kommt dessen Job-ID zurück - sonst liefen
+    zwei eigene Scraper-Pools parallel.
+    """
+    job_id = jobs.submit("all", _scrape_all)
+    _set_job_location(response, job_id)
 
-    for name, scraper_class in SCRAPER_REGISTRY.items():
-        scraper = scraper_class(db)
-        result = scraper.run()
-        results.append(result)
+    return {"status": "queued", "job_id": job_id}
 
-    return {"results": results}
+
+@router.get("/jobs/{job_id}", response_model=JobResponse)
+def get_job(job_id: str):
+    """Status und (nach Abschluss) Ergebnis eines Scraper-Jobs."""
+    job = jobs.get_job(job_id)
+
+    if not job:
+        raise HTTPException(status_code=404, detail="Job nicht gefunden")
+
+    return job
 
 
 @router.get("/stats", response_model=StatsResponse)
 def get_stats(db: Session = Depends(get_db)):
     """Gesamtstatistiken."""
-    total_events = db.query(Event).filter(Event.deleted_at == None).count()
-    total_sources = db.query(Source).count()
-    total_locations = db.query(Location).count()
-    pending_locations = (
-        db.query(Location)
-        .filter(Location.status == LocationStatus.PENDING.value)
-        .count()
+    # Der Datenstand gehört zum Cache-Schlüssel (Invalidierung ist pro Worker)
+    version = data_version(
+        db,
+        func.max(Event.updated_at), func.max(Source.updated_at), func.max(Location.updated_at),
     )
-
-    # Events pro Source
-    sources = db.query(Source).all()
-    events_by_source = {}
-    for source in sources:
-        count = (
-            db.query(Event)
-            .filter(Event.source_id == source.id, Event.deleted_at == None)
-            .count()
+    return _stats(version=version, db=db)
+
+
+@cached(ttl=300, key_prefix="stats")
+def _stats(*, version: tuple, db: Session) -> StatsResponse:
+    """Gesamtzahlen zum Datenstand `version` (nur Teil des Cache-Schlüssels)."""
+    # Alle Gesamtzahlen in einem Statement (skalare Subqueries)
+    totals = db.query(
+        db.query(func.count(Event.id))
+        .filter(Event.deleted_at == None)
+        .scalar_subquery()
+        .label("total_events"),
+        db.query(func.count(Source.id)).scalar_subquery().label("total_sources"),
+        db.query(func.count(Location.id)).scalar_subquery().label("total_locations"),
+        db.query(
+            func.count(case((Location.status == LocationStatus.PENDING.value, 1)))
         )
-        events_by_source[source.name] = count
+        .scalar_subquery()
+        .label("pending_locations"),
+    ).one()
+
+    # Events pro Source (ein GROUP BY statt einer Query pro Source)
+    rows = (
+        db.query(Source.name, func.count(Event.id))
+        .outerjoin(Event, (Event.source_id == Source.id) & (Event.deleted_at == None))
+        .group_by(Source.id, Source.name)
+        .all()
+    )
+    events_by_source = dict(rows)
 
     return StatsResponse(
-        total_events=total_events,
-        total_sources=total_sources,
-        total_locations=total_locations,
-        pending_locations=pending_locations,
+        total_events=totals.total_events,
+        total_sources=totals.total_sources,
+        total_locations=totals.total_locations,
+        pending_locations=totals.pending_locations,
         events_by_source=events_by_source,
     )
@@ -5,6 +5,7 @@ API Endpoints für Sources.
 from typing import List
 
 from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy import func, update
 from sqlalchemy.orm import Session
 
 from src.models import Source, Event, ScrapeLog
@@ -96,16 +97,21 @@ def get_source_logs(
 
 @router.post("/{source_id}/toggle")
 def toggle_source(source_id: int, db: Session = Depends(get_db)):
-    """Source aktivieren/deaktivieren."""
-    source = db.query(Source).filter(Source.id == source_id).first()
-
-    if not source:
+    """Source aktivieren/deaktivieren (atomar per UPDATE ... RETURNING)."""
+    is_active = db.execute(
+        update(Source)
+        .where(Source.id == source_id)
+        # NULL gilt als inaktiv (wie zuvor `not source.is_active`)
+        .values(is_active=~func.coalesce(Source.is_active, False))
+        .returning(Source.is_active)
+    ).scalar_one_or_none()
+
+    if is_active is None:
         raise HTTPException(status_code=404, detail="Source nicht gefunden")
 
-    source.is_active = not source.is_active
     db.commit()
 
     return {
         "source_id": source_id,
-        "is_active": source.is_active,
+        "is_active": is_active,
     }
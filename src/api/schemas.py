@@ -5,7 +5,7 @@ Pydantic Schemas für die API.
 from datetime import datetime, date, time
 from decimal import Decimal
 from typing import Optional, List
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, field_validator
 
 
 # === Location Schemas ===
@@ -147,12 +147,55 @@ class ScrapeRequest(BaseModel):
 class ScrapeResponse(BaseModel):
     status: str
     source: str
+    job_id: Optional[str] = None
     events_found: Optional[int] = None
     events_new: Optional[int] = None
     events_updated: Optional[int] = None
     error: Optional[str] = None
 
 
+class JobResponse(BaseModel):
+    id: str
+    name: str
+    status: str  # queued, running, finished, failed
+    created_at: datetime
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    result: Optional[dict] = None
+    error: Optional[str] = None
+
+
+# === Formular-Schemas (HTML-Views) ===
+
+class _FormModel(BaseModel):
+    """Leere Formularfelder ("") werden zu None."""
+
+    @field_validator("*", mode="before")
+    @classmethod
+    def _empty_to_none(cls, value):
+        return None if value == "" else value
+
+
+class EventForm(_FormModel):
+    title: str
+    event_date: date
+    event_time: Optional[time] = None
+    url: Optional[str] = None
+    raw_location: Optional[str] = None
+    location_id: Optional[int] = None
+
+
+class LocationForm(_FormModel):
+    display_name: Optional[str] = None
+    street: Optional[str] = None
+    house_number: Optional[str] = None
+    postal_code: Optional[str] = None
+    city: Optional[str] = None
+    latitude: Optional[Decimal] = None
+    longitude: Optional[Decimal] = None
+    status: str = "pending"
+
+
 # === Stats ===
 
 class StatsResponse(BaseModel):
@@ -2,34 +2,158 @@
 HTML Views für Browser-Ansicht.
 """
 
+import hashlib
+from datetime import date, datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Annotated, Callable, List, Optional, Tuple
+from urllib.parse import urlencode
 
-from fastapi import APIRouter, Depends, Request, Form
+from fastapi import APIRouter, Depends, Request, Response, Form
 from fastapi.responses import HTMLResponse, RedirectResponse
 from fastapi.templating import Jinja2Templates
-from sqlalchemy.orm import Session, joinedload
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader, select_autoescape
+from sqlalchemy import func, inspect, select, tuple_, update
+from sqlalchemy.orm import Query, Session, joinedload
 
+from src.cli import SCRAPER_REGISTRY
+from src.config import get_settings
 from src.models import Event, Source, Location, LocationStatus, ScrapeLog
-from ..dependencies import get_db
-from ..routers.scraper import SCRAPER_REGISTRY
+from ..cache import cached, invalidate
+from ..dependencies import get_db, strict_loads
+from ..etag import aggregate_etag, data_version, not_modified, not_modified_response
+from ..pagination import decode_cursor, encode_cursor
+from ..schemas import EventForm, LocationForm
 
 router = APIRouter()
 
 templates_path = Path(__file__).parent.parent / "templates"
-templates = Jinja2Templates(directory=str(templates_path))
+
+# Eine Environment für alle Views: kompilierte Templates bleiben im Speicher,
+# der Bytecode-Cache überlebt Neustarts, ohne auto_reload entfällt der stat().
+_jinja_env = Environment(
+    loader=FileSystemLoader(str(templates_path)),
+    autoescape=select_autoescape(["html"]),
+    auto_reload=get_settings().templates_auto_reload,
+    bytecode_cache=FileSystemBytecodeCache(),
+    cache_size=400,
+)
+templates = Jinja2Templates(env=_jinja_env)
+
+
+def precompile_templates() -> None:
+    """Alle Templates einmal laden, damit der erste Request nicht kompiliert."""
+    for name in _jinja_env.list_templates(extensions=["html"]):
+        _jinja_env.get_template(name)
+
+
+# Klassenname -> Registry-Key (für die Start-Buttons der Sources-Seite)
+CLASS_TO_KEY = {spec.split(":")[1]: key for key, spec in SCRAPER_REGISTRY.items()}
+
+# Obergrenze für per_page auf der Events-Seite
+MAX_PER_PAGE = 200
+
+# Badges/Filter-Counts zählen höchstens bis hierhin (Anzeige dann als "1000+")
+COUNT_CAP = 1000
+
+
+def _capped_count(query: Query, cap: int = COUNT_CAP) -> int:
+    """COUNT(*) über höchstens `cap` Zeilen - der Scan bricht danach ab."""
+    entity = query.column_descriptions[0]["entity"]
+    capped = query.with_entities(*inspect(entity).primary_key).order_by(None).limit(cap).subquery()
+    return query.session.query(func.count()).select_from(capped).scalar()
+
+
+def _format_count(value: int) -> str:
+    """Jinja-Filter: gekappte Counts als "1000+" anzeigen."""
+    return f"{value}+" if value >= COUNT_CAP else str(value)
+
+
+_jinja_env.filters["capped"] = _format_count
+
+# Dashboard und Sources ändern sich selten: Browser dürfen kurz cachen
+PAGE_CACHE_CONTROL = "private, max-age=30, stale-while-revalidate=60"
+
+
+def _compute_page_version() -> str:
+    """Hash über alle Templates und dieses Modul (die View-Logik)."""
+    digest = hashlib.md5()
+    for path in sorted(templates_path.rglob("*.html")) + [Path(__file__)]:
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+@lru_cache(maxsize=1)
+def _cached_page_version() -> str:
+    return _compute_page_version()
+
+
+def _page_version() -> str:
+    """
+    Salt für die Seiten-ETags: Nach einem Deploy mit geänderten Templates
+    liefert der Browser sonst weiter das alte HTML per 304 aus.
+    """
+    if _jinja_env.auto_reload:
+        # Development: Template-Änderungen ohne Neustart berücksichtigen
+        return _compute_page_version()
+    return _cached_page_version()
+
+
+def _cacheable(response: Response, etag: str) -> Response:
+    """ETag und Cache-Control an eine Seite (oder 304) hängen."""
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = PAGE_CACHE_CONTROL
+    return response
+
+
+def _keyset_page(
+    query: Query,
+    per_page: int,
+    key: Callable[[object], Tuple],
+) -> Tuple[List, Optional[str]]:
+    """
+    Eine Seite per Keyset laden.
+
+    Es wird eine Zeile mehr geholt, um ohne COUNT(*) zu erkennen, ob es
+    eine Folgeseite gibt. Liefert die Zeilen und den Cursor der Folgeseite.
+    """
+    rows = query.limit(per_page + 1).all()
+    if len(rows) > per_page:
+        return rows[:per_page], encode_cursor(*key(rows[per_page - 1]))
+    return rows, None
+
+
+def _query_string(params: dict) -> str:
+    """Query-String aus den Filtern, leere Werte werden weggelassen."""
+    return "?" + urlencode({k: v for k, v in params.items() if v not in (None, "")})
+
+
+def _page_urls(params: dict, next_cursor: Optional[str], page: int) -> dict:
+    """Links auf die erste und die nächste Seite."""
+    next_url = None
+    if next_cursor:
+        next_url = _query_string({**params, "after": next_cursor, "page": page + 1})
+    return {"first_url": _query_string(params), "next_url": next_url}
 
 
 @router.get("/", response_class=HTMLResponse)
 def index(request: Request, db: Session = Depends(get_db)):
     """Dashboard / Startseite."""
+    etag = aggregate_etag(
+        db,
+        func.max(Event.updated_at), func.count(Event.id),
+        func.max(Source.updated_at), func.max(Source.last_scraped_at), func.count(Source.id),
+        func.max(Location.updated_at), func.count(Location.id),
+        salt=_page_version(),
+    )
+    if not_modified(request, etag):
+        return _cacheable(not_modified_response(etag), etag)
+
     # Stats
     total_events = db.query(Event).filter(Event.deleted_at == None).count()
     total_sources = db.query(Source).count()
-    pending_locations = (
-        db.query(Location)
-        .filter(Location.status == LocationStatus.PENDING.value)
-        .count()
+    pending_locations = _capped_count(
+        db.query(Location).filter(Location.status == LocationStatus.PENDING.value)
     )
 
     # Recent events
@@ -44,7 +168,7 @@ def index(request: Request, db: Session = Depends(get_db)):
     # Sources
     sources = db.query(Source).all()
 
-    return templates.TemplateResponse(
+    response = templates.TemplateResponse(
         "index.html",
         {
             "request": request,
@@ -55,6 +179,7 @@ def index(request: Request, db: Session = Depends(get_db)):
             "sources": sources,
         },
     )
+    return _cacheable(response, etag)
 
 
 @router.get("/events", response_class=HTMLResponse)
@@ -62,50 +187,52 @@ def events_page(
     request: Request,
     page: int = 1,
     per_page: int = 50,
+    after: Optional[str] = None,
     source_id: Optional[str] = None,
     search: Optional[str] = None,
     location_filter: Optional[str] = None,
     db: Session = Depends(get_db),
 ):
-    """Events-Liste."""
-    per_page = min(per_page, 200)  # Max 200
-    offset = (page - 1) * per_page
+    """Events-Liste (Keyset-Pagination über `after`, `page` dient nur der Anzeige)."""
+    per_page = min(per_page, MAX_PER_PAGE)
 
     # source_id von String zu Int konvertieren (leerer String = None)
     source_id_int = int(source_id) if source_id and source_id.isdigit() else None
 
     query = db.query(Event).options(
-        joinedload(Event.source), joinedload(Event.location)
+        joinedload(Event.source), joinedload(Event.location), *strict_loads()
     ).filter(Event.deleted_at == None)
 
     if source_id_int:
         query = query.filter(Event.source_id == source_id_int)
 
     if search:
-        query = query.filter(Event.title.ilike(f"%{search}%"))
+        query = query.filter(func.lower(Event.title).like(f"%{search.lower()}%"))
 
     if location_filter == "missing":
         query = query.filter(Event.location_id == None)
     elif location_filter == "assigned":
         query = query.filter(Event.location_id != None)
 
-    total = query.count()
-    events = query.order_by(Event.event_date.asc()).offset(offset).limit(per_page).all()
+    if after:
+        after_date, after_id = decode_cursor(after, date.fromisoformat, int)
+        query = query.filter(tuple_(Event.event_date, Event.id) > (after_date, after_id))
 
-    sources = db.query(Source).all()
+    query = query.order_by(Event.event_date.asc(), Event.id.asc())
+    events, next_cursor = _keyset_page(query, per_page, lambda e: (e.event_date, e.id))
 
-    total_pages = (total + per_page - 1) // per_page
+    sources = db.query(Source).all()
 
-    # Counts für Location-Filter
-    base_query = db.query(Event).filter(Event.deleted_at == None)
-    if source_id_int:
-        base_query = base_query.filter(Event.source_id == source_id_int)
-    if search:
-        base_query = base_query.filter(Event.title.ilike(f"%{search}%"))
+    counts = _event_filter_counts(
+        source_id=source_id_int, search=search or None,
+        version=data_version(db, func.max(Event.updated_at)), db=db,
+    )
 
-    all_count = base_query.count()
-    missing_count = base_query.filter(Event.location_id == None).count()
-    assigned_count = base_query.filter(Event.location_id != None).count()
+    # Gesamtzahl ergibt sich aus den Filter-Counts, kein eigenes COUNT(*) nötig
+    total = {
+        "missing": counts["missing_count"],
+        "assigned": counts["assigned_count"],
+    }.get(location_filter, counts["all_count"])
 
     return templates.TemplateResponse(
         "events.html",
@@ -114,19 +241,56 @@ def events_page(
             "events": events,
             "sources": sources,
             "current_page": page,
-            "total_pages": total_pages,
+            **_page_urls(
+                {
+                    "per_page": per_page,
+                    "source_id": source_id_int,
+                    "search": search,
+                    "location_filter": location_filter,
+                },
+                next_cursor,
+                page,
+            ),
             "total": total,
             "source_id": source_id_int,
             "search": search or "",
             "per_page": per_page,
             "location_filter": location_filter or "",
-            "all_count": all_count,
-            "missing_count": missing_count,
-            "assigned_count": assigned_count,
+            **counts,
         },
     )
 
 
+@cached(ttl=60, key_prefix="events")
+def _event_filter_counts(
+    *, source_id: Optional[int], search: Optional[str], version: tuple, db: Session
+) -> dict:
+    """
+    Counts für die Location-Filter der Events-Seite.
+
+    Gecacht pro Filterkombination (source_id, search) und Datenstand `version`
+    (MAX(updated_at) der Events), damit Blättern keine neuen COUNT-Scans
+    auslöst und Änderungen anderer Worker oder des Schedulers sichtbar werden.
+    """
+    filters = [Event.deleted_at == None]
+    if source_id:
+        filters.append(Event.source_id == source_id)
+    if search:
+        filters.append(func.lower(Event.title).like(f"%{search.lower()}%"))
+
+    # Alle drei Counts in einem Scan per count(*) FILTER (WHERE ...)
+    row = db.execute(
+        select(
+            func.count().label("all_count"),
+            func.count().filter(Event.location_id == None).label("missing_count"),
+            func.count().filter(Event.location_id != None).label("assigned_count"),
+        )
+        .select_from(Event)
+        .where(*filters)
+    ).one()
+    return dict(row._mapping)
+
+
 @router.get("/events/{event_id}/edit", response_class=HTMLResponse)
 def edit_event_page(
     request: Request,
@@ -136,7 +300,7 @@ def edit_event_page(
     """Event bearbeiten."""
     event = (
         db.query(Event)
-        .options(joinedload(Event.source), joinedload(Event.location))
+        .options(joinedload(Event.source), joinedload(Event.location), *strict_loads())
         .filter(Event.id == event_id)
         .first()
     )
@@ -165,31 +329,17 @@ def edit_event_page(
 @router.post("/events/{event_id}/edit")
 def save_event(
     event_id: int,
-    title: str = Form(...),
-    event_date: str = Form(...),
-    event_time: str = Form(None),
-    url: str = Form(None),
-    raw_location: str = Form(None),
-    location_id: str = Form(None),
+    form: Annotated[EventForm, Form()],
     db: Session = Depends(get_db),
 ):
-    """Event speichern."""
-    from datetime import date as date_cls, time as time_cls
-
-    event = db.query(Event).filter(Event.id == event_id).first()
+    """Event speichern (ein UPDATE, ohne das Event vorher zu laden)."""
+    result = db.execute(
+        update(Event).where(Event.id == event_id).values(**form.model_dump())
+    )
+    db.commit()
 
-    if event:
-        event.title = title
-        event.event_date = date_cls.fromisoformat(event_date)
-        event.event_time = (
-            time_cls.fromisoformat(event_time) if event_time else None
-        )
-        event.url = url or None
-        event.raw_location = raw_location or None
-        event.location_id = (
-            int(location_id) if location_id and location_id.isdigit() else None
-        )
-        db.commit()
+    if result.rowcount:
+        invalidate("events", "stats")
 
     return RedirectResponse("/events", status_code=302)
 
@@ -200,32 +350,40 @@ def locations_page(
     status: Optional[str] = None,
     search: Optional[str] = None,
     page: int = 1,
+    after: Optional[str] = None,
     db: Session = Depends(get_db),
 ):
-    """Locations-Liste."""
+    """Locations-Liste (neueste zuerst, Keyset-Pagination über `after`)."""
     per_page = 25
-    offset = (page - 1) * per_page
 
-    query = db.query(Location).options(joinedload(Location.source))
+    query = db.query(Location).options(joinedload(Location.source), *strict_loads())
 
     if status:
         query = query.filter(Location.status == status)
 
     if search:
         query = query.filter(
-            (Location.raw_name.ilike(f"%{search}%")) |
-            (Location.city.ilike(f"%{search}%"))
+            (func.lower(Location.raw_name).like(f"%{search.lower()}%")) |
+            (func.lower(Location.city).like(f"%{search.lower()}%"))
         )
 
-    total = query.count()
-    locations = query.order_by(Location.created_at.desc()).offset(offset).limit(per_page).all()
+    if after:
+        after_created, after_id = decode_cursor(after, datetime.fromisoformat, int)
+        query = query.filter(tuple_(Location.created_at, Location.id) < (after_created, after_id))
 
-    total_pages = (total + per_page - 1) // per_page
+    query = query.order_by(Location.created_at.desc(), Location.id.desc())
+    locations, next_cursor = _keyset_page(query, per_page, lambda loc: (loc.created_at, loc.id))
+    filters = {"status": status, "search": search}
 
-    # Counts per status
-    pending_count = db.query(Location).filter(Location.status == "pending").count()
-    confirmed_count = db.query(Location).filter(Location.status == "confirmed").count()
-    ignored_count = db.query(Location).filter(Location.status == "ignored").count()
+    # Counts per status in einer Query
+    status_counts = dict(
+        db.query(Location.status, func.count(Location.id))
+        .group_by(Location.status)
+        .all()
+    )
+    pending_count = status_counts.get("pending", 0)
+    confirmed_count = status_counts.get("confirmed", 0)
+    ignored_count = status_counts.get("ignored", 0)
 
     return templates.TemplateResponse(
         "locations.html",
@@ -233,8 +391,9 @@ def locations_page(
             "request": request,
             "locations": locations,
             "current_page": page,
-            "total_pages": total_pages,
-            "total": total,
+            **_page_urls(filters, next_cursor, page),
+            # Gesamtzahl lädt die Seite per XHR nach (gecachter Count-Endpoint)
+            "count_url": "/api/locations/count" + _query_string(filters),
             "status": status,
             "search": search or "",
             "pending_count": pending_count,
@@ -268,29 +427,17 @@ def edit_location_page(
 @router.post("/locations/{location_id}/edit")
 def save_location(
     location_id: int,
-    display_name: str = Form(None),
-    street: str = Form(None),
-    house_number: str = Form(None),
-    postal_code: str = Form(None),
-    city: str = Form(None),
-    latitude: str = Form(None),
-    longitude: str = Form(None),
-    status: str = Form("pending"),
+    form: Annotated[LocationForm, Form()],
     db: Session = Depends(get_db),
 ):
-    """Location speichern."""
-    location = db.query(Location).filter(Location.id == location_id).first()
+    """Location speichern (ein UPDATE, ohne die Location vorher zu laden)."""
+    result = db.execute(
+        update(Location).where(Location.id == location_id).values(**form.model_dump())
+    )
+    db.commit()
 
-    if location:
-        location.display_name = display_name or None
-        location.street = street or None
-        location.house_number = house_number or None
-        location.postal_code = postal_code or None
-        location.city = city or None
-        location.latitude = float(latitude) if latitude else None
-        location.longitude = float(longitude) if longitude else None
-        location.status = status
-        db.commit()
+    if result.rowcount:
+        invalidate("locations", "stats")
 
     return RedirectResponse("/locations", status_code=302)
 
@@ -298,32 +445,42 @@ def save_location(
 @router.get("/sources", response_class=HTMLResponse)
 def sources_page(request: Request, db: Session = Depends(get_db)):
     """Sources-Liste."""
+    etag = aggregate_etag(
+        db,
+        func.max(Source.updated_at), func.max(Source.last_scraped_at), func.count(Source.id),
+        func.max(Event.updated_at), func.count(Event.id),
+        salt=_page_version(),
+    )
+    if not_modified(request, etag):
+        return _cacheable(not_modified_response(etag), etag)
+
     sources = db.query(Source).all()
 
-    # Stats für jede Source
-    source_stats = []
-    for source in sources:
-        events_count = (
-            db.query(Event)
-            .filter(Event.source_id == source.id, Event.deleted_at == None)
-            .count()
-        )
-        source_stats.append({
-            "source": source,
-            "events_count": events_count,
-        })
+    # Events pro Source in einer Query (GROUP BY statt einer Query pro Source)
+    counts = dict(
+        db.query(Event.source_id, func.count(Event.id))
+        .filter(Event.deleted_at == None)
+        .group_by(Event.source_id)
+        .all()
+    )
 
-    class_to_key = {cls.__name__: key for key, cls in SCRAPER_REGISTRY.items()}
-    for item in source_stats:
-        item["scraper_key"] = class_to_key.get(item["source"].scraper_class, "")
+    source_stats = [
+        {
+            "source": source,
+            "events_count": counts.get(source.id, 0),
+            "scraper_key": CLASS_TO_KEY.get(source.scraper_class, ""),
+        }
+        for source in sources
+    ]
 
-    return templates.TemplateResponse(
+    response = templates.TemplateResponse(
         "sources.html",
         {
             "request": request,
             "source_stats": source_stats,
         },
     )
+    return _cacheable(response, etag)
 
 
 @router.get("/scrape-logs", response_class=HTMLResponse)
@@ -332,13 +489,13 @@ def scrape_logs_page(
     status: Optional[str] = None,
     source_id: Optional[int] = None,
     page: int = 1,
+    after: Optional[str] = None,
     db: Session = Depends(get_db),
 ):
-    """Scrape Logs Übersicht."""
+    """Scrape Logs Übersicht (neueste zuerst, Keyset-Pagination über `after`)."""
     per_page = 50
-    offset = (page - 1) * per_page
 
-    query = db.query(ScrapeLog).options(joinedload(ScrapeLog.source))
+    query = db.query(ScrapeLog).options(joinedload(ScrapeLog.source), *strict_loads())
 
     if status:
         query = query.filter(ScrapeLog.status == status)
@@ -346,10 +503,13 @@ def scrape_logs_page(
     if source_id:
         query = query.filter(ScrapeLog.source_id == source_id)
 
-    total = query.count()
-    logs = query.order_by(ScrapeLog.started_at.desc()).offset(offset).limit(per_page).all()
+    if after:
+        after_started, after_id = decode_cursor(after, datetime.fromisoformat, int)
+        query = query.filter(tuple_(ScrapeLog.started_at, ScrapeLog.id) < (after_started, after_id))
 
-    total_pages = (total + per_page - 1) // per_page
+    query = query.order_by(ScrapeLog.started_at.desc(), ScrapeLog.id.desc())
+    logs, next_cursor = _keyset_page(query, per_page, lambda log: (log.started_at, log.id))
+    filters = {"status": status, "source_id": source_id}
 
     sources = db.query(Source).order_by(Source.name).all()
 
@@ -360,8 +520,8 @@ def scrape_logs_page(
             "logs": logs,
             "sources": sources,
             "current_page": page,
-            "total_pages": total_pages,
-            "total": total,
+            **_page_urls(filters, next_cursor, page),
+            "count_url": "/api/scrape-logs/count" + _query_string(filters),
             "status": status,
             "source_id": source_id,
         },
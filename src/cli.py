@@ -11,100 +11,134 @@ Usage:
 
 import argparse
 import csv
-import json
+import importlib
 import sys
+import textwrap
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timezone
 from decimal import Decimal
-from typing import Optional
+from functools import lru_cache
+from typing import Optional, TextIO
 
+import orjson
+from sqlalchemy import Integer, cast, column, func, update, values
+from sqlalchemy.orm import contains_eager
+
+from src.config import get_settings
 from src.models import get_session, Source, Location, LocationStatus
-from src.scrapers import MulfingenScraper, DoerzbachScraper, IngelfingenScraper, KuenzelsauScraper, ForchtenbergScraper, BretzfeldScraper, KrautheimScraper, KupferzellScraper, NeuensteinScraper, NiedernhallScraper, OehringenScraper, PfedelbachScraper, SchoentralScraper, WaldenburgScraper, WeissbachScraper, ZweiflingenScraper
-from src.scrapers import BlaufeldenScraper, BraunsbachScraper, CrailsheimScraper, GaildorfScraper, GerabronnScraper, LangenburgScraper, MainhardtScraper, MichelfeldScraper, SchrozbergScraper, SchwaebischHallScraper, UntermuenkheimScraper
-from src.scrapers import BadMergentheimScraper, BoxbergScraper, CrelingenScraper, IgersheimScraper, NiederstettenScraper, WeikersheimScraper
 
 
-# Registry aller verfügbaren Scraper
+# Registry aller verfügbaren Scraper ("modul:Klasse", importiert erst bei Bedarf)
 SCRAPER_REGISTRY = {
     # Hohenlohekreis
-    "mulfingen": MulfingenScraper,
-    "doerzbach": DoerzbachScraper,
-    "ingelfingen": IngelfingenScraper,
-    "kuenzelsau": KuenzelsauScraper,
-    "forchtenberg": ForchtenbergScraper,
-    "bretzfeld": BretzfeldScraper,
-    "krautheim": KrautheimScraper,
-    "kupferzell": KupferzellScraper,
-    "neuenstein": NeuensteinScraper,
-    "niedernhall": NiedernhallScraper,
-    "oehringen": OehringenScraper,
-    "pfedelbach": PfedelbachScraper,
-    "schoental": SchoentralScraper,
-    "waldenburg": WaldenburgScraper,
-    "weissbach": WeissbachScraper,
-    "zweiflingen": ZweiflingenScraper,
+    "mulfingen": "src.scrapers.baden_wuerttemberg.hohenlohekreis.mulfingen:MulfingenScraper",
+    "doerzbach": "src.scrapers.baden_wuerttemberg.hohenlohekreis.doerzbach:DoerzbachScraper",
+    "ingelfingen": "src.scrapers.baden_wuerttemberg.hohenlohekreis.ingelfingen:IngelfingenScraper",
+    "kuenzelsau": "src.scrapers.baden_wuerttemberg.hohenlohekreis.kuenzelsau:KuenzelsauScraper",
+    "forchtenberg": "src.scrapers.baden_wuerttemberg.hohenlohekreis.forchtenberg:ForchtenbergScraper",
+    "bretzfeld": "src.scrapers.baden_wuerttemberg.hohenlohekreis.bretzfeld:BretzfeldScraper",
+    "krautheim": "src.scrapers.baden_wuerttemberg.hohenlohekreis.krautheim:KrautheimScraper",
+    "kupferzell": "src.scrapers.baden_wuerttemberg.hohenlohekreis.kupferzell:KupferzellScraper",
+    "neuenstein": "src.scrapers.baden_wuerttemberg.hohenlohekreis.neuenstein:NeuensteinScraper",
+    "niedernhall": "src.scrapers.baden_wuerttemberg.hohenlohekreis.niedernhall:NiedernhallScraper",
+    "oehringen": "src.scrapers.baden_wuerttemberg.hohenlohekreis.oehringen:OehringenScraper",
+    "pfedelbach": "src.scrapers.baden_wuerttemberg.hohenlohekreis.pfedelbach:PfedelbachScraper",
+    "schoental": "src.scrapers.baden_wuerttemberg.hohenlohekreis.schoental:SchoentralScraper",
+    "waldenburg": "src.scrapers.baden_wuerttemberg.hohenlohekreis.waldenburg:WaldenburgScraper",
+    "weissbach": "src.scrapers.baden_wuerttemberg.hohenlohekreis.weissbach:WeissbachScraper",
+    "zweiflingen": "src.scrapers.baden_wuerttemberg.hohenlohekreis.zweiflingen:ZweiflingenScraper",
     # Schwäbisch Hall
-    "blaufelden": BlaufeldenScraper,
-    "braunsbach": BraunsbachScraper,
-    "crailsheim": CrailsheimScraper,
-    "gaildorf": GaildorfScraper,
-    "gerabronn": GerabronnScraper,
-    "langenburg": LangenburgScraper,
-    "mainhardt": MainhardtScraper,
-    "michelfeld": MichelfeldScraper,
-    "schwaebisch_hall": SchwaebischHallScraper,
-    "schrozberg": SchrozbergScraper,
-    "untermuenkheim": UntermuenkheimScraper,
+    "blaufelden": "src.scrapers.baden_wuerttemberg.schwaebisch_hall.blaufelden:BlaufeldenScraper",
+    "braunsbach": "src.scrapers.baden_wuerttemberg.schwaebisch_hall.braunsbach:BraunsbachScraper",
+    "crailsheim": "src.scrapers.baden_wuerttemberg.schwaebisch_hall.crailsheim:CrailsheimScraper",
+    "gaildorf": "src.scrapers.baden_wuerttemberg.schwaebisch_hall.gaildorf:GaildorfScraper",
+    "gerabronn": "src.scrapers.baden_wuerttemberg.schwaebisch_hall.gerabronn:GerabronnScraper",
+    "langenburg": "src.scrapers.baden_wuerttemberg.schwaebisch_hall.langenburg:LangenburgScraper",
+    "mainhardt": "src.scrapers.baden_wuerttemberg.schwaebisch_hall.mainhardt:MainhardtScraper",
+    "michelfeld": "src.scrapers.baden_wuerttemberg.schwaebisch_hall.michelfeld:MichelfeldScraper",
+    "schwaebisch_hall": "src.scrapers.baden_wuerttemberg.schwaebisch_hall.schwaebisch_hall:SchwaebischHallScraper",
+    "schrozberg": "src.scrapers.baden_wuerttemberg.schwaebisch_hall.schrozberg:SchrozbergScraper",
+    "untermuenkheim": "src.scrapers.baden_wuerttemberg.schwaebisch_hall.untermuenkheim:UntermuenkheimScraper",
     # Main-Tauber-Kreis
-    "bad_mergentheim": BadMergentheimScraper,
-    "boxberg": BoxbergScraper,
-    "creglingen": CrelingenScraper,
-    "igersheim": IgersheimScraper,
-    "niederstetten": NiederstettenScraper,
-    "weikersheim": WeikersheimScraper,
+    "bad_mergentheim": "src.scrapers.baden_wuerttemberg.main_tauber_kreis.bad_mergentheim:BadMergentheimScraper",
+    "boxberg": "src.scrapers.baden_wuerttemberg.main_tauber_kreis.boxberg:BoxbergScraper",
+    "creglingen": "src.scrapers.baden_wuerttemberg.main_tauber_kreis.creglingen:CrelingenScraper",
+    "igersheim": "src.scrapers.baden_wuerttemberg.main_tauber_kreis.igersheim:IgersheimScraper",
+    "niederstetten": "src.scrapers.baden_wuerttemberg.main_tauber_kreis.niederstetten:NiederstettenScraper",
+    "weikersheim": "src.scrapers.baden_wuerttemberg.main_tauber_kreis.weikersheim:WeikersheimScraper",
 }
 
 
-def cmd_scrape(args):
-    """Führt einen Scrape-Vorgang durch."""
+@lru_cache(maxsize=None)
+def load_scraper(spec: str):
+    """Scraper-Klasse aus "modul:Klasse" importieren."""
+    module_name, class_name = spec.split(":")
+    return getattr(importlib.import_module(module_name), class_name)
+
+
+def _run_scraper(scraper_class, debug: bool) -> dict:
+    """Führt einen Scraper mit eigener DB-Session aus (eine Session pro Thread)."""
     session = get_session()
+    try:
+        return scraper_class(session).run(debug=debug)
+    finally:
+        session.close()
+
+
+def _print_scrape_result(result: dict) -> None:
+    if result["status"] == "success":
+        print(f"[OK] {result['source']}")
+        print(f"    Events gefunden: {result['events_found']}")
+        print(f"    Neue Events:     {result['events_new']}")
+        print(f"    Aktualisiert:    {result['events_updated']}")
+    else:
+        print(f"[FEHLER] {result['source']}: {result['error']}")
+
 
+def cmd_scrape(args):
+    """Führt einen Scrape-Vorgang durch."""
     if args.all:
         # Alle registrierten Scraper ausführen
         scraper_names = list(SCRAPER_REGISTRY.keys())
     else:
         scraper_names = [args.source]
 
+    known_names = []
     for name in scraper_names:
         if name not in SCRAPER_REGISTRY:
             print(f"[ERROR] Unbekannter Scraper: {name}")
             print(f"Verfügbare Scraper: {', '.join(SCRAPER_REGISTRY.keys())}")
             continue
+        known_names.append(name)
 
-        print(f"\n{'='*50}")
-        print(f"Starte Scraper: {name}")
-        print(f"{'='*50}")
-
-        scraper_class = SCRAPER_REGISTRY[name]
-        scraper = scraper_class(session)
+    debug = getattr(args, 'debug', False)
 
-        result = scraper.run(debug=getattr(args, 'debug', False))
+    # Scraper sind I/O-gebunden (verschiedene Domains) und laufen daher parallel;
+    # request_delay gilt weiterhin pro Scraper-Instanz
+    with ThreadPoolExecutor(max_workers=get_settings().scrape_concurrency) as executor:
+        futures = {
+            executor.submit(_run_scraper, load_scraper(SCRAPER_REGISTRY[name]), debug): name
+            for name in known_names
+        }
+        for future in as_completed(futures):
+            name = futures[future]
 
-        if result["status"] == "success":
-            print(f"[OK] {result['source']}")
-            print(f"    Events gefunden: {result['events_found']}")
-            print(f"    Neue Events:     {result['events_new']}")
-            print(f"    Aktualisiert:    {result['events_updated']}")
-        else:
-            print(f"[FEHLER] {result['source']}: {result['error']}")
+            print(f"\n{'='*50}")
+            print(f"Scraper: {name}")
+            print(f"{'='*50}")
 
-    session.close()
+            try:
+                _print_scrape_result(future.result())
+            except Exception as e:
+                print(f"[FEHLER] {name}: {e}")
 
 
 def cmd_locations(args):
     """Zeigt Locations an."""
     session = get_session()
 
-    query = session.query(Location)
+    # Nur die ausgegebenen Spalten laden (keine ORM-Objekte)
+    query = session.query(Location.id, Location.status, Location.raw_name, Location.city)
 
     if args.pending:
         query = query.filter(Location.status == LocationStatus.PENDING.value)
@@ -136,72 +170,126 @@ LOCATION_CSV_FIELDS = [
     "latitude", "longitude", "status"
 ]
 
+# Zeilen pro UPDATE-Statement beim Import
+IMPORT_BATCH_SIZE = 1000
+
+# Felder, die der Import überschreiben darf
+IMPORT_FIELDS = (
+    "display_name", "street", "house_number", "postal_code", "city", "country",
+    "latitude", "longitude", "status",
+)
+
+
+def _location_row(loc: Location) -> dict:
+    """Eine Location als Export-Zeile."""
+    return {
+        "id": loc.id,
+        "source_id": loc.source_id,
+        "source_name": loc.source.name if loc.source else "",
+        "raw_name": loc.raw_name,
+        "display_name": loc.display_name or "",
+        "street": loc.street or "",
+        "house_number": loc.house_number or "",
+        "postal_code": loc.postal_code or "",
+        "city": loc.city or "",
+        "country": loc.country or "Deutschland",
+        "latitude": str(loc.latitude) if loc.latitude else "",
+        "longitude": str(loc.longitude) if loc.longitude else "",
+        "status": loc.status,
+    }
+
+
+def _write_locations(locations, out: TextIO, output_format: str) -> None:
+    """Schreibt die Locations zeilenweise, ohne den Export im Speicher zu sammeln."""
+    if output_format == "json":
+        # Gleiches Format wie json.dumps(liste, indent=2), aber Objekt für Objekt
+        out.write("[")
+        separator = "\n"
+        for loc in locations:
+            row = orjson.dumps(_location_row(loc), option=orjson.OPT_INDENT_2).decode()
+            out.write(separator + textwrap.indent(row, "  "))
+            separator = ",\n"
+        out.write("\n]\n")
+    else:
+        writer = csv.DictWriter(out, fieldnames=LOCATION_CSV_FIELDS, delimiter=";")
+        writer.writeheader()
+        for loc in locations:
+            writer.writerow(_location_row(loc))
+
 
 def cmd_locations_export(args):
-    """Exportiert Locations in CSV oder JSON."""
+    """Exportiert Locations in CSV oder JSON (gestreamt)."""
     session = get_session()
 
-    query = session.query(Location).join(Source)
+    query = session.query(Location).join(Source).options(contains_eager(Location.source))
 
     if args.status:
         query = query.filter(Location.status == args.status)
 
-    locations = query.order_by(Source.name, Location.raw_name).all()
+    total = query.count()
 
-    if not locations:
+    if not total:
         print("Keine Locations zum Exportieren gefunden.")
         session.close()
         return
 
-    # Daten aufbereiten
-    data = []
-    for loc in locations:
-        row = {
-            "id": loc.id,
-            "source_id": loc.source_id,
-            "source_name": loc.source.name if loc.source else "",
-            "raw_name": loc.raw_name,
-            "display_name": loc.display_name or "",
-            "street": loc.street or "",
-            "house_number": loc.house_number or "",
-            "postal_code": loc.postal_code or "",
-            "city": loc.city or "",
-            "country": loc.country or "Deutschland",
-            "latitude": str(loc.latitude) if loc.latitude else "",
-            "longitude": str(loc.longitude) if loc.longitude else "",
-            "status": loc.status,
-        }
-        data.append(row)
+    # Serverseitiger Cursor, Locations kommen in Batches von 1000
+    locations = (
+        query.order_by(Source.name, Location.raw_name)
+        .execution_options(stream_results=True)
+        .yield_per(1000)
+    )
 
     # Format bestimmen
     output_format = args.format or "csv"
     output_file = args.output
 
-    if output_format == "json":
-        output = json.dumps(data, indent=2, ensure_ascii=False)
-    else:
-        # CSV
-        import io
-        buffer = io.StringIO()
-        writer = csv.DictWriter(buffer, fieldnames=LOCATION_CSV_FIELDS, delimiter=";")
-        writer.writeheader()
-        writer.writerows(data)
-        output = buffer.getvalue()
-
     # Ausgabe
     if output_file:
-        with open(output_file, "w", encoding="utf-8") as f:
-            f.write(output)
-        print(f"[OK] {len(data)} Locations exportiert nach: {output_file}")
+        with open(output_file, "w", encoding="utf-8", newline="") as f:
+            _write_locations(locations, f, output_format)
+        print(f"[OK] {total} Locations exportiert nach: {output_file}")
     else:
         # Ohne Dateiangabe: in Standardausgabe
         if not args.quiet:
-            print(f"# {len(data)} Locations exportiert\n")
-        print(output)
+            print(f"# {total} Locations exportiert\n")
+        _write_locations(locations, sys.stdout, output_format)
 
     session.close()
 
 
+def _merge_locations(session, changes_by_id: dict, now: datetime) -> dict:
+    """
+    Schreibt einen Batch per UPDATE ... FROM (VALUES ...) RETURNING.
+
+    Nicht gesetzte Felder kommen als NULL und lassen per COALESCE den
+    bestehenden Wert stehen. Liefert id -> raw_name der gefundenen Locations.
+    """
+    table = Location.__table__
+    rows = values(
+        column("id", Integer),
+        *(column(field, table.c[field].type) for field in IMPORT_FIELDS),
+        name="import_rows",
+    ).data([
+        (location_id, *(changes.get(field) for field in IMPORT_FIELDS))
+        for location_id, changes in changes_by_id.items()
+    ])
+
+    assignments = {
+        field: func.coalesce(cast(rows.c[field], table.c[field].type), table.c[field])
+        for field in IMPORT_FIELDS
+    }
+    assignments["updated_at"] = now
+
+    stmt = (
+        update(table)
+        .where(table.c.id == rows.c.id)
+        .values(assignments)
+        .returning(table.c.id, table.c.raw_name)
+    )
+    return dict(session.execute(stmt).all())
+
+
 def cmd_locations_import(args):
     """Importiert Locations aus CSV oder JSON."""
     session = get_session()
@@ -219,8 +307,8 @@ def cmd_locations_import(args):
     # Format erkennen
     if input_file.endswith(".json"):
         try:
-            data = json.loads(content)
-        except json.JSONDecodeError as e:
+            data = orjson.loads(content)
+        except orjson.JSONDecodeError as e:
             print(f"[FEHLER] Ungültiges JSON: {e}")
             return
     else:
@@ -240,6 +328,9 @@ def cmd_locations_import(args):
     skipped = 0
     errors = 0
 
+    # Änderungen pro ID sammeln (spätere Zeilen überschreiben frühere Werte)
+    changes_by_id = {}
+
     for row in data:
         try:
             location_id = int(row.get("id", 0))
@@ -249,63 +340,47 @@ def cmd_locations_import(args):
                 skipped += 1
                 continue
 
-            # Location finden
-            location = session.query(Location).filter(Location.id == location_id).first()
-
-            if not location:
-                print(f"  [WARN] Location ID {location_id} nicht gefunden, übersprungen")
-                skipped += 1
-                continue
-
             # Felder aktualisieren (nur wenn Wert vorhanden)
-            changed = False
-
-            if row.get("display_name"):
-                location.display_name = row["display_name"]
-                changed = True
-
-            if row.get("street"):
-                location.street = row["street"]
-                changed = True
-
-            if row.get("house_number"):
-                location.house_number = row["house_number"]
-                changed = True
-
-            if row.get("postal_code"):
-                location.postal_code = row["postal_code"]
-                changed = True
-
-            if row.get("city"):
-                location.city = row["city"]
-                changed = True
+            changes = {}
 
-            if row.get("country"):
-                location.country = row["country"]
-                changed = True
+            for field in ("display_name", "street", "house_number", "postal_code", "city", "country"):
+                if row.get(field):
+                    changes[field] = row[field]
 
             if row.get("latitude"):
-                location.latitude = Decimal(row["latitude"])
-                changed = True
+                changes["latitude"] = Decimal(row["latitude"])
 
             if row.get("longitude"):
-                location.longitude = Decimal(row["longitude"])
-                changed = True
+                changes["longitude"] = Decimal(row["longitude"])
 
             if row.get("status") and row["status"] in ["pending", "confirmed", "ignored"]:
-                location.status = row["status"]
-                changed = True
+                changes["status"] = row["status"]
 
-            if changed:
-                location.updated_at = datetime.now(timezone.utc)
-                updated += 1
-                if args.verbose:
-                    print(f"  [OK] Location {location_id}: {location.raw_name}")
+            if changes:
+                changes_by_id.setdefault(location_id, {}).update(changes)
 
         except Exception as e:
             print(f"  [FEHLER] Zeile {row.get('id', '?')}: {e}")
             errors += 1
 
+    # Merge in der DB: ein UPDATE ... FROM (VALUES ...) pro Batch, ohne vorheriges SELECT
+    now = datetime.now(timezone.utc)
+    ids = list(changes_by_id)
+
+    for i in range(0, len(ids), IMPORT_BATCH_SIZE):
+        batch = {location_id: changes_by_id[location_id] for location_id in ids[i:i + IMPORT_BATCH_SIZE]}
+        found = _merge_locations(session, batch, now)
+
+        for location_id in batch:
+            if location_id not in found:
+                print(f"  [WARN] Location ID {location_id} nicht gefunden, übersprungen")
+                skipped += 1
+                continue
+
+            updated += 1
+            if args.verbose:
+                print(f"  [OK] Location {location_id}: {found[location_id]}")
+
     session.commit()
     session.close()
 
@@ -323,18 +398,24 @@ def cmd_stats(args):
 
     from src.models import Event, ScrapeLog
 
-    sources = session.query(Source).all()
+    sources = session.query(
+        Source.id, Source.name, Source.base_url, Source.last_scraped_at
+    ).all()
+
+    # Events pro Source in einer Query
+    counts = dict(
+        session.query(Event.source_id, func.count(Event.id))
+        .filter(Event.deleted_at == None)
+        .group_by(Event.source_id)
+        .all()
+    )
 
     print(f"\n{'='*60}")
     print("SCRAPER STATISTIKEN")
     print(f"{'='*60}")
 
     for source in sources:
-        events_count = (
-            session.query(Event)
-            .filter(Event.source_id == source.id, Event.deleted_at == None)
-            .count()
-        )
+        events_count = counts.get(source.id, 0)
         print(f"\n{source.name}:")
         print(f"  URL:           {source.base_url}")
         print(f"  Events:        {events_count}")
@@ -342,7 +423,7 @@ def cmd_stats(args):
 
     # Locations
     pending_locs = (
-        session.query(Location)
+        session.query(Location.id)
         .filter(Location.status == LocationStatus.PENDING.value)
         .count()
     )
@@ -352,75 +433,95 @@ def cmd_stats(args):
     session.close()
 
 
-def main():
-    parser = argparse.ArgumentParser(description="Event Scraper CLI")
-    subparsers = parser.add_subparsers(dest="command", help="Verfügbare Befehle")
-
-    # Scrape command
-    scrape_parser = subparsers.add_parser("scrape", help="Scrape Events von Websites")
-    scrape_parser.add_argument("source", nargs="?", help="Name des Scrapers")
-    scrape_parser.add_argument(
+def _scrape_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("source", nargs="?", help="Name des Scrapers")
+    parser.add_argument(
         "--all", "-a", action="store_true", help="Alle Scraper ausführen"
     )
-    scrape_parser.add_argument(
+    parser.add_argument(
         "--debug", "-d", action="store_true", help="Debug-Ausgabe aktivieren"
     )
-    scrape_parser.set_defaults(func=cmd_scrape)
 
-    # Locations command
-    loc_parser = subparsers.add_parser("locations", help="Locations verwalten")
-    loc_parser.add_argument(
+
+def _locations_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
         "--pending", "-p", action="store_true", help="Nur pending Locations"
     )
-    loc_parser.add_argument(
+    parser.add_argument(
         "--confirmed", "-c", action="store_true", help="Nur confirmed Locations"
     )
-    loc_parser.set_defaults(func=cmd_locations)
 
-    # Locations export command
-    export_parser = subparsers.add_parser("export-locations", help="Locations exportieren")
-    export_parser.add_argument(
+
+def _export_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
         "--status", "-s", choices=["pending", "confirmed", "ignored"],
         help="Nur Locations mit diesem Status"
     )
-    export_parser.add_argument(
+    parser.add_argument(
         "--format", "-f", choices=["csv", "json"], default="csv",
         help="Ausgabeformat (default: csv)"
     )
-    export_parser.add_argument(
+    parser.add_argument(
         "--output", "-o", help="Ausgabedatei (ohne: stdout)"
     )
-    export_parser.add_argument(
+    parser.add_argument(
         "--quiet", "-q", action="store_true", help="Keine Info-Ausgabe"
     )
-    export_parser.set_defaults(func=cmd_locations_export)
 
-    # Locations import command
-    import_parser = subparsers.add_parser("import-locations", help="Locations importieren")
-    import_parser.add_argument(
+
+def _import_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
         "file", help="CSV- oder JSON-Datei zum Importieren"
     )
-    import_parser.add_argument(
+    parser.add_argument(
         "--verbose", "-v", action="store_true", help="Ausführliche Ausgabe"
     )
-    import_parser.set_defaults(func=cmd_locations_import)
 
-    # Stats command
-    stats_parser = subparsers.add_parser("stats", help="Statistiken anzeigen")
-    stats_parser.set_defaults(func=cmd_stats)
 
-    args = parser.parse_args()
+# Befehl -> (Funktion, Argument-Definition, Hilfetext). Der Parser wird nur
+# für den aufgerufenen Befehl gebaut.
+COMMANDS = {
+    "scrape": (cmd_scrape, _scrape_arguments, "Scrape Events von Websites"),
+    "locations": (cmd_locations, _locations_arguments, "Locations verwalten"),
+    "export-locations": (cmd_locations_export, _export_arguments, "Locations exportieren"),
+    "import-locations": (cmd_locations_import, _import_arguments, "Locations importieren"),
+    "stats": (cmd_stats, None, "Statistiken anzeigen"),
+}
+
 
-    if not args.command:
-        parser.print_help()
+def _print_help() -> None:
+    print("usage: python -m src.cli <befehl> [optionen]\n")
+    print("Event Scraper CLI\n")
+    print("Verfügbare Befehle:")
+    for name, (_, _, help_text) in COMMANDS.items():
+        print(f"  {name:<18} {help_text}")
+
+
+def main():
+    command = sys.argv[1] if len(sys.argv) > 1 else None
+
+    if command in ("-h", "--help"):
+        _print_help()
+        return
+
+    if command not in COMMANDS:
+        _print_help()
         sys.exit(1)
 
-    if args.command == "scrape" and not args.source and not args.all:
+    func, add_arguments, help_text = COMMANDS[command]
+    parser = argparse.ArgumentParser(prog=f"python -m src.cli {command}", description=help_text)
+    if add_arguments:
+        add_arguments(parser)
+
+    args = parser.parse_args(sys.argv[2:])
+    args.command = command
+
+    if command == "scrape" and not args.source and not args.all:
         print("Bitte gib einen Scraper-Namen an oder nutze --all")
         print(f"Verfügbare Scraper: {', '.join(SCRAPER_REGISTRY.keys())}")
         sys.exit(1)
 
-    args.func(args)
+    func(args)
 
 
 if __name__ == "__main__":
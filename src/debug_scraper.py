@@ -9,53 +9,39 @@ Usage:
 """
 
 import argparse
-import requests
+from functools import lru_cache
+from typing import Optional
+
 from bs4 import BeautifulSoup
+from selectolax.lexbor import LexborHTMLParser
 
 from src.config import get_settings
-from src.scrapers import MulfingenScraper, DoerzbachScraper, IngelfingenScraper, KuenzelsauScraper, ForchtenbergScraper, BretzfeldScraper, KrautheimScraper, KupferzellScraper, NeuensteinScraper, NiedernhallScraper, OehringenScraper, PfedelbachScraper, SchoentralScraper, WaldenburgScraper, WeissbachScraper, ZweiflingenScraper
-from src.scrapers import BlaufeldenScraper, BraunsbachScraper, CrailsheimScraper, GaildorfScraper, GerabronnScraper, LangenburgScraper, MainhardtScraper, MichelfeldScraper, SchrozbergScraper, SchwaebischHallScraper, UntermuenkheimScraper
-from src.scrapers import BadMergentheimScraper, BoxbergScraper, CrelingenScraper, IgersheimScraper, NiederstettenScraper, WeikersheimScraper
-
-
-SCRAPER_REGISTRY = {
-    # Hohenlohekreis
-    "mulfingen": MulfingenScraper,
-    "doerzbach": DoerzbachScraper,
-    "ingelfingen": IngelfingenScraper,
-    "kuenzelsau": KuenzelsauScraper,
-    "forchtenberg": ForchtenbergScraper,
-    "bretzfeld": BretzfeldScraper,
-    "krautheim": KrautheimScraper,
-    "kupferzell": KupferzellScraper,
-    "neuenstein": NeuensteinScraper,
-    "niedernhall": NiedernhallScraper,
-    "oehringen": OehringenScraper,
-    "pfedelbach": PfedelbachScraper,
-    "schoental": SchoentralScraper,
-    "waldenburg": WaldenburgScraper,
-    "weissbach": WeissbachScraper,
-    "zweiflingen": ZweiflingenScraper,
-    # Schwäbisch Hall
-    "blaufelden": BlaufeldenScraper,
-    "braunsbach": BraunsbachScraper,
-    "crailsheim": CrailsheimScraper,
-    "gaildorf": GaildorfScraper,
-    "gerabronn": GerabronnScraper,
-    "langenburg": LangenburgScraper,
-    "mainhardt": MainhardtScraper,
-    "michelfeld": MichelfeldScraper,
-    "schwaebisch_hall": SchwaebischHallScraper,
-    "schrozberg": SchrozbergScraper,
-    "untermuenkheim": UntermuenkheimScraper,
-    # Main-Tauber-Kreis
-    "bad_mergentheim": BadMergentheimScraper,
-    "boxberg": BoxbergScraper,
-    "creglingen": CrelingenScraper,
-    "igersheim": IgersheimScraper,
-    "niederstetten": NiederstettenScraper,
-    "weikersheim": WeikersheimScraper,
-}
+from src.scrapers.base import create_http_session
+from src.cli import SCRAPER_REGISTRY, load_scraper
+
+
+# Trennlinien der Ausgabe
+SEP_HEAVY = "=" * 60
+SEP_LIGHT = "─" * 60
+
+# Container, deren HTML bei --raw um einen Event-Link herum gezeigt wird
+RAW_PARENT_TAGS = {"div", "article", "section", "li", "p", "td"}
+
+
+@lru_cache(maxsize=None)
+def _link_selector(href_part: str) -> str:
+    """CSS-Selektor für Links, deren href `href_part` enthält."""
+    href_part = href_part.replace('"', "")  # darf den Attribut-Selektor nicht beenden
+    return f'a[href*="{href_part}"]'
+
+
+def _raw_parent_html(tree: LexborHTMLParser, href_part: str) -> Optional[str]:
+    """HTML des Containers um den ersten Link, dessen href `href_part` enthält."""
+    link = tree.css_first(_link_selector(href_part))
+    node = link.parent if link else None
+    while node is not None and node.tag not in RAW_PARENT_TAGS:
+        node = node.parent
+    return node.html if node is not None else None
 
 
 def main():
@@ -71,13 +57,12 @@ def main():
         print(f"Verfügbar: {', '.join(SCRAPER_REGISTRY.keys())}")
         return
 
-    scraper_class = SCRAPER_REGISTRY[args.source]
+    scraper_class = load_scraper(SCRAPER_REGISTRY[args.source])
 
     # Scraper ohne DB-Session erstellen (nur für Parsing)
     scraper = scraper_class.__new__(scraper_class)
     scraper.settings = get_settings()
-    scraper.http_session = requests.Session()
-    scraper.http_session.headers.update({"User-Agent": scraper.settings.user_agent})
+    scraper.http_session = create_http_session(scraper.settings.user_agent)
 
     # Setze Klassenattribute
     scraper.BASE_URL = scraper_class.BASE_URL
@@ -89,18 +74,19 @@ def main():
     scraper.source = None
     scraper.scrape_log = None
 
-    print(f"\n{'='*60}")
+    print(f"\n{SEP_HEAVY}")
     print(f"DEBUG: {scraper_class.SOURCE_NAME}")
     print(f"URL: {scraper_class.EVENTS_URL}")
-    print(f"{'='*60}\n")
+    print(f"{SEP_HEAVY}\n")
 
     # Seite laden
     print("Lade Seite...")
-    response = scraper.http_session.get(scraper_class.EVENTS_URL, timeout=30)
-    response.raise_for_status()
-    soup = BeautifulSoup(response.content, "lxml")
+    html = scraper.fetch_html()
+    soup = BeautifulSoup(html, "lxml")
+    # Für --raw reicht der C-Parser, die Scraper selbst brauchen den BS4-Baum
+    raw_tree = LexborHTMLParser(html) if args.raw else None
 
-    print(f"Seite geladen ({len(response.content)} bytes)\n")
+    print(f"Seite geladen ({len(html)} bytes)\n")
 
     # Events parsen
     print("Parse Events...")
@@ -123,50 +109,52 @@ def main():
         # Limit anwenden
         events = events[:args.limit]
 
+        # Künzelsau ergänzt Adresse/Koordinaten erst in parse_events()
+        if hasattr(scraper, '_add_location_details'):
+            scraper._add_location_details(events)
+
     # Events anzeigen
     for i, event in enumerate(events, 1):
-        print(f"\n{'─'*60}")
-        print(f"EVENT #{i}")
-        print(f"{'─'*60}")
-        print(f"  Title:       {event.title}")
-        print(f"  Datum:       {event.event_date}")
-        print(f"  Uhrzeit:     {event.event_time or '-'}")
-        print(f"  Location:    {event.raw_location or '-'}")
-        print(f"  URL:         {event.url}")
-        print(f"  External ID: {event.external_id}")
+        out = [f"\n{SEP_LIGHT}", f"EVENT #{i}", SEP_LIGHT]
+        out.append(f"  Title:       {event.title}")
+        out.append(f"  Datum:       {event.event_date}")
+        out.append(f"  Uhrzeit:     {event.event_time or '-'}")
+        out.append(f"  Location:    {event.raw_location or '-'}")
+        out.append(f"  URL:         {event.url}")
+        out.append(f"  External ID: {event.external_id}")
 
         # Location-Details anzeigen (falls vorhanden)
         if any([event.location_street, event.location_postal_code, event.location_city,
                 event.location_latitude, event.location_longitude]):
-            print(f"\n  Location-Details:")
+            out.append(f"\n  Location-Details:")
             if event.location_street:
-                print(f"    Straße:    {event.location_street}")
+                out.append(f"    Straße:    {event.location_street}")
             if event.location_postal_code:
-                print(f"    PLZ:       {event.location_postal_code}")
+                out.append(f"    PLZ:       {event.location_postal_code}")
             if event.location_city:
-                print(f"    Stadt:     {event.location_city}")
+                out.append(f"    Stadt:     {event.location_city}")
             if event.location_latitude and event.location_longitude:
-                print(f"    Coords:    {event.location_latitude}, {event.location_longitude}")
+                out.append(f"    Coords:    {event.location_latitude}, {event.location_longitude}")
 
         if args.raw and event.url:
-            print(f"\n  Raw HTML (Parent):")
+            out.append(f"\n  Raw HTML (Parent):")
             # Finde das Event in der Seite
-            link = soup.find("a", href=lambda h: h and event.external_id.split("_")[0] in h)
-            if link:
-                parent = link.find_parent(["div", "article", "section", "li", "p", "td"])
-                if parent:
-                    html = str(parent)[:500]
-                    for line in html.split("\n"):
-                        print(f"    {line}")
-                    if len(str(parent)) > 500:
-                        print(f"    ... ({len(str(parent))} chars total)")
-
-    print(f"\n{'='*60}")
+            html = _raw_parent_html(raw_tree, event.external_id.split("_", 1)[0])
+            if html:
+                for line in html[:500].split("\n"):
+                    out.append(f"    {line}")
+                if len(html) > 500:
+                    out.append(f"    ... ({len(html)} chars total)")
+
+        # Ein write pro Event statt eines print pro Zeile
+        print("\n".join(out))
+
+    print(f"\n{SEP_HEAVY}")
     print(f"Gesamt: {len(events)} Event(s) angezeigt")
     if not args.all:
         print(f"(Limit: {args.limit}, nur erste Seite)")
         print(f"Nutze --all für alle Seiten")
-    print(f"{'='*60}\n")
+    print(f"{SEP_HEAVY}\n")
 
 
 if __name__ == "__main__":
@@ -11,29 +11,67 @@ Usage:
 """
 
 import argparse
-import json
-import requests
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, List
+
+import orjson
 
 from src.config import get_settings
-from src.scrapers import OehringenScraper, LangenburgScraper, MichelfeldScraper, UntermuenkheimScraper
-from src.scrapers import CrelingenScraper, IgersheimScraper, BadMergentheimScraper
-from src.scrapers import SchrozbergScraper
+from src.scrapers.base import create_http_session
+from src.cli import SCRAPER_REGISTRY as ALL_SCRAPERS, load_scraper
 
 
-# Nur API-basierte Scraper (die run() überschreiben)
+# Nur API-basierte Scraper (die run() überschreiben), Import erst bei Bedarf
 SCRAPER_REGISTRY = {
-    "oehringen": OehringenScraper,
-    "langenburg": LangenburgScraper,
-    "michelfeld": MichelfeldScraper,
-    "untermuenkheim": UntermuenkheimScraper,
-    # Schwäbisch Hall
-    "schrozberg": SchrozbergScraper,
-    # Main-Tauber-Kreis
-    "creglingen": CrelingenScraper,
-    "igersheim": IgersheimScraper,
-    "bad_mergentheim": BadMergentheimScraper,
+    name: ALL_SCRAPERS[name]
+    for name in (
+        "oehringen",
+        "langenburg",
+        "michelfeld",
+        "untermuenkheim",
+        # Schwäbisch Hall
+        "schrozberg",
+        # Main-Tauber-Kreis
+        "creglingen",
+        "igersheim",
+        "bad_mergentheim",
+    )
 }
 
+# Trennlinien der Ausgabe
+SEP_HEAVY = "=" * 60
+SEP_LIGHT = "─" * 60
+
+# Parallele Requests beim Laden aller Seiten
+FETCH_CONCURRENCY = 8
+
+
+def _fetch_json(scraper, url: str) -> Any:
+    response = scraper.http_session.get(url, timeout=30)
+    response.raise_for_status()
+    return orjson.loads(response.content)
+
+
+def _fetch_all(scraper, urls: List[str]) -> List[Any]:
+    """Mehrere API-Seiten parallel laden (Reihenfolge bleibt erhalten)."""
+    with ThreadPoolExecutor(max_workers=FETCH_CONCURRENCY) as executor:
+        return list(executor.map(lambda url: _fetch_json(scraper, url), urls))
+
+
+def _fetch_heimatinfo_range(scraper, from_iso: str, to_iso: str) -> List[list]:
+    """Alle Seiten eines Heimatinfo-Zeitraums (bis zur ersten nicht vollen Seite)."""
+    pages = []
+    page_index = 0
+    while True:
+        items = _fetch_json(scraper, scraper._build_api_url(from_iso, to_iso, page_index))
+        if not items:
+            break
+        pages.append(items)
+        if len(items) < scraper.PAGE_SIZE:
+            break
+        page_index += 1
+    return pages
+
 
 def main():
     parser = argparse.ArgumentParser(description="Debug API Scraper Tool")
@@ -49,20 +87,19 @@ def main():
         print(f"Verfügbar: {', '.join(SCRAPER_REGISTRY.keys())}")
         return
 
-    scraper_class = SCRAPER_REGISTRY[args.source]
+    scraper_class = load_scraper(SCRAPER_REGISTRY[args.source])
 
     # Scraper ohne DB-Session erstellen (nur für Parsing)
     scraper = scraper_class.__new__(scraper_class)
     scraper.settings = get_settings()
-    scraper.http_session = requests.Session()
-    scraper.http_session.headers.update({"User-Agent": scraper.settings.user_agent})
+    scraper.http_session = create_http_session(scraper.settings.user_agent)
     scraper.BASE_URL = scraper_class.BASE_URL
     scraper.EVENTS_URL = scraper_class.EVENTS_URL
 
-    print(f"\n{'='*60}")
+    print(f"\n{SEP_HEAVY}")
     print(f"DEBUG API: {scraper_class.SOURCE_NAME}")
     print(f"API URL:   {scraper_class.API_URL}")
-    print(f"{'='*60}\n")
+    print(f"{SEP_HEAVY}\n")
 
     all_events = []
     all_raw_items = []
@@ -78,102 +115,88 @@ def main():
         sig = inspect.signature(scraper_class._build_api_url)
         is_cms_api = list(sig.parameters.keys()) == ['self', 'page']
 
+    seen_item_ids = set()
+
+    def collect(items):
+        nonlocal total_api_items
+        total_api_items += len(items)
+        for item in items:
+            # Duplikate per ID_KEY schon vor dem Parsen verwerfen
+            item_id = item.get(scraper.ID_KEY) if scraper.ID_KEY else None
+            if item_id:
+                if item_id in seen_item_ids:
+                    continue
+                seen_item_ids.add(item_id)
+
+            event = scraper._parse_api_event(item)
+            if event and event.external_id not in seen_ids:
+                seen_ids.add(event.external_id)
+                all_events.append(event)
+                all_raw_items.append(item)
+
     if is_cms_api:
         # CMS-API (Bad Mergentheim): Pagination via seite/seiten
-        page = args.page
-
-        while True:
-            url = scraper._build_api_url(page)
-            print(f"Lade Seite {page}: {url}")
-
-            response = scraper.http_session.get(url, timeout=30)
-            response.raise_for_status()
-            data = response.json()
-
+        first_url = scraper._build_api_url(args.page)
+        print(f"Lade Seite {args.page}: {first_url}")
+        first = _fetch_json(scraper, first_url)
+        total_pages = first.get("seiten", 1)
+
+        # Seitenzahl ist nach der ersten Seite bekannt, der Rest lädt parallel
+        pages = [(args.page, first)]
+        if args.all and total_pages > args.page:
+            rest = list(range(args.page + 1, total_pages + 1))
+            for page in rest:
+                print(f"Lade Seite {page}: {scraper._build_api_url(page)}")
+            pages += zip(rest, _fetch_all(scraper, [scraper._build_api_url(p) for p in rest]))
+
+        for page, data in pages:
             items = data.get("data", [])
-            total_pages = data.get("seiten", 1)
-            total_count = data.get("anzahl", "?")
-
-            print(f"  -> {len(items)} Items auf Seite {page} (Gesamt: {total_count}, Seiten: {total_pages})")
-
-            total_api_items += len(items)
-
-            for item in items:
-                event = scraper._parse_api_event(item)
-                if event and event.external_id not in seen_ids:
-                    seen_ids.add(event.external_id)
-                    all_events.append(event)
-                    all_raw_items.append(item)
-
-            if not args.all or page >= total_pages:
-                break
-
-            page += 1
+            print(f"  -> {len(items)} Items auf Seite {page} (Gesamt: {data.get('anzahl', '?')}, Seiten: {data.get('seiten', 1)})")
+            collect(items)
 
     elif is_heimatinfo:
-        # Heimatinfo-API: Monatsweise Abfrage, flaches JSON-Array
+        # Heimatinfo-API: Monatsweise Abfrage, flaches JSON-Array; Monate laden parallel
         month_ranges = scraper._generate_month_ranges()
         ranges_to_load = month_ranges if args.all else month_ranges[:1]
 
-        for from_iso, to_iso in ranges_to_load:
-            print(f"Lade Zeitraum: {from_iso[:10]} bis {to_iso[:10]}")
-            page_index = 0
-
-            while True:
-                url = scraper._build_api_url(from_iso, to_iso, page_index)
-                response = scraper.http_session.get(url, timeout=30)
-                response.raise_for_status()
-                items = response.json()
-
-                if not items:
-                    break
-
-                print(f"  -> Seite {page_index}: {len(items)} Items")
-                total_api_items += len(items)
-
-                for item in items:
-                    event = scraper._parse_api_event(item)
-                    if event and event.external_id not in seen_ids:
-                        seen_ids.add(event.external_id)
-                        all_events.append(event)
-                        all_raw_items.append(item)
+        with ThreadPoolExecutor(max_workers=FETCH_CONCURRENCY) as executor:
+            results = executor.map(lambda r: _fetch_heimatinfo_range(scraper, *r), ranges_to_load)
 
-                if len(items) < scraper.PAGE_SIZE:
-                    break
-                page_index += 1
+            for (from_iso, to_iso), pages in zip(ranges_to_load, results):
+                print(f"Lade Zeitraum: {from_iso[:10]} bis {to_iso[:10]}")
+                for page_index, items in enumerate(pages):
+                    print(f"  -> Seite {page_index}: {len(items)} Items")
+                    collect(items)
     else:
         # Cross-7-API: Pagination via pageNumber/hasNextPage
         page = args.page
+        pages = []
 
         while True:
             url = scraper._build_api_url(page)
             print(f"Lade Seite {page}: {url}")
+            data = _fetch_json(scraper, url)
+            pages.append((page, data))
 
-            response = scraper.http_session.get(url, timeout=30)
-            response.raise_for_status()
-            data = response.json()
-
-            items = data.get("items", [])
-            total_count = data.get("totalCount", "?")
-            total_pages = data.get("totalPages", "?")
-            has_next = data.get("hasNextPage", False)
-
-            print(f"  -> {len(items)} Items auf Seite {page} (Gesamt: {total_count}, Seiten: {total_pages})")
-
-            total_api_items += len(items)
-
-            for item in items:
-                event = scraper._parse_api_event(item)
-                if event and event.external_id not in seen_ids:
-                    seen_ids.add(event.external_id)
-                    all_events.append(event)
-                    all_raw_items.append(item)
+            total_pages = data.get("totalPages")
+            if not args.all or not data.get("hasNextPage", False):
+                break
 
-            if not args.all or not has_next:
+            if isinstance(total_pages, int):
+                # Seitenzahl bekannt: restliche Seiten parallel laden
+                rest = list(range(page + 1, total_pages + 1))
+                for p in rest:
+                    print(f"Lade Seite {p}: {scraper._build_api_url(p)}")
+                pages += zip(rest, _fetch_all(scraper, [scraper._build_api_url(p) for p in rest]))
                 break
 
             page += 1
 
+        for page, data in pages:
+            items = data.get("items", [])
+            print(f"  -> {len(items)} Items auf Seite {page} (Gesamt: {data.get('totalCount', '?')}, Seiten: {data.get('totalPages', '?')})")
+            collect(items)
+
     print(f"\nAPI Items geladen: {total_api_items}")
     print(f"Events geparst:    {len(all_events)} (nach Deduplizierung)")
 
@@ -187,45 +210,46 @@ def main():
 
     # Events anzeigen
     for i, event in enumerate(display_events):
-        print(f"\n{'─'*60}")
-        print(f"EVENT #{i + 1}")
-        print(f"{'─'*60}")
-        print(f"  Title:       {event.title}")
-        print(f"  Datum:       {event.event_date}")
-        print(f"  Uhrzeit:     {event.event_time or '-'}")
+        out = [f"\n{SEP_LIGHT}", f"EVENT #{i + 1}", SEP_LIGHT]
+        out.append(f"  Title:       {event.title}")
+        out.append(f"  Datum:       {event.event_date}")
+        out.append(f"  Uhrzeit:     {event.event_time or '-'}")
         if event.event_end_date:
-            print(f"  End-Datum:   {event.event_end_date}")
+            out.append(f"  End-Datum:   {event.event_end_date}")
         if event.event_end_time:
-            print(f"  End-Zeit:    {event.event_end_time}")
-        print(f"  Location:    {event.raw_location or '-'}")
-        print(f"  URL:         {event.url}")
-        print(f"  External ID: {event.external_id}")
+            out.append(f"  End-Zeit:    {event.event_end_time}")
+        out.append(f"  Location:    {event.raw_location or '-'}")
+        out.append(f"  URL:         {event.url}")
+        out.append(f"  External ID: {event.external_id}")
 
         # Location-Details
         if any([event.location_street, event.location_postal_code, event.location_city]):
-            print(f"\n  Location-Details:")
+            out.append(f"\n  Location-Details:")
             if event.location_street:
-                print(f"    Strasse:   {event.location_street}")
+                out.append(f"    Strasse:   {event.location_street}")
             if event.location_postal_code:
-                print(f"    PLZ:       {event.location_postal_code}")
+                out.append(f"    PLZ:       {event.location_postal_code}")
             if event.location_city:
-                print(f"    Stadt:     {event.location_city}")
+                out.append(f"    Stadt:     {event.location_city}")
 
         # Extra-Daten
         if event.extra_data:
-            print(f"\n  Extra-Daten:")
+            out.append(f"\n  Extra-Daten:")
             for key, value in event.extra_data.items():
-                print(f"    {key}: {value}")
+                out.append(f"    {key}: {value}")
 
         # Raw JSON
         if args.raw and i < len(display_raw):
-            print(f"\n  Raw JSON:")
-            raw_str = json.dumps(display_raw[i], indent=4, ensure_ascii=False)
+            out.append(f"\n  Raw JSON:")
+            raw_str = orjson.dumps(display_raw[i], option=orjson.OPT_INDENT_2).decode()
             for line in raw_str.split("\n"):
-                print(f"    {line}")
+                out.append(f"    {line}")
+
+        # Ein write pro Event statt eines print pro Zeile
+        print("\n".join(out))
 
     # Zusammenfassung
-    print(f"\n{'='*60}")
+    print(f"\n{SEP_HEAVY}")
     print(f"Gesamt: {len(display_events)} Event(s) angezeigt")
     if not args.all:
         print(f"(Limit: {args.limit}, nur Seite {args.page})")
@@ -241,7 +265,7 @@ def main():
     print(f"  Mit Location:  {with_location}")
     print(f"  Ohne Location: {without_location}")
     print(f"  Mit Uhrzeit:   {with_time}")
-    print(f"{'='*60}\n")
+    print(f"{SEP_HEAVY}\n")
 
 
 if __name__ == "__main__":
@@ -1,14 +1,16 @@
-from .base import Base, get_engine, get_session_factory, get_session
+from .base import Base, get_engine, get_session_factory, get_session, dispose_engine
 from .source import Source
 from .location import Location, LocationStatus, GeocodingStatus
 from .event import Event
 from .scrape_log import ScrapeLog, ScrapeStatus
+from .scrape_job import ScrapeJob, ACTIVE_JOB_STATUSES
 
 __all__ = [
     "Base",
     "get_engine",
     "get_session_factory",
     "get_session",
+    "dispose_engine",
     "Source",
     "Location",
     "LocationStatus",
@@ -16,4 +18,6 @@ __all__ = [
     "Event",
     "ScrapeLog",
     "ScrapeStatus",
+    "ScrapeJob",
+    "ACTIVE_JOB_STATUSES",
 ]
@@ -1,6 +1,9 @@
+from functools import lru_cache
+
 from sqlalchemy.orm import DeclarativeBase
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import QueuePool
 
 from src.config import get_settings
 
@@ -9,16 +12,37 @@ class Base(DeclarativeBase):
     pass
 
 
+@lru_cache(maxsize=1)
 def get_engine():
+    """Eine Engine (und damit ein Connection-Pool) pro Prozess."""
     settings = get_settings()
-    return create_engine(settings.database_url)
+    return create_engine(
+        settings.database_url,
+        poolclass=QueuePool,
+        pool_size=settings.db_pool_size,
+        max_overflow=settings.db_max_overflow,
+        pool_pre_ping=True,
+        pool_recycle=settings.db_pool_recycle,
+    )
 
 
+@lru_cache(maxsize=1)
 def get_session_factory():
+    """Eine sessionmaker-Instanz pro Prozess, gebunden an die gemeinsame Engine."""
     engine = get_engine()
-    return sessionmaker(bind=engine)
+    # Geladene Objekte bleiben nach commit() gültig, statt beim nächsten
+    # Attributzugriff erneut per SELECT nachgeladen zu werden.
+    return sessionmaker(bind=engine, expire_on_commit=False)
 
 
 def get_session():
     SessionFactory = get_session_factory()
     return SessionFactory()
+
+
+def dispose_engine() -> None:
+    """Pool schließen und Caches leeren (z.B. Test-Teardown, nach fork())."""
+    if get_engine.cache_info().currsize:
+        get_engine().dispose()
+    get_session_factory.cache_clear()
+    get_engine.cache_clear()
@@ -1,8 +1,9 @@
 from datetime import datetime, date, time
-from typing import Optional, TYPE_CHECKING
+from typing import Any, Dict, List, Optional, TYPE_CHECKING
 
-from sqlalchemy import String, Date, Time, DateTime, ForeignKey, UniqueConstraint
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy import String, Date, Time, DateTime, ForeignKey, Index, UniqueConstraint, func, literal_column, text
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Mapped, Session, mapped_column, relationship
 
 from .base import Base
 
@@ -10,6 +11,15 @@ if TYPE_CHECKING:
     from .source import Source
     from .location import Location
 
+# Zeilen pro INSERT ... ON CONFLICT-Statement
+UPSERT_BATCH_SIZE = 1000
+
+# Spalten, die ein erneuter Scrape bei bestehenden Events überschreibt
+UPSERT_COLUMNS = (
+    "title", "event_date", "event_time", "event_end_date", "event_end_time",
+    "url", "raw_location",
+)
+
 
 class Event(Base):
     __tablename__ = "events"
@@ -40,20 +50,26 @@ class Event(Base):
 
     # Timestamps
     created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), default=datetime.utcnow
+        DateTime(timezone=True), server_default=func.now()
     )
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), default=datetime.utcnow, onupdate=datetime.utcnow
+        DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
     )
     deleted_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True))
 
-    # Relationships
-    source: Mapped["Source"] = relationship(back_populates="events")
-    location: Mapped[Optional["Location"]] = relationship(back_populates="events")
+    # Relationships (many-to-one per JOIN, damit vergessene Loader-Optionen kein N+1 erzeugen)
+    source: Mapped["Source"] = relationship(back_populates="events", lazy="joined")
+    location: Mapped[Optional["Location"]] = relationship(back_populates="events", lazy="joined")
 
-    # Constraints
+    # Constraints und Indizes (wie in database/schema.sql)
     __table_args__ = (
         UniqueConstraint("source_id", "external_id", name="uq_source_external_id"),
+        Index("idx_events_source_date", "source_id", "event_date"),
+        Index(
+            "idx_events_source_date_live", "source_id", "event_date",
+            postgresql_where=text("deleted_at IS NULL"),
+        ),
+        Index("idx_events_updated_at", "updated_at"),
     )
 
     def __repr__(self) -> str:
@@ -62,3 +78,31 @@ class Event(Base):
     @property
     def is_deleted(self) -> bool:
         return self.deleted_at is not None
+
+    @classmethod
+    def bulk_upsert(cls, session: Session, rows: List[Dict[str, Any]]) -> Dict[str, bool]:
+        """
+        Schreibt Events per INSERT ... ON CONFLICT (source_id, external_id) DO UPDATE.
+
+        Bestehende Events werden aktualisiert und reaktiviert (deleted_at = NULL),
+        location_id nur überschrieben, wenn eine gesetzt ist. Alle Zeilen brauchen
+        dieselben Keys, external_ids müssen eindeutig sein. Liefert external_id -> True (neu) / False (aktualisiert);
+        committen muss der Aufrufer.
+        """
+        table = cls.__table__
+        inserted = {}
+
+        for start in range(0, len(rows), UPSERT_BATCH_SIZE):
+            stmt = pg_insert(table).values(rows[start:start + UPSERT_BATCH_SIZE])
+            stmt = stmt.on_conflict_do_update(
+                index_elements=["source_id", "external_id"],
+                set_={
+                    **{column: stmt.excluded[column] for column in UPSERT_COLUMNS},
+                    "location_id": func.coalesce(stmt.excluded.location_id, table.c.location_id),
+                    "deleted_at": None,
+                    "updated_at": func.now(),
+                },
+            ).returning(table.c.external_id, literal_column("xmax = 0"))
+            inserted.update(session.execute(stmt).all())
+
+        return inserted
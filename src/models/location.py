@@ -3,7 +3,7 @@ from decimal import Decimal
 from enum import Enum
 from typing import Optional, List, TYPE_CHECKING
 
-from sqlalchemy import String, DateTime, Numeric, ForeignKey, UniqueConstraint
+from sqlalchemy import String, DateTime, Numeric, ForeignKey, Index, UniqueConstraint, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from .base import Base
@@ -57,19 +57,20 @@ class Location(Base):
 
     # Timestamps
     created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), default=datetime.utcnow
+        DateTime(timezone=True), server_default=func.now()
     )
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), default=datetime.utcnow, onupdate=datetime.utcnow
+        DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
     )
 
     # Relationships
-    source: Mapped["Source"] = relationship(back_populates="locations")
+    source: Mapped["Source"] = relationship(back_populates="locations", lazy="joined")
     events: Mapped[List["Event"]] = relationship(back_populates="location")
 
-    # Constraints
+    # Constraints und Indizes (wie in database/schema.sql)
     __table_args__ = (
         UniqueConstraint("source_id", "raw_name", name="uq_source_location"),
+        Index("idx_locations_updated_at", "updated_at"),
     )
 
     def __repr__(self) -> str:
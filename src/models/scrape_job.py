@@ -0,0 +1,45 @@
+from datetime import datetime
+from typing import Any, Optional
+
+from sqlalchemy import JSON, String, Text, DateTime, Index, func, text
+from sqlalchemy.orm import Mapped, mapped_column
+
+from .base import Base
+
+# Status, in denen ein Job noch nicht abgeschlossen ist
+ACTIVE_JOB_STATUSES = ("queued", "running")
+
+
+class ScrapeJob(Base):
+    """Hintergrund-Job der API (siehe src/api/jobs.py), für alle Worker sichtbar."""
+
+    __tablename__ = "scrape_jobs"
+
+    id: Mapped[str] = mapped_column(String(32), primary_key=True)
+    name: Mapped[str] = mapped_column(String(100), nullable=False)
+
+    # Status: queued, running, finished, failed
+    status: Mapped[str] = mapped_column(String(20), nullable=False)
+
+    # Timing
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now()
+    )
+    started_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True))
+    finished_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True))
+
+    # Ergebnis bzw. Fehler
+    result: Mapped[Optional[Any]] = mapped_column(JSON)
+    error: Mapped[Optional[str]] = mapped_column(Text)
+
+    # Höchstens ein offener Job pro Name - auch über mehrere Worker hinweg
+    __table_args__ = (
+        Index(
+            "uq_scrape_jobs_active_name", "name", unique=True,
+            postgresql_where=text("status IN ('queued', 'running')"),
+            sqlite_where=text("status IN ('queued', 'running')"),
+        ),
+    )
+
+    def __repr__(self) -> str:
+        return f"<ScrapeJob(id='{self.id}', name='{self.name}', status='{self.status}')>"
@@ -2,7 +2,7 @@ from datetime import datetime
 from enum import Enum
 from typing import Optional, TYPE_CHECKING
 
-from sqlalchemy import String, Integer, Text, DateTime, ForeignKey
+from sqlalchemy import String, Integer, Text, DateTime, ForeignKey, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from .base import Base
@@ -48,11 +48,11 @@ class ScrapeLog(Base):
 
     # Timestamp
     created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), default=datetime.utcnow
+        DateTime(timezone=True), server_default=func.now()
     )
 
     # Relationships
-    source: Mapped["Source"] = relationship(back_populates="scrape_logs")
+    source: Mapped["Source"] = relationship(back_populates="scrape_logs", lazy="joined")
 
     def __repr__(self) -> str:
         return f"<ScrapeLog(id={self.id}, source_id={self.source_id}, status='{self.status}')>"
@@ -16,13 +16,25 @@ Environment:
 import os
 import signal
 import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 
 from apscheduler.schedulers.blocking import BlockingScheduler
 from apscheduler.triggers.cron import CronTrigger
 
+from src.config import get_settings
 from src.models import get_session
-from src.cli import SCRAPER_REGISTRY
+from src.cli import SCRAPER_REGISTRY, load_scraper
+
+
+def _run_one(spec: str) -> dict:
+    """Führt einen Scraper mit eigener DB-Session aus (eine Session pro Thread)."""
+    scraper_class = load_scraper(spec)
+    session = get_session()
+    try:
+        return scraper_class(session).run()
+    finally:
+        session.close()
 
 
 def run_all_scrapers():
@@ -31,31 +43,34 @@ def run_all_scrapers():
     print(f"GEPLANTER SCRAPE-LAUF: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     print(f"{'='*60}")
 
-    session = get_session()
     total_found = 0
     total_new = 0
     total_updated = 0
     errors = []
 
-    for name, scraper_class in SCRAPER_REGISTRY.items():
-        print(f"\n--- {name} ---")
-        try:
-            scraper = scraper_class(session)
-            result = scraper.run()
-
-            if result["status"] == "success":
-                print(f"[OK] {result['source']}: {result['events_found']} gefunden, {result['events_new']} neu, {result['events_updated']} aktualisiert")
-                total_found += result["events_found"]
-                total_new += result["events_new"]
-                total_updated += result["events_updated"]
-            else:
-                print(f"[FEHLER] {result['source']}: {result['error']}")
-                errors.append(f"{name}: {result['error']}")
-        except Exception as e:
-            print(f"[FEHLER] {name}: {e}")
-            errors.append(f"{name}: {e}")
-
-    session.close()
+    # Scraper parallel ausführen (I/O-gebunden, verschiedene Hosts); Ausgabe im Haupt-Thread
+    with ThreadPoolExecutor(max_workers=get_settings().scrape_concurrency) as executor:
+        futures = {
+            executor.submit(_run_one, spec): name
+            for name, spec in SCRAPER_REGISTRY.items()
+        }
+        for future in as_completed(futures):
+            name = futures[future]
+            print(f"\n--- {name} ---")
+            try:
+                result = future.result()
+
+                if result["status"] == "success":
+                    print(f"[OK] {result['source']}: {result['events_found']} gefunden, {result['events_new']} neu, {result['events_updated']} aktualisiert")
+                    total_found += result["events_found"]
+                    total_new += result["events_new"]
+                    total_updated += result["events_updated"]
+                else:
+                    print(f"[FEHLER] {result['source']}: {result['error']}")
+                    errors.append(f"{name}: {result['error']}")
+            except Exception as e:
+                print(f"[FEHLER] {name}: {e}")
+                errors.append(f"{name}: {e}")
 
     print(f"\n{'='*60}")
     print(f"ZUSAMMENFASSUNG")
@@ -1,87 +1,44 @@
 from .base import BaseScraper, ScrapedEvent
+from .lazy import lazy_exports
 
-# Baden-Württemberg - Hohenlohekreis
-from .baden_wuerttemberg.hohenlohekreis import (
-    MulfingenScraper,
-    DoerzbachScraper,
-    IngelfingenScraper,
-    KuenzelsauScraper,
-    ForchtenbergScraper,
-    BretzfeldScraper,
-    KrautheimScraper,
-    KupferzellScraper,
-    NeuensteinScraper,
-    NiedernhallScraper,
-    OehringenScraper,
-    PfedelbachScraper,
-    SchoentralScraper,
-    WaldenburgScraper,
-    WeissbachScraper,
-    ZweiflingenScraper,
-)
-
-# Baden-Württemberg - Schwäbisch Hall
-from .baden_wuerttemberg.schwaebisch_hall import (
-    BlaufeldenScraper,
-    BraunsbachScraper,
-    CrailsheimScraper,
-    GaildorfScraper,
-    GerabronnScraper,
-    LangenburgScraper,
-    MainhardtScraper,
-    MichelfeldScraper,
-    SchrozbergScraper,
-    SchwaebischHallScraper,
-    UntermuenkheimScraper,
-)
-
-# Baden-Württemberg - Main-Tauber-Kreis
-from .baden_wuerttemberg.main_tauber_kreis import (
-    BadMergentheimScraper,
-    BoxbergScraper,
-    CrelingenScraper,
-    IgersheimScraper,
-    NiederstettenScraper,
-    WeikersheimScraper,
-)
-
-__all__ = [
-    "BaseScraper",
-    "ScrapedEvent",
+# Scraper-Module werden erst beim ersten Zugriff importiert (PEP 562)
+_LAZY = {
     # Baden-Württemberg - Hohenlohekreis
-    "MulfingenScraper",
-    "DoerzbachScraper",
-    "IngelfingenScraper",
-    "KuenzelsauScraper",
-    "ForchtenbergScraper",
-    "BretzfeldScraper",
-    "KrautheimScraper",
-    "KupferzellScraper",
-    "NeuensteinScraper",
-    "NiedernhallScraper",
-    "OehringenScraper",
-    "PfedelbachScraper",
-    "SchoentralScraper",
-    "WaldenburgScraper",
-    "WeissbachScraper",
-    "ZweiflingenScraper",
+    "MulfingenScraper": "baden_wuerttemberg.hohenlohekreis.mulfingen",
+    "DoerzbachScraper": "baden_wuerttemberg.hohenlohekreis.doerzbach",
+    "IngelfingenScraper": "baden_wuerttemberg.hohenlohekreis.ingelfingen",
+    "KuenzelsauScraper": "baden_wuerttemberg.hohenlohekreis.kuenzelsau",
+    "ForchtenbergScraper": "baden_wuerttemberg.hohenlohekreis.forchtenberg",
+    "BretzfeldScraper": "baden_wuerttemberg.hohenlohekreis.bretzfeld",
+    "KrautheimScraper": "baden_wuerttemberg.hohenlohekreis.krautheim",
+    "KupferzellScraper": "baden_wuerttemberg.hohenlohekreis.kupferzell",
+    "NeuensteinScraper": "baden_wuerttemberg.hohenlohekreis.neuenstein",
+    "NiedernhallScraper": "baden_wuerttemberg.hohenlohekreis.niedernhall",
+    "OehringenScraper": "baden_wuerttemberg.hohenlohekreis.oehringen",
+    "PfedelbachScraper": "baden_wuerttemberg.hohenlohekreis.pfedelbach",
+    "SchoentralScraper": "baden_wuerttemberg.hohenlohekreis.schoental",
+    "WaldenburgScraper": "baden_wuerttemberg.hohenlohekreis.waldenburg",
+    "WeissbachScraper": "baden_wuerttemberg.hohenlohekreis.weissbach",
+    "ZweiflingenScraper": "baden_wuerttemberg.hohenlohekreis.zweiflingen",
     # Baden-Württemberg - Schwäbisch Hall
-    "BlaufeldenScraper",
-    "BraunsbachScraper",
-    "CrailsheimScraper",
-    "GaildorfScraper",
-    "GerabronnScraper",
-    "LangenburgScraper",
-    "MainhardtScraper",
-    "MichelfeldScraper",
-    "SchrozbergScraper",
-    "SchwaebischHallScraper",
-    "UntermuenkheimScraper",
+    "BlaufeldenScraper": "baden_wuerttemberg.schwaebisch_hall.blaufelden",
+    "BraunsbachScraper": "baden_wuerttemberg.schwaebisch_hall.braunsbach",
+    "CrailsheimScraper": "baden_wuerttemberg.schwaebisch_hall.crailsheim",
+    "GaildorfScraper": "baden_wuerttemberg.schwaebisch_hall.gaildorf",
+    "GerabronnScraper": "baden_wuerttemberg.schwaebisch_hall.gerabronn",
+    "LangenburgScraper": "baden_wuerttemberg.schwaebisch_hall.langenburg",
+    "MainhardtScraper": "baden_wuerttemberg.schwaebisch_hall.mainhardt",
+    "MichelfeldScraper": "baden_wuerttemberg.schwaebisch_hall.michelfeld",
+    "SchrozbergScraper": "baden_wuerttemberg.schwaebisch_hall.schrozberg",
+    "SchwaebischHallScraper": "baden_wuerttemberg.schwaebisch_hall.schwaebisch_hall",
+    "UntermuenkheimScraper": "baden_wuerttemberg.schwaebisch_hall.untermuenkheim",
     # Baden-Württemberg - Main-Tauber-Kreis
-    "BadMergentheimScraper",
-    "BoxbergScraper",
-    "CrelingenScraper",
-    "IgersheimScraper",
-    "NiederstettenScraper",
-    "WeikersheimScraper",
-]
+    "BadMergentheimScraper": "baden_wuerttemberg.main_tauber_kreis.bad_mergentheim",
+    "BoxbergScraper": "baden_wuerttemberg.main_tauber_kreis.boxberg",
+    "CrelingenScraper": "baden_wuerttemberg.main_tauber_kreis.creglingen",
+    "IgersheimScraper": "baden_wuerttemberg.main_tauber_kreis.igersheim",
+    "NiederstettenScraper": "baden_wuerttemberg.main_tauber_kreis.niederstetten",
+    "WeikersheimScraper": "baden_wuerttemberg.main_tauber_kreis.weikersheim",
+}
+
+__getattr__, __all__ = lazy_exports(__name__, _LAZY, eager=("BaseScraper", "ScrapedEvent"))
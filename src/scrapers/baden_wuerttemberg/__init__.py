@@ -2,83 +2,46 @@
 Scraper für Baden-Württemberg.
 """
 
-from .hohenlohekreis import (
-    MulfingenScraper,
-    DoerzbachScraper,
-    IngelfingenScraper,
-    KuenzelsauScraper,
-    ForchtenbergScraper,
-    BretzfeldScraper,
-    KrautheimScraper,
-    KupferzellScraper,
-    NeuensteinScraper,
-    NiedernhallScraper,
-    OehringenScraper,
-    PfedelbachScraper,
-    SchoentralScraper,
-    WaldenburgScraper,
-    WeissbachScraper,
-    ZweiflingenScraper,
-)
+from ..lazy import lazy_exports
 
-from .schwaebisch_hall import (
-    BlaufeldenScraper,
-    BraunsbachScraper,
-    CrailsheimScraper,
-    GaildorfScraper,
-    GerabronnScraper,
-    LangenburgScraper,
-    MainhardtScraper,
-    MichelfeldScraper,
-    SchrozbergScraper,
-    SchwaebischHallScraper,
-    UntermuenkheimScraper,
-)
-
-from .main_tauber_kreis import (
-    BadMergentheimScraper,
-    BoxbergScraper,
-    CrelingenScraper,
-    IgersheimScraper,
-    NiederstettenScraper,
-    WeikersheimScraper,
-)
-
-__all__ = [
+# Scraper-Module werden erst beim ersten Zugriff importiert (PEP 562)
+_LAZY = {
     # Hohenlohekreis
-    "MulfingenScraper",
-    "DoerzbachScraper",
-    "IngelfingenScraper",
-    "KuenzelsauScraper",
-    "ForchtenbergScraper",
-    "BretzfeldScraper",
-    "KrautheimScraper",
-    "KupferzellScraper",
-    "NeuensteinScraper",
-    "NiedernhallScraper",
-    "OehringenScraper",
-    "PfedelbachScraper",
-    "SchoentralScraper",
-    "WaldenburgScraper",
-    "WeissbachScraper",
-    "ZweiflingenScraper",
+    "MulfingenScraper": "hohenlohekreis.mulfingen",
+    "DoerzbachScraper": "hohenlohekreis.doerzbach",
+    "IngelfingenScraper": "hohenlohekreis.ingelfingen",
+    "KuenzelsauScraper": "hohenlohekreis.kuenzelsau",
+    "ForchtenbergScraper": "hohenlohekreis.forchtenberg",
+    "BretzfeldScraper": "hohenlohekreis.bretzfeld",
+    "KrautheimScraper": "hohenlohekreis.krautheim",
+    "KupferzellScraper": "hohenlohekreis.kupferzell",
+    "NeuensteinScraper": "hohenlohekreis.neuenstein",
+    "NiedernhallScraper": "hohenlohekreis.niedernhall",
+    "OehringenScraper": "hohenlohekreis.oehringen",
+    "PfedelbachScraper": "hohenlohekreis.pfedelbach",
+    "SchoentralScraper": "hohenlohekreis.schoental",
+    "WaldenburgScraper": "hohenlohekreis.waldenburg",
+    "WeissbachScraper": "hohenlohekreis.weissbach",
+    "ZweiflingenScraper": "hohenlohekreis.zweiflingen",
     # Schwäbisch Hall
-    "BlaufeldenScraper",
-    "BraunsbachScraper",
-    "CrailsheimScraper",
-    "GaildorfScraper",
-    "GerabronnScraper",
-    "LangenburgScraper",
-    "MainhardtScraper",
-    "MichelfeldScraper",
-    "SchrozbergScraper",
-    "SchwaebischHallScraper",
-    "UntermuenkheimScraper",
+    "BlaufeldenScraper": "schwaebisch_hall.blaufelden",
+    "BraunsbachScraper": "schwaebisch_hall.braunsbach",
+    "CrailsheimScraper": "schwaebisch_hall.crailsheim",
+    "GaildorfScraper": "schwaebisch_hall.gaildorf",
+    "GerabronnScraper": "schwaebisch_hall.gerabronn",
+    "LangenburgScraper": "schwaebisch_hall.langenburg",
+    "MainhardtScraper": "schwaebisch_hall.mainhardt",
+    "MichelfeldScraper": "schwaebisch_hall.michelfeld",
+    "SchrozbergScraper": "schwaebisch_hall.schrozberg",
+    "SchwaebischHallScraper": "schwaebisch_hall.schwaebisch_hall",
+    "UntermuenkheimScraper": "schwaebisch_hall.untermuenkheim",
     # Main-Tauber-Kreis
-    "BadMergentheimScraper",
-    "BoxbergScraper",
-    "CrelingenScraper",
-    "IgersheimScraper",
-    "NiederstettenScraper",
-    "WeikersheimScraper",
-]
+    "BadMergentheimScraper": "main_tauber_kreis.bad_mergentheim",
+    "BoxbergScraper": "main_tauber_kreis.boxberg",
+    "CrelingenScraper": "main_tauber_kreis.creglingen",
+    "IgersheimScraper": "main_tauber_kreis.igersheim",
+    "NiederstettenScraper": "main_tauber_kreis.niederstetten",
+    "WeikersheimScraper": "main_tauber_kreis.weikersheim",
+}
+
+__getattr__, __all__ = lazy_exports(__name__, _LAZY)
@@ -2,38 +2,26 @@
 Scraper für den Hohenlohekreis (Baden-Württemberg).
 """
 
-from .mulfingen import MulfingenScraper
-from .doerzbach import DoerzbachScraper
-from .ingelfingen import IngelfingenScraper
-from .kuenzelsau import KuenzelsauScraper
-from .forchtenberg import ForchtenbergScraper
-from .bretzfeld import BretzfeldScraper
-from .krautheim import KrautheimScraper
-from .kupferzell import KupferzellScraper
-from .neuenstein import NeuensteinScraper
-from .niedernhall import NiedernhallScraper
-from .oehringen import OehringenScraper
-from .pfedelbach import PfedelbachScraper
-from .schoental import SchoentralScraper
-from .waldenburg import WaldenburgScraper
-from .weissbach import WeissbachScraper
-from .zweiflingen import ZweiflingenScraper
+from ...lazy import lazy_exports
 
-__all__ = [
-    "MulfingenScraper",
-    "DoerzbachScraper",
-    "IngelfingenScraper",
-    "KuenzelsauScraper",
-    "ForchtenbergScraper",
-    "BretzfeldScraper",
-    "KrautheimScraper",
-    "KupferzellScraper",
-    "NeuensteinScraper",
-    "NiedernhallScraper",
-    "OehringenScraper",
-    "PfedelbachScraper",
-    "SchoentralScraper",
-    "WaldenburgScraper",
-    "WeissbachScraper",
-    "ZweiflingenScraper",
-]
+# Scraper-Module werden erst beim ersten Zugriff importiert (PEP 562)
+_LAZY = {
+    "MulfingenScraper": "mulfingen",
+    "DoerzbachScraper": "doerzbach",
+    "IngelfingenScraper": "ingelfingen",
+    "KuenzelsauScraper": "kuenzelsau",
+    "ForchtenbergScraper": "forchtenberg",
+    "BretzfeldScraper": "bretzfeld",
+    "KrautheimScraper": "krautheim",
+    "KupferzellScraper": "kupferzell",
+    "NeuensteinScraper": "neuenstein",
+    "NiedernhallScraper": "niedernhall",
+    "OehringenScraper": "oehringen",
+    "PfedelbachScraper": "pfedelbach",
+    "SchoentralScraper": "schoental",
+    "WaldenburgScraper": "waldenburg",
+    "WeissbachScraper": "weissbach",
+    "ZweiflingenScraper": "zweiflingen",
+}
+
+__getattr__, __all__ = lazy_exports(__name__, _LAZY)
@@ -4,14 +4,28 @@ Website: https://www.bretzfeld.de/freizeit-tourismus/termine-veranstaltungen/ver
 Pagination: /seite-X/
 """
 
+import hashlib
 import re
 from datetime import date as date_class, time as time_class
 from typing import List, Optional
+from urllib.parse import parse_qs, urlsplit
 
-from bs4 import BeautifulSoup, Tag
+from bs4 import BeautifulSoup, SoupStrainer, Tag
 
 from ...base import BaseScraper, ScrapedEvent
 
+# Einmal kompiliert statt pro Event
+_DATE_RE = re.compile(r"(\d{1,2})\.(\d{1,2})\.(\d{4})")
+_TIME_RE = re.compile(r"(\d{1,2}):(\d{2})")
+_PAGE_RE = re.compile(r"/seite-(\d+)/")
+_CONTAINER_ID_RE = re.compile(r"__(\d+)$")
+_URL_ID_RE = re.compile(r"/veranstaltungskalender/(\d+)/")
+
+# Seiten 2..N: nur die Event-Container parsen (Regex, da "class" mehrere Werte hat)
+_STRAINER = SoupStrainer(class_=re.compile(r"(^|\s)hwveranstaltung__record(\s|$)"))
+# Seiten ohne diesen Text haben keine Events und werden gar nicht erst geparst
+_CONTAINER_MARKER = b"hwveranstaltung__record"
+
 
 class BretzfeldScraper(BaseScraper):
     """Scraper für Bretzfeld Veranstaltungen mit Pagination."""
@@ -43,7 +57,17 @@ class BretzfeldScraper(BaseScraper):
 
         date_str = date_str.strip()
 
-        match = re.search(r"(\d{1,2})\.(\d{1,2})\.(\d{4})", date_str)
+        # Schnellpfad ohne Regex: "DD.MM.YYYY" am Anfang
+        if (
+            len(date_str) >= 10 and date_str[2] == "." and date_str[5] == "."
+            and date_str[:2].isdecimal() and date_str[3:5].isdecimal() and date_str[6:10].isdecimal()
+        ):
+            try:
+                return date_class(int(date_str[6:10]), int(date_str[3:5]), int(date_str[:2]))
+            except ValueError:
+                return None
+
+        match = _DATE_RE.search(date_str)
         if match:
             try:
                 day = int(match.group(1))
@@ -62,7 +86,17 @@ class BretzfeldScraper(BaseScraper):
         if not time_str:
             return None
 
-        match = re.search(r"(\d{1,2}):(\d{2})", time_str)
+        # Schnellpfad ohne Regex: "HH:MM" am Anfang
+        if (
+            len(time_str) >= 5 and time_str[2] == ":"
+            and time_str[:2].isdecimal() and time_str[3:5].isdecimal()
+        ):
+            try:
+                return time_class(int(time_str[:2]), int(time_str[3:5]))
+            except ValueError:
+                return None
+
+        match = _TIME_RE.search(time_str)
         if match:
             try:
                 hour = int(match.group(1))
@@ -83,14 +117,11 @@ class BretzfeldScraper(BaseScraper):
         """
         max_page = 1
 
-        # Finde alle Pagination-Links mit "Zur Seite X" im Title
-        pagination_links = soup.select('.hw_pagination a.hw_button[title^="Zur Seite"]')
-        for link in pagination_links:
-            href = link.get("href", "")
-            match = re.search(r"/seite-(\d+)/", href)
-            if match:
-                page_num = int(match.group(1))
-                max_page = max(max_page, page_num)
+        # Höchste Seitenzahl per Regex über das Markup der Pagination statt
+        # über die einzelnen "Zur Seite X"-Links
+        pagination = soup.select_one(".hw_pagination")
+        if pagination:
+            max_page = max((int(num) for num in _PAGE_RE.findall(str(pagination))), default=1)
 
         # Generiere alle URLs
         base_pattern = "https://www.bretzfeld.de/freizeit-tourismus/termine-veranstaltungen/veranstaltungskalender/seite-{}/suche-none"
@@ -102,24 +133,22 @@ class BretzfeldScraper(BaseScraper):
         """
         Parst Events von allen Seiten (mit Pagination).
         """
-        all_events = []
-        seen_event_keys = set()
-
         page_urls = self.get_all_page_urls(soup)
 
         print(f"[INFO] {len(page_urls)} Seiten gefunden")
 
-        for i, page_url in enumerate(page_urls):
-            if i == 0:
-                page_soup = soup
-            else:
-                print(f"[INFO] Lade Seite {i + 1}/{len(page_urls)}")
-                page_soup = self.fetch_page(page_url)
-
-            page_events = self._parse_page_events(page_soup, seen_event_keys)
-            all_events.extend(page_events)
+        # Erste Seite haben wir schon, die restlichen parallel laden und parsen
+        if len(page_urls) > 1:
+            print(f"[INFO] Lade Seiten 2-{len(page_urls)}")
+        pages = [self._parse_page_events(soup, set())] + self.fetch_pages(
+            page_urls[1:],
+            parse=lambda page_soup: self._parse_page_events(page_soup, set()),
+            parse_only=_STRAINER,
+            marker=_CONTAINER_MARKER,
+        )
 
-        return all_events
+        # Seitenübergreifende Duplikate erst am Ende verwerfen
+        return self.merge_page_events(pages)
 
     def _parse_page_events(
         self, soup: BeautifulSoup, seen_keys: set
@@ -127,10 +156,11 @@ class BretzfeldScraper(BaseScraper):
         """Parst Events von einer einzelnen Seite."""
         events = []
 
-        containers = soup.select(self.SELECTORS["event_container"])
+        containers = self.COMPILED_SELECTORS["event_container"].select(soup)
 
+        parse_single_event = self._parse_single_event
         for container in containers:
-            event = self._parse_single_event(container)
+            event = parse_single_event(container)
             if event and event.external_id not in seen_keys:
                 seen_keys.add(event.external_id)
                 events.append(event)
@@ -139,9 +169,10 @@ class BretzfeldScraper(BaseScraper):
 
     def _parse_single_event(self, container: Tag) -> Optional[ScrapedEvent]:
         """Parst ein einzelnes Event aus dem Container."""
+        selectors = self.COMPILED_SELECTORS
 
         # Titel extrahieren
-        title_elem = container.select_one(self.SELECTORS["title"])
+        title_elem = selectors["title"].select_one(container)
         if not title_elem:
             return None
 
@@ -151,13 +182,13 @@ class BretzfeldScraper(BaseScraper):
 
         # URL extrahieren
         url = None
-        url_elem = container.select_one(self.SELECTORS["url"])
+        url_elem = selectors["url"].select_one(container)
         if url_elem and url_elem.get("href"):
             url = self.resolve_url(url_elem.get("href"))
 
         # Datum extrahieren
         event_date = None
-        date_elem = container.select_one(self.SELECTORS["date"])
+        date_elem = selectors["date"].select_one(container)
         if date_elem:
             date_text = date_elem.get_text(strip=True)
             event_date = self.parse_german_date(date_text)
@@ -167,28 +198,29 @@ class BretzfeldScraper(BaseScraper):
 
         # Uhrzeit extrahieren
         event_time = None
-        time_elem = container.select_one(self.SELECTORS["time"])
+        time_elem = selectors["time"].select_one(container)
         if time_elem:
             time_text = time_elem.get_text(strip=True)
             event_time = self.parse_time(time_text)
 
         # Location extrahieren
         location = None
-        loc_elem = container.select_one(self.SELECTORS["location"])
+        loc_elem = selectors["location"].select_one(container)
         if loc_elem:
             location = loc_elem.get_text(strip=True)
 
         # Koordinaten aus OSM-Link extrahieren
         location_latitude = None
         location_longitude = None
-        osm_link = container.select_one(self.SELECTORS["osm_link"])
+        osm_link = selectors["osm_link"].select_one(container)
         if osm_link:
-            href = osm_link.get("href", "")
-            lat_match = re.search(r"mlat=([0-9.]+)", href)
-            lon_match = re.search(r"mlon=([0-9.]+)", href)
-            if lat_match and lon_match:
-                location_latitude = float(lat_match.group(1))
-                location_longitude = float(lon_match.group(1))
+            query = parse_qs(urlsplit(osm_link.get("href", "")).query)
+            if "mlat" in query and "mlon" in query:
+                try:
+                    location_latitude = float(query["mlat"][0])
+                    location_longitude = float(query["mlon"][0])
+                except ValueError:
+                    location_latitude = location_longitude = None
 
         # External ID generieren
         external_id = self._generate_external_id(container, title, event_date, url)
@@ -211,18 +243,17 @@ class BretzfeldScraper(BaseScraper):
 
         # Methode 1: ID aus Container-Attribut (id="hwveranstaltung__record__638")
         container_id = container.get("id", "")
-        match = re.search(r"__(\d+)$", container_id)
+        match = _CONTAINER_ID_RE.search(container_id)
         if match:
             return f"{match.group(1)}_{event_date}"
 
         # Methode 2: ID aus URL extrahieren (/veranstaltungskalender/638/...)
         if url:
-            match = re.search(r"/veranstaltungskalender/(\d+)/", url)
+            match = _URL_ID_RE.search(url)
             if match:
                 return f"{match.group(1)}_{event_date}"
 
         # Fallback: Hash aus Titel + Datum
-        import hashlib
         hash_input = f"{title}_{event_date}".encode("utf-8")
         hash_id = hashlib.md5(hash_input).hexdigest()[:8]
         return f"bretzfeld_{hash_id}_{event_date}"
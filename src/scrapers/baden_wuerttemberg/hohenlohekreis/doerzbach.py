@@ -4,13 +4,41 @@ Website: https://www.doerzbach.de/leben/veranstaltungen
 Pagination: ?seite=X
 """
 
+import hashlib
 import re
 from datetime import datetime, date as date_class, time as time_class
 from typing import List, Optional
-from bs4 import BeautifulSoup, Tag
+from bs4 import BeautifulSoup, SoupStrainer, Tag
 
 from ...base import BaseScraper, ScrapedEvent
 
+# Einmal kompiliert statt pro Event
+_DATE_RE = re.compile(r"(\d{1,2})\.(\d{1,2})\.(\d{4})")
+_TIME_RE = re.compile(r"(\d{1,2}):(\d{2})")
+_PAGE_RE = re.compile(r"seite=(\d+)")
+_URL_ID_RE = re.compile(r"/veranstaltungen/(\d+)/")
+_ICON_PREFIX_RE = re.compile(r"^\s*[\uf0d8\uf041]\s*")
+
+# Seiten 2..N: nur <article> parsen, plus <a>, da der Event-Link das
+# <article> umschließen kann (find_parent("a") in _parse_single_event)
+_STRAINER = SoupStrainer(["a", "article"])
+# Seiten ohne <article> haben keine Events und werden gar nicht erst geparst
+_CONTAINER_MARKER = b"<article"
+
+
+def _closest_parent(elem: Tag) -> Optional[Tag]:
+    """
+    Zeile eines Icons: nächstes <li>-Elternelement, sonst nächstes <div>.
+    Entspricht find_parent("li") or find_parent("div"), aber in einem Aufwärtslauf.
+    """
+    first_div = None
+    for parent in elem.parents:
+        if parent.name == "li":
+            return parent
+        if first_div is None and parent.name == "div":
+            first_div = parent
+    return first_div
+
 
 class DoerzbachScraper(BaseScraper):
     """Scraper für Dörzbach Veranstaltungen mit Pagination."""
@@ -52,8 +80,23 @@ class DoerzbachScraper(BaseScraper):
 
         date_str = date_str.strip()
 
+        # Wochentag-Präfix "So. " für den Schnellpfad abschneiden
+        head = date_str
+        if head[2:4] == ". " and head[:2].lower() in self.WEEKDAYS:
+            head = head[4:]
+
+        # Schnellpfad ohne Regex: "DD.MM.YYYY" am Anfang
+        if (
+            len(head) >= 10 and head[2] == "." and head[5] == "."
+            and head[:2].isdecimal() and head[3:5].isdecimal() and head[6:10].isdecimal()
+        ):
+            try:
+                return date_class(int(head[6:10]), int(head[3:5]), int(head[:2]))
+            except ValueError:
+                return None
+
         # Format: "So. 08.03.2026" oder "08.03.2026"
-        match = re.search(r"(\d{1,2})\.(\d{1,2})\.(\d{4})", date_str)
+        match = _DATE_RE.search(date_str)
         if match:
             try:
                 day = int(match.group(1))
@@ -72,7 +115,17 @@ class DoerzbachScraper(BaseScraper):
         if not time_str:
             return None
 
-        match = re.search(r"(\d{1,2}):(\d{2})", time_str)
+        # Schnellpfad ohne Regex: "HH:MM" am Anfang
+        if (
+            len(time_str) >= 5 and time_str[2] == ":"
+            and time_str[:2].isdecimal() and time_str[3:5].isdecimal()
+        ):
+            try:
+                return time_class(int(time_str[:2]), int(time_str[3:5]))
+            except ValueError:
+                return None
+
+        match = _TIME_RE.search(time_str)
         if match:
             try:
                 hour = int(match.group(1))
@@ -99,7 +152,7 @@ class DoerzbachScraper(BaseScraper):
             # Der Link ist das Parent <a> Element
             last_page_link = last_page_icon.find_parent('a')
             if last_page_link and last_page_link.get('href'):
-                match = re.search(r"seite=(\d+)", last_page_link.get('href'))
+                match = _PAGE_RE.search(last_page_link.get('href'))
                 if match:
                     max_page = int(match.group(1))
 
@@ -108,7 +161,7 @@ class DoerzbachScraper(BaseScraper):
             pagination_links = soup.select('a[href*="seite="]')
             for link in pagination_links:
                 href = link.get("href", "")
-                match = re.search(r"seite=(\d+)", href)
+                match = _PAGE_RE.search(href)
                 if match:
                     page_num = int(match.group(1))
                     max_page = max(max_page, page_num)
@@ -127,28 +180,23 @@ class DoerzbachScraper(BaseScraper):
         """
         Parst Events von allen Seiten (mit Pagination).
         """
-        all_events = []
-        seen_event_keys = set()
-
         # Erste Seite wurde bereits geladen
         page_urls = self.get_all_page_urls(soup)
 
         print(f"[INFO] {len(page_urls)} Seiten gefunden")
 
-        for i, page_url in enumerate(page_urls):
-            if i == 0:
-                # Erste Seite haben wir schon
-                page_soup = soup
-            else:
-                # Weitere Seiten laden
-                print(f"[INFO] Lade Seite {i + 1}/{len(page_urls)}")
-                page_soup = self.fetch_page(page_url)
-
-            # Events auf dieser Seite parsen
-            page_events = self._parse_page_events(page_soup, seen_event_keys)
-            all_events.extend(page_events)
+        # Weitere Seiten parallel laden, jede Seite direkt im Worker parsen
+        if len(page_urls) > 1:
+            print(f"[INFO] Lade Seiten 2-{len(page_urls)}")
+        pages = [self._parse_page_events(soup, set())] + self.fetch_pages(
+            page_urls[1:],
+            parse=lambda page_soup: self._parse_page_events(page_soup, set()),
+            parse_only=_STRAINER,
+            marker=_CONTAINER_MARKER,
+        )
 
-        return all_events
+        # Duplikate über alle Seiten hinweg erst am Ende verwerfen
+        return self.merge_page_events(pages)
 
     def _parse_page_events(
         self, soup: BeautifulSoup, seen_keys: set
@@ -157,10 +205,11 @@ class DoerzbachScraper(BaseScraper):
         events = []
 
         # Finde alle Event-Container
-        containers = soup.select(self.SELECTORS["event_container"])
+        containers = self.COMPILED_SELECTORS["event_container"].select(soup)
 
+        parse_single_event = self._parse_single_event
         for container in containers:
-            event = self._parse_single_event(container)
+            event = parse_single_event(container)
             if event and event.external_id not in seen_keys:
                 seen_keys.add(event.external_id)
                 events.append(event)
@@ -169,9 +218,10 @@ class DoerzbachScraper(BaseScraper):
 
     def _parse_single_event(self, container: Tag) -> Optional[ScrapedEvent]:
         """Parst ein einzelnes Event aus dem Container."""
+        selectors = self.COMPILED_SELECTORS
 
         # Titel extrahieren
-        title_elem = container.select_one(self.SELECTORS["title"])
+        title_elem = selectors["title"].select_one(container)
         if not title_elem:
             return None
 
@@ -185,20 +235,20 @@ class DoerzbachScraper(BaseScraper):
         if link and link.get("href"):
             url = self.resolve_url(link.get("href"))
 
-        # Datum extrahieren
+        # Datum: zuerst die Zeile mit dem Kalender-Icon, damit ein Datum im
+        # Titel oder Teaser nicht vor dem eigentlichen Termin gewinnt
         event_date = None
-        date_icon = container.select_one(self.SELECTORS["date"])
+        date_text = ""
+        date_icon = selectors["date"].select_one(container)
         if date_icon:
-            # Das Datum steht im Parent-Element des Icons
-            date_parent = date_icon.find_parent("li") or date_icon.find_parent("div")
+            date_parent = _closest_parent(date_icon)
             if date_parent:
                 date_text = date_parent.get_text(strip=True)
                 event_date = self.parse_german_date(date_text)
 
         if not event_date:
             # Fallback: Suche im gesamten Container nach Datum
-            container_text = container.get_text()
-            date_match = re.search(r"(\d{1,2})\.(\d{1,2})\.(\d{4})", container_text)
+            date_match = _DATE_RE.search(container.get_text(" ", strip=True))
             if date_match:
                 try:
                     event_date = date_class(
@@ -212,31 +262,26 @@ class DoerzbachScraper(BaseScraper):
         if not event_date:
             return None
 
-        # Uhrzeit extrahieren
+        # Uhrzeit: Zeile mit dem Uhr-Icon, sonst in der Datumszeile
         event_time = None
-        time_icon = container.select_one(self.SELECTORS["time"])
+        time_icon = selectors["time"].select_one(container)
         if time_icon:
-            time_parent = time_icon.find_parent("li") or time_icon.find_parent("div")
+            time_parent = _closest_parent(time_icon)
             if time_parent:
-                time_text = time_parent.get_text(strip=True)
-                event_time = self.parse_time(time_text)
+                event_time = self.parse_time(time_parent.get_text(strip=True))
 
-        # Fallback: Uhrzeit im Datumstext suchen
-        if not event_time and date_icon:
-            date_parent = date_icon.find_parent("li") or date_icon.find_parent("div")
-            if date_parent:
-                date_text = date_parent.get_text(strip=True)
-                event_time = self.parse_time(date_text)
+        if not event_time and date_text:
+            event_time = self.parse_time(date_text)
 
         # Location extrahieren
         location = None
-        loc_icon = container.select_one(self.SELECTORS["location"])
+        loc_icon = selectors["location"].select_one(container)
         if loc_icon:
-            loc_parent = loc_icon.find_parent("li") or loc_icon.find_parent("div")
+            loc_parent = _closest_parent(loc_icon)
             if loc_parent:
                 location = loc_parent.get_text(strip=True)
                 # Icon-Text entfernen falls vorhanden
-                location = re.sub(r"^\s*[\uf0d8\uf041]\s*", "", location).strip()
+                location = _ICON_PREFIX_RE.sub("", location).strip()
 
         # External ID generieren
         external_id = self._generate_external_id(title, event_date, url)
@@ -257,12 +302,11 @@ class DoerzbachScraper(BaseScraper):
         # Versuche ID aus URL zu extrahieren
         if url:
             # URL-Muster: /veranstaltungen/123/event-name
-            match = re.search(r"/veranstaltungen/(\d+)/", url)
+            match = _URL_ID_RE.search(url)
             if match:
                 return f"{match.group(1)}_{event_date}"
 
         # Fallback: Hash aus Titel + Datum
-        import hashlib
         hash_input = f"{title}_{event_date}".encode("utf-8")
         hash_id = hashlib.md5(hash_input).hexdigest()[:8]
         return f"doerzbach_{hash_id}_{event_date}"
@@ -3,14 +3,54 @@ Scraper für die Stadt Künzelsau.
 Website: https://kuenzelsau.de/freizeit+und+kultur/veranstaltungen
 """
 
+import hashlib
+import html
 import re
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date as date_class, time as time_class
 from typing import List, Optional
 
+import soupsieve
 from bs4 import BeautifulSoup, Tag
 
 from ...base import BaseScraper, ScrapedEvent
 
+# Pro Event geprüft, daher einmal kompiliert (wie COMPILED_SELECTORS)
+_ICAL_LINK = soupsieve.compile('a[href*=".ics"]')
+
+_DATE_RE = re.compile(r"(\d{1,2})\.(\d{1,2})\.(\d{4})")
+_ISO_DATE_RE = re.compile(r"(\d{4})-(\d{2})-(\d{2})")
+_TIME_RE = re.compile(r"(\d{1,2}):(\d{2})")
+_PAGE_RE = re.compile(r"/page(\d+)/")
+_NODE_ID_RE = re.compile(r"nodeID=(\d+)")
+_ZMDETAIL_RE = re.compile(r"zmdetail_(\d+)")
+_POSTAL_CODE_RE = re.compile(r"(\d{5})")
+_MLAT_RE = re.compile(r"mlat=([0-9.]+)")
+_MLON_RE = re.compile(r"mlon=([0-9.]+)")
+
+
+def _class_tag_re(class_name: str) -> "re.Pattern[bytes]":
+    """Rest des Start-Tags nach einem class-Attribut, das `class_name` enthält."""
+    return re.compile(
+        rb'class="(?:[^"]*\s)?' + re.escape(class_name.encode()) + rb'(?:\s[^"]*)?"[^>]*>'
+    )
+
+
+# Inhalt direkt nach dem Start-Tag, wenn er nur aus Text besteht
+_PLAIN_TEXT_RE = re.compile(rb"([^<]*)</")
+
+# Detail-Seiten werden nur nach diesen Feldern durchsucht - ein Regex-Scan
+# über die Rohbytes spart den Baumaufbau. Feld -> (Klasse, Muster)
+_DETAIL_FIELDS = {
+    field: (class_name.encode(), _class_tag_re(class_name))
+    for field, class_name in (
+        ("street", "street-address"),
+        ("postal_code", "postal-code"),
+        ("city", "locality"),
+    )
+}
+_OSM_HREF_RE = re.compile(rb'<a\s[^>]*?href="([^"]*openstreetmap\.org[^"]*)"')
+
 
 class KuenzelsauScraper(BaseScraper):
     """Scraper für Künzelsau Veranstaltungen."""
@@ -41,7 +81,7 @@ class KuenzelsauScraper(BaseScraper):
 
         date_str = date_str.strip()
 
-        match = re.search(r"(\d{1,2})\.(\d{1,2})\.(\d{4})", date_str)
+        match = _DATE_RE.search(date_str)
         if match:
             try:
                 day = int(match.group(1))
@@ -60,7 +100,19 @@ class KuenzelsauScraper(BaseScraper):
         if not date_str:
             return None
 
-        match = re.match(r"(\d{4})-(\d{2})-(\d{2})", date_str.strip())
+        date_str = date_str.strip()
+
+        # Schnellpfad ohne Regex: "YYYY-MM-DD" am Anfang
+        if (
+            len(date_str) >= 10 and date_str[4] == "-" and date_str[7] == "-"
+            and date_str[:4].isdecimal() and date_str[5:7].isdecimal() and date_str[8:10].isdecimal()
+        ):
+            try:
+                return date_class(int(date_str[:4]), int(date_str[5:7]), int(date_str[8:10]))
+            except ValueError:
+                return None
+
+        match = _ISO_DATE_RE.match(date_str)
         if match:
             try:
                 year = int(match.group(1))
@@ -79,8 +131,18 @@ class KuenzelsauScraper(BaseScraper):
         if not time_str:
             return None
 
+        # Schnellpfad ohne Regex: "HH:MM" am Anfang
+        if (
+            len(time_str) >= 5 and time_str[2] == ":"
+            and time_str[:2].isdecimal() and time_str[3:5].isdecimal()
+        ):
+            try:
+                return time_class(int(time_str[:2]), int(time_str[3:5]))
+            except ValueError:
+                return None
+
         # Nimm die erste Uhrzeit (Startzeit)
-        match = re.search(r"(\d{1,2}):(\d{2})", time_str)
+        match = _TIME_RE.search(time_str)
         if match:
             try:
                 hour = int(match.group(1))
@@ -100,13 +162,14 @@ class KuenzelsauScraper(BaseScraper):
 
         Die Pagination ist in div.zmNavigClass und zeigt alle Seiten an.
         """
-        urls = [self.EVENTS_URL]  # Erste Seite
-        seen_pages = {1}
+        # (Seitennummer, URL) - die Nummer dient zugleich als Sortierschlüssel
+        pages = []
+        seen_pages = {1}  # Erste Seite
 
         # Suche nach Pagination-Container
         pagination = soup.select_one('.zmNavigClass')
         if not pagination:
-            return urls
+            return [self.EVENTS_URL]
 
         # Finde alle Seiten-Links
         page_links = pagination.select('.zmNavigClassItem a')
@@ -117,57 +180,84 @@ class KuenzelsauScraper(BaseScraper):
                 continue
 
             # Extrahiere Seitennummer aus URL (/page2/, /page3/, etc.)
-            match = re.search(r"/page(\d+)/", href)
+            match = _PAGE_RE.search(href)
             if match:
                 page_num = int(match.group(1))
                 if page_num not in seen_pages:
                     seen_pages.add(page_num)
                     # Vollständige URL erstellen
-                    full_url = self.resolve_url(href)
-                    urls.append(full_url)
+                    pages.append((page_num, self.resolve_url(href)))
 
         # Sortiere nach Seitennummer
-        def get_page_num(url):
-            match = re.search(r"/page(\d+)/", url)
-            return int(match.group(1)) if match else 1
-
-        urls.sort(key=get_page_num)
+        pages.sort(key=lambda page: page[0])
 
-        return urls
+        return [self.EVENTS_URL] + [url for _, url in pages]
 
     def parse_events(self, soup: BeautifulSoup) -> List[ScrapedEvent]:
         """
         Parst Events von allen Seiten (mit Pagination falls vorhanden).
         """
-        all_events = []
-        seen_event_keys = set()
-
         page_urls = self.get_all_page_urls(soup)
 
         print(f"[INFO] {len(page_urls)} Seiten gefunden")
 
-        for i, page_url in enumerate(page_urls):
-            if i == 0:
-                page_soup = soup
-            else:
-                print(f"[INFO] Lade Seite {i + 1}/{len(page_urls)}")
-                page_soup = self.fetch_page(page_url)
+        # Erste Seite haben wir schon, die restlichen parallel laden und parsen
+        if len(page_urls) > 1:
+            print(f"[INFO] Lade Seiten 2-{len(page_urls)}")
+        pages = [self._parse_page_events(soup, set())] + self.fetch_pages(
+            page_urls[1:], parse=lambda page_soup: self._parse_page_events(page_soup, set())
+        )
+        all_events = self.merge_page_events(pages)
 
-            page_events = self._parse_page_events(page_soup, seen_event_keys)
-            all_events.extend(page_events)
+        self._add_location_details(all_events)
 
         return all_events
 
+    def _add_location_details(self, events: List[ScrapedEvent]) -> None:
+        """
+        Lädt für Locations, die noch nicht in der DB sind, die Detail-Seite
+        (eine pro Location, parallel) und überträgt Adresse/Koordinaten auf
+        alle Events mit dieser Location. Läuft im Haupt-Thread, da
+        location_exists() die DB-Session nutzt.
+        """
+        detail_urls = {}
+        location_exists = self.location_exists
+        for event in events:
+            location = event.raw_location
+            if location and event.url and location not in detail_urls:
+                if not location_exists(location):
+                    detail_urls[location] = event.url
+
+        if not detail_urls:
+            return
+
+        print(f"[INFO] Lade {len(detail_urls)} Detail-Seiten für neue Locations")
+        workers = min(self.PAGE_FETCH_CONCURRENCY, len(detail_urls))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            details = dict(zip(
+                detail_urls, executor.map(self._fetch_location_details, detail_urls.values())
+            ))
+
+        for event in events:
+            detail_data = details.get(event.raw_location)
+            if detail_data:
+                event.location_street = detail_data.get("street")
+                event.location_postal_code = detail_data.get("postal_code")
+                event.location_city = detail_data.get("city")
+                event.location_latitude = detail_data.get("latitude")
+                event.location_longitude = detail_data.get("longitude")
+
     def _parse_page_events(
         self, soup: BeautifulSoup, seen_keys: set
     ) -> List[ScrapedEvent]:
         """Parst Events von einer einzelnen Seite."""
         events = []
 
-        containers = soup.select(self.SELECTORS["event_container"])
+        containers = self.COMPILED_SELECTORS["event_container"].select(soup)
 
+        parse_single_event = self._parse_single_event
         for container in containers:
-            event = self._parse_single_event(container)
+            event = parse_single_event(container)
             if event and event.external_id not in seen_keys:
                 seen_keys.add(event.external_id)
                 events.append(event)
@@ -176,9 +266,10 @@ class KuenzelsauScraper(BaseScraper):
 
     def _parse_single_event(self, container: Tag) -> Optional[ScrapedEvent]:
         """Parst ein einzelnes Event aus dem Container."""
+        selectors = self.COMPILED_SELECTORS
 
         # Titel extrahieren
-        title_elem = container.select_one(self.SELECTORS["title"])
+        title_elem = selectors["title"].select_one(container)
         if not title_elem:
             return None
 
@@ -188,13 +279,13 @@ class KuenzelsauScraper(BaseScraper):
 
         # URL extrahieren
         url = None
-        url_elem = container.select_one(self.SELECTORS["url"])
+        url_elem = selectors["url"].select_one(container)
         if url_elem and url_elem.get("href"):
             url = self.resolve_url(url_elem.get("href"))
 
         # Datum extrahieren
         event_date = None
-        date_elem = container.select_one(self.SELECTORS["date"])
+        date_elem = selectors["date"].select_one(container)
         if date_elem:
             # Versuche zuerst das title-Attribut (ISO-Format)
             title_attr = date_elem.get("title", "")
@@ -211,38 +302,22 @@ class KuenzelsauScraper(BaseScraper):
 
         # Uhrzeit extrahieren
         event_time = None
-        time_elem = container.select_one(self.SELECTORS["time"])
+        time_elem = selectors["time"].select_one(container)
         if time_elem:
             time_text = time_elem.get_text(strip=True)
             event_time = self.parse_time(time_text)
 
         # Location extrahieren (raw_name aus Übersicht)
         location = None
-        loc_elem = container.select_one(self.SELECTORS["location"])
+        loc_elem = selectors["location"].select_one(container)
         if loc_elem:
             location = loc_elem.get_text(strip=True)
 
         # External ID generieren
         external_id = self._generate_external_id(container, title, event_date, url)
 
-        # Location-Details initialisieren
-        location_street = None
-        location_postal_code = None
-        location_city = None
-        location_latitude = None
-        location_longitude = None
-
-        # Wenn Location vorhanden und noch nicht in DB, lade Detail-Seite
-        if location and url and not self.location_exists(location):
-            print(f"[INFO] Lade Detail-Seite für neue Location: {location}")
-            detail_data = self._fetch_location_details(url)
-            if detail_data:
-                location_street = detail_data.get("street")
-                location_postal_code = detail_data.get("postal_code")
-                location_city = detail_data.get("city")
-                location_latitude = detail_data.get("latitude")
-                location_longitude = detail_data.get("longitude")
-
+        # Adresse/Koordinaten neuer Locations ergänzt parse_events danach
+        # gesammelt über _add_location_details()
         return ScrapedEvent(
             external_id=external_id,
             title=title,
@@ -250,11 +325,6 @@ class KuenzelsauScraper(BaseScraper):
             event_time=event_time,
             url=url,
             raw_location=location,
-            location_street=location_street,
-            location_postal_code=location_postal_code,
-            location_city=location_city,
-            location_latitude=location_latitude,
-            location_longitude=location_longitude,
         )
 
     def _fetch_location_details(self, detail_url: str) -> Optional[dict]:
@@ -268,45 +338,92 @@ class KuenzelsauScraper(BaseScraper):
         - OSM-Link mit mlat=...&mlon=... für Koordinaten
         """
         try:
-            soup = self.fetch_page(detail_url)
-
-            result = {}
-
-            # Straße
-            street_elem = soup.select_one(".street-address")
-            if street_elem:
-                result["street"] = street_elem.get_text(strip=True)
-
-            # PLZ (kann "74653 Künzelsau" sein - nur PLZ extrahieren)
-            postal_elem = soup.select_one(".postal-code")
-            if postal_elem:
-                postal_text = postal_elem.get_text(strip=True)
-                # Extrahiere nur die Ziffern (PLZ)
-                postal_match = re.match(r"(\d{5})", postal_text)
-                if postal_match:
-                    result["postal_code"] = postal_match.group(1)
-
-            # Stadt
-            city_elem = soup.select_one(".locality")
-            if city_elem:
-                result["city"] = city_elem.get_text(strip=True)
-
-            # Koordinaten aus OSM-Link
-            osm_link = soup.select_one('a[href*="openstreetmap.org"]')
-            if osm_link:
-                href = osm_link.get("href", "")
-                lat_match = re.search(r"mlat=([0-9.]+)", href)
-                lon_match = re.search(r"mlon=([0-9.]+)", href)
-                if lat_match and lon_match:
-                    result["latitude"] = float(lat_match.group(1))
-                    result["longitude"] = float(lon_match.group(1))
-
+            raw = self.fetch_html(detail_url)
+            result = self._scan_location_details(raw)
+            if result is None:
+                # Markup weicht ab (z.B. verschachtelte Tags) - vollständig parsen
+                result = self._parse_location_details(BeautifulSoup(raw, "lxml"))
             return result if result else None
 
         except Exception as e:
             print(f"[WARN] Fehler beim Laden der Detail-Seite {detail_url}: {e}")
             return None
 
+    def _scan_location_details(self, raw: bytes) -> Optional[dict]:
+        """
+        Schneller Pfad: Adressfelder per Regex aus den Rohbytes lesen.
+
+        Wie select_one() zählt nur das erste Element mit der Klasse. Enthält
+        es Kind-Tags oder wird die Klasse nicht sicher erkannt, gibt die
+        Methode None zurück - dann entscheidet der BeautifulSoup-Pfad.
+        """
+        result = {}
+        try:
+            for field, (class_name, pattern) in _DETAIL_FIELDS.items():
+                tag_match = pattern.search(raw)
+                if not tag_match:
+                    if class_name in raw:
+                        return None
+                    continue
+
+                text_match = _PLAIN_TEXT_RE.match(raw, tag_match.end())
+                if not text_match:
+                    return None
+                result[field] = html.unescape(text_match.group(1).decode("utf-8")).strip()
+
+            osm_match = _OSM_HREF_RE.search(raw)
+            href = html.unescape(osm_match.group(1).decode("utf-8")) if osm_match else ""
+        except UnicodeDecodeError:
+            return None
+
+        if "postal_code" in result:
+            # PLZ (kann "74653 Künzelsau" sein - nur PLZ extrahieren)
+            postal_match = _POSTAL_CODE_RE.match(result.pop("postal_code"))
+            if postal_match:
+                result["postal_code"] = postal_match.group(1)
+
+        self._add_osm_coordinates(result, href)
+        return result
+
+    def _parse_location_details(self, soup: BeautifulSoup) -> dict:
+        """Langsamer Pfad: Adressfelder aus dem geparsten Dokument lesen."""
+        result = {}
+
+        # Straße
+        street_elem = soup.select_one(".street-address")
+        if street_elem:
+            result["street"] = street_elem.get_text(strip=True)
+
+        # PLZ (kann "74653 Künzelsau" sein - nur PLZ extrahieren)
+        postal_elem = soup.select_one(".postal-code")
+        if postal_elem:
+            postal_text = postal_elem.get_text(strip=True)
+            # Extrahiere nur die Ziffern (PLZ)
+            postal_match = _POSTAL_CODE_RE.match(postal_text)
+            if postal_match:
+                result["postal_code"] = postal_match.group(1)
+
+        # Stadt
+        city_elem = soup.select_one(".locality")
+        if city_elem:
+            result["city"] = city_elem.get_text(strip=True)
+
+        # Koordinaten aus OSM-Link
+        osm_link = soup.select_one('a[href*="openstreetmap.org"]')
+        if osm_link:
+            self._add_osm_coordinates(result, osm_link.get("href", ""))
+
+        return result
+
+    @staticmethod
+    def _add_osm_coordinates(result: dict, href: str) -> None:
+        """Übernimmt mlat/mlon aus einem OSM-Link in `result`."""
+        lat_match = _MLAT_RE.search(href)
+        lon_match = _MLON_RE.search(href)
+        if lat_match and lon_match:
+            result["latitude"] = float(lat_match.group(1))
+            result["longitude"] = float(lon_match.group(1))
+
     def _generate_external_id(
         self, container: Tag, title: str, event_date: date_class, url: Optional[str]
     ) -> str:
@@ -314,25 +431,24 @@ class KuenzelsauScraper(BaseScraper):
 
         # Methode 1: nodeID aus URL extrahieren
         if url:
-            match = re.search(r"nodeID=(\d+)", url)
+            match = _NODE_ID_RE.search(url)
             if match:
                 return f"{match.group(1)}_{event_date}"
 
             # Alternativ: zmdetail_ID aus URL
-            match = re.search(r"zmdetail_(\d+)", url)
+            match = _ZMDETAIL_RE.search(url)
             if match:
                 return f"{match.group(1)}_{event_date}"
 
         # Methode 2: iCal-Link prüfen
-        ical_link = container.select_one('a[href*=".ics"]')
+        ical_link = _ICAL_LINK.select_one(container)
         if ical_link:
             href = ical_link.get("href", "")
-            match = re.search(r"nodeID=(\d+)", href)
+            match = _NODE_ID_RE.search(href)
             if match:
                 return f"{match.group(1)}_{event_date}"
 
         # Fallback: Hash aus Titel + Datum
-        import hashlib
         hash_input = f"{title}_{event_date}".encode("utf-8")
         hash_id = hashlib.md5(hash_input).hexdigest()[:8]
         return f"kuenzelsau_{hash_id}_{event_date}"
@@ -2,18 +2,16 @@
 Scraper für den Main-Tauber-Kreis.
 """
 
-from .bad_mergentheim import BadMergentheimScraper
-from .boxberg import BoxbergScraper
-from .igersheim import IgersheimScraper
-from .niederstetten import NiederstettenScraper
-from .weikersheim import WeikersheimScraper
-from .creglingen import CrelingenScraper
+from ...lazy import lazy_exports
 
-__all__ = [
-    "BadMergentheimScraper",
-    "BoxbergScraper",
-    "CrelingenScraper",
-    "IgersheimScraper",
-    "NiederstettenScraper",
-    "WeikersheimScraper",
-]
+# Scraper-Module werden erst beim ersten Zugriff importiert (PEP 562)
+_LAZY = {
+    "BadMergentheimScraper": "bad_mergentheim",
+    "BoxbergScraper": "boxberg",
+    "CrelingenScraper": "creglingen",
+    "IgersheimScraper": "igersheim",
+    "NiederstettenScraper": "niederstetten",
+    "WeikersheimScraper": "weikersheim",
+}
+
+__getattr__, __all__ = lazy_exports(__name__, _LAZY)
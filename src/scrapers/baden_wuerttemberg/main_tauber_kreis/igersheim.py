@@ -32,6 +32,7 @@ class IgersheimScraper(BaseScraper):
     API_URL = "https://heimatinfo-api-platform.azurewebsites.net/export/events"
     API_CLIENT_ID = "f6857d5c-a6bc-4d18-9c87-0066c05cb80d"
     PAGE_SIZE = 50
+    ID_KEY = "id"  # external_id = igersheim_{id}
 
     GEOCODE_REGION = "97999 Igersheim"
 
@@ -97,6 +98,7 @@ class IgersheimScraper(BaseScraper):
         try:
             all_events = []
             seen_event_keys = set()
+            seen_item_ids = set()
 
             month_ranges = self._generate_month_ranges()
             print(f"[INFO] {len(month_ranges)} Monate zu scrapen")
@@ -121,6 +123,13 @@ class IgersheimScraper(BaseScraper):
                         break
 
                     for item in items:
+                        # Überlappende Monatsbereiche liefern Events mehrfach: vor dem Parsen prüfen
+                        item_id = item.get(self.ID_KEY)
+                        if item_id:
+                            if item_id in seen_item_ids:
+                                continue
+                            seen_item_ids.add(item_id)
+
                         event = self._parse_api_event(item)
                         if event and event.external_id not in seen_event_keys:
                             seen_event_keys.add(event.external_id)
@@ -2,28 +2,21 @@
 Scraper für den Landkreis Schwäbisch Hall (Baden-Württemberg).
 """
 
-from .blaufelden import BlaufeldenScraper
-from .braunsbach import BraunsbachScraper
-from .crailsheim import CrailsheimScraper
-from .gaildorf import GaildorfScraper
-from .gerabronn import GerabronnScraper
-from .langenburg import LangenburgScraper
-from .mainhardt import MainhardtScraper
-from .michelfeld import MichelfeldScraper
-from .schwaebisch_hall import SchwaebischHallScraper
-from .untermuenkheim import UntermuenkheimScraper
-from .schrozberg import SchrozbergScraper
+from ...lazy import lazy_exports
 
-__all__ = [
-    "BlaufeldenScraper",
-    "BraunsbachScraper",
-    "CrailsheimScraper",
-    "GaildorfScraper",
-    "GerabronnScraper",
-    "LangenburgScraper",
-    "MainhardtScraper",
-    "MichelfeldScraper",
-    "SchrozbergScraper",
-    "SchwaebischHallScraper",
-    "UntermuenkheimScraper",
-]
+# Scraper-Module werden erst beim ersten Zugriff importiert (PEP 562)
+_LAZY = {
+    "BlaufeldenScraper": "blaufelden",
+    "BraunsbachScraper": "braunsbach",
+    "CrailsheimScraper": "crailsheim",
+    "GaildorfScraper": "gaildorf",
+    "GerabronnScraper": "gerabronn",
+    "LangenburgScraper": "langenburg",
+    "MainhardtScraper": "mainhardt",
+    "MichelfeldScraper": "michelfeld",
+    "SchrozbergScraper": "schrozberg",
+    "SchwaebischHallScraper": "schwaebisch_hall",
+    "UntermuenkheimScraper": "untermuenkheim",
+}
+
+__getattr__, __all__ = lazy_exports(__name__, _LAZY)
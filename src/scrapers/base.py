@@ -6,15 +6,25 @@ Neue Scraper erben von dieser Klasse und überschreiben:
 - parse_events(): Parsing-Logik für die spezifische Website
 """
 
+import gzip
+import hashlib
+import os
+import threading
 import time
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from datetime import datetime, date, time as dt_time
-from typing import Optional, List, Dict, Any
+from datetime import datetime, date, time as dt_time, timezone
+from functools import lru_cache
+from pathlib import Path
+from typing import Optional, List, Dict, Any, Callable
 from urllib.parse import urljoin
 
 import requests
-from bs4 import BeautifulSoup
+import soupsieve
+from bs4 import BeautifulSoup, SoupStrainer
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from sqlalchemy.orm import Session
 
 from decimal import Decimal
@@ -24,7 +34,45 @@ from src.models import Source, Event, Location, LocationStatus, GeocodingStatus,
 from src.services.geocoding import GeocodingService
 
 
-@dataclass
+def create_http_session(user_agent: str) -> requests.Session:
+    """
+    HTTP-Session mit Connection-Pool (Keep-Alive) und Retries bei 429/5xx.
+    Kann von mehreren Scrapern gemeinsam (auch aus Threads) genutzt werden.
+    Accept-Encoding setzt requests selbst (gzip/deflate, mit brotli auch br).
+    """
+    http_session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=64,
+        pool_maxsize=64,
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=[429, 500, 502, 503, 504],
+            raise_on_status=False,  # letzte Antwort zurückgeben, raise_for_status() entscheidet
+        ),
+    )
+    http_session.mount("http://", adapter)
+    http_session.mount("https://", adapter)
+    http_session.headers.update({"User-Agent": user_agent, "Connection": "keep-alive"})
+    return http_session
+
+
+@lru_cache(maxsize=1)
+def get_shared_http_session() -> requests.Session:
+    """
+    Prozessweite HTTP-Session: alle Scraper (CLI, Scheduler, API-Jobs) teilen
+    sich so einen Connection-Pool, auch wenn sie parallel laufen.
+    """
+    return create_http_session(get_settings().user_agent)
+
+
+@lru_cache(maxsize=4096)
+def _join_url(base_url: str, relative_url: str) -> str:
+    """urljoin mit Cache - Pagination- und Location-Links wiederholen sich."""
+    return urljoin(base_url, relative_url)
+
+
+@dataclass(slots=True)
 class ScrapedEvent:
     """Datenklasse für ein gescraptes Event."""
 
@@ -61,6 +109,17 @@ class BaseScraper(ABC):
     BASE_URL: str = ""
     EVENTS_URL: str = ""
     GEOCODE_REGION: str = ""  # z.B. "74653 Künzelsau" für Google Geocoding
+    # API-Scraper: Feld im Roh-Item, aus dem allein die external_id entsteht.
+    # Damit lassen sich Duplikate schon vor _parse_api_event() verwerfen.
+    ID_KEY: Optional[str] = None
+
+    # Max. parallele Requests in fetch_pages() (Pagination-Seiten)
+    PAGE_FETCH_CONCURRENCY = 8
+    # Sekunden, die eine Seite im HTTP-Cache gültig bleibt (nur mit http_cache_dir)
+    MAX_AGE = 3600
+    # Optional: nur diese Teilbäume der Startseite aufbauen (run() -> fetch_page).
+    # Nur setzen, wenn parse_events() außerhalb davon nichts braucht.
+    PARSE_ONLY: Optional[SoupStrainer] = None
 
     # CSS-Selektoren - in Subklassen überschreiben
     SELECTORS: Dict[str, str] = {
@@ -72,7 +131,17 @@ class BaseScraper(ABC):
         "url": "",  # Link zur Detailseite (optional)
     }
 
-    def __init__(self, session: Session):
+    # Aus SELECTORS abgeleitet, pro Klasse einmal kompiliert (siehe __init_subclass__)
+    COMPILED_SELECTORS: Dict[str, soupsieve.SoupSieve] = {}
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # CSS-Selektoren einmal beim Klassenaufbau kompilieren statt bei jedem select_one()
+        cls.COMPILED_SELECTORS = {
+            key: soupsieve.compile(css) for key, css in cls.SELECTORS.items() if css
+        }
+
+    def __init__(self, session: Session, http_session: Optional[requests.Session] = None):
         self.session = session
         self.settings = get_settings()
         self.source: Optional[Source] = None
@@ -84,9 +153,11 @@ class BaseScraper(ABC):
         self._geo_not_found = 0
         self._geo_errors = 0
 
-        # HTTP Session
-        self.http_session = requests.Session()
-        self.http_session.headers.update({"User-Agent": self.settings.user_agent})
+        # raw_name aller Locations der Source, beim ersten location_exists() geladen
+        self._known_locations: Optional[set] = None
+
+        # HTTP Session (Standard: prozessweit geteilter Connection-Pool)
+        self.http_session = http_session or get_shared_http_session()
 
     def get_or_create_source(self) -> Source:
         """Holt oder erstellt den Source-Eintrag in der Datenbank."""
@@ -109,7 +180,7 @@ class BaseScraper(ABC):
         """Startet einen neuen Scrape-Log Eintrag."""
         log = ScrapeLog(
             source_id=self.source.id,
-            started_at=datetime.utcnow(),
+            started_at=datetime.now(timezone.utc),
             status=ScrapeStatus.RUNNING.value,
         )
         self.session.add(log)
@@ -126,7 +197,7 @@ class BaseScraper(ABC):
     ):
         """Beendet den Scrape-Log Eintrag."""
         if self.scrape_log:
-            self.scrape_log.finished_at = datetime.utcnow()
+            self.scrape_log.finished_at = datetime.now(timezone.utc)
             self.scrape_log.status = status.value
             self.scrape_log.events_found = events_found
             self.scrape_log.events_new = events_new
@@ -139,24 +210,117 @@ class BaseScraper(ABC):
             self.session.commit()
 
         if self.source:
-            self.source.last_scraped_at = datetime.utcnow()
+            self.source.last_scraped_at = datetime.now(timezone.utc)
             self.session.commit()
 
-    def fetch_page(self, url: Optional[str] = None) -> BeautifulSoup:
-        """Holt eine Seite und gibt BeautifulSoup-Objekt zurück."""
+    def fetch_html(self, url: Optional[str] = None) -> bytes:
+        """
+        Holt das rohe HTML einer Seite (Bytes, lxml erkennt das Encoding selbst).
+        Nutzt den HTTP-Cache und das Rate limiting; geparst wird erst beim Aufrufer.
+        """
         target_url = url or self.EVENTS_URL
 
-        # Rate limiting
-        time.sleep(self.settings.request_delay)
+        content = self._read_http_cache(target_url)
+        if content is None:
+            # Rate limiting
+            time.sleep(self.settings.request_delay)
 
-        response = self.http_session.get(target_url, timeout=30)
-        response.raise_for_status()
+            response = self.http_session.get(target_url, timeout=30)
+            response.raise_for_status()
+            content = response.content
+            self._write_http_cache(target_url, content)
 
-        return BeautifulSoup(response.content, "lxml")
+        return content
+
+    def fetch_page(
+        self, url: Optional[str] = None, parse_only: Optional[SoupStrainer] = None
+    ) -> BeautifulSoup:
+        """
+        Holt eine Seite und gibt BeautifulSoup-Objekt zurück.
+        Mit `parse_only` baut lxml nur die passenden Teilbäume auf.
+        """
+        return BeautifulSoup(self.fetch_html(url), "lxml", parse_only=parse_only)
+
+    def _http_cache_path(self, url: str) -> Optional[Path]:
+        """Cache-Datei für eine URL, None wenn der Cache aus ist."""
+        if not self.settings.http_cache_dir or self.MAX_AGE <= 0:
+            return None
+        name = hashlib.sha1(url.encode("utf-8")).hexdigest()
+        return Path(self.settings.http_cache_dir) / f"{name}.html.gz"
+
+    def _read_http_cache(self, url: str) -> Optional[bytes]:
+        """Gecachter Seiteninhalt, falls jünger als MAX_AGE."""
+        path = self._http_cache_path(url)
+        if path is None:
+            return None
+        try:
+            if time.time() - path.stat().st_mtime > self.MAX_AGE:
+                return None
+            return gzip.decompress(path.read_bytes())
+        except (OSError, EOFError):
+            return None
+
+    def _write_http_cache(self, url: str, content: bytes) -> None:
+        """Seiteninhalt in den Cache schreiben (atomar, auch aus fetch_pages-Threads)."""
+        path = self._http_cache_path(url)
+        if path is None:
+            return
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_bytes(gzip.compress(content, compresslevel=1))
+            os.replace(tmp_path, path)
+        except OSError as e:
+            print(f"[WARN] HTTP-Cache nicht schreibbar ({path}): {e}")
+
+    def fetch_pages(
+        self,
+        urls: List[str],
+        parse: Optional[Callable[[BeautifulSoup], Any]] = None,
+        parse_only: Optional[SoupStrainer] = None,
+        marker: Optional[bytes] = None,
+    ) -> List[Any]:
+        """
+        Holt mehrere Seiten parallel (Thread-Pool über fetch_html).
+        Die Reihenfolge der Ergebnisse entspricht der von `urls`.
+
+        Mit `parse` wird jede Seite noch im Worker-Thread weiterverarbeitet,
+        sodass Parsen und Laden der übrigen Seiten sich überlappen.
+        Enthält das rohe HTML `marker` nicht (z.B. die Container-Klasse),
+        wird statt der Seite ein leeres Dokument geparst.
+        """
+        def load(url: str) -> Any:
+            html = self.fetch_html(url)
+            if marker is not None and marker not in html:
+                html = b""
+            page_soup = BeautifulSoup(html, "lxml", parse_only=parse_only)
+            return parse(page_soup) if parse else page_soup
+
+        if len(urls) <= 1:
+            return [load(url) for url in urls]
+
+        workers = min(self.PAGE_FETCH_CONCURRENCY, len(urls))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(load, urls))
+
+    @staticmethod
+    def merge_page_events(pages: List[List[ScrapedEvent]]) -> List[ScrapedEvent]:
+        """
+        Führt die pro Seite geparsten Events zusammen. Bei gleicher external_id
+        gewinnt das zuerst gesehene Event, die Seitenreihenfolge bleibt erhalten.
+        """
+        merged: Dict[str, ScrapedEvent] = {}
+        for page_events in pages:
+            for event in page_events:
+                merged.setdefault(event.external_id, event)
+        return list(merged.values())
 
     def resolve_url(self, relative_url: str) -> str:
         """Macht aus einer relativen URL eine absolute URL."""
-        return urljoin(self.BASE_URL, relative_url)
+        # Bereits absolute Links brauchen kein urljoin
+        if relative_url.startswith(("https://", "http://")):
+            return relative_url
+        return _join_url(self.BASE_URL, relative_url)
 
     def location_exists(self, raw_name: str) -> bool:
         """
@@ -166,16 +330,14 @@ class BaseScraper(ABC):
         if not raw_name or not self.source:
             return False
 
-        raw_name = raw_name.strip()
+        if self._known_locations is None:
+            # Eine Query pro Lauf statt einer pro Location
+            self._known_locations = {
+                name for (name,) in self.session.query(Location.raw_name)
+                .filter(Location.source_id == self.source.id)
+            }
 
-        return (
-            self.session.query(Location)
-            .filter(
-                Location.source_id == self.source.id,
-                Location.raw_name == raw_name
-            )
-            .first()
-        ) is not None
+        return raw_name.strip() in self._known_locations
 
     def get_or_create_location(
         self,
@@ -220,7 +382,8 @@ class BaseScraper(ABC):
                 # Versuche Geocoding via Google API
                 if self.GEOCODE_REGION:
                     geocoding_service = GeocodingService(
-                        dry_run=self.settings.geocoding_dry_run
+                        dry_run=self.settings.geocoding_dry_run,
+                        http_session=self.http_session,
                     )
                     result = geocoding_service.geocode(raw_name, self.GEOCODE_REGION)
 
@@ -260,6 +423,9 @@ class BaseScraper(ABC):
             self.session.add(location)
             self.session.commit()
 
+            if self._known_locations is not None:
+                self._known_locations.add(raw_name)
+
         return location
 
     def save_event(self, scraped: ScrapedEvent) -> tuple[Event, bool]:
@@ -321,6 +487,43 @@ class BaseScraper(ABC):
             self.session.commit()
             return event, True
 
+    def save_events(self, scraped_events: List[ScrapedEvent]) -> Dict[str, bool]:
+        """
+        Speichert mehrere Events per Bulk-Upsert (ein Statement pro Batch,
+        ein Commit) statt SELECT + COMMIT pro Event.
+        Erwartet eindeutige external_ids.
+        Returns: external_id -> is_new
+        """
+        rows = []
+        for scraped in scraped_events:
+            location = None
+            if scraped.raw_location:
+                location = self.get_or_create_location(
+                    raw_name=scraped.raw_location,
+                    street=scraped.location_street,
+                    postal_code=scraped.location_postal_code,
+                    city=scraped.location_city,
+                    latitude=scraped.location_latitude,
+                    longitude=scraped.location_longitude,
+                )
+
+            rows.append({
+                "source_id": self.source.id,
+                "external_id": scraped.external_id,
+                "title": scraped.title,
+                "event_date": scraped.event_date,
+                "event_time": scraped.event_time,
+                "event_end_date": scraped.event_end_date,
+                "event_end_time": scraped.event_end_time,
+                "url": scraped.url,
+                "raw_location": scraped.raw_location,
+                "location_id": location.id if location else None,
+            })
+
+        saved = Event.bulk_upsert(self.session, rows)
+        self.session.commit()
+        return saved
+
     @abstractmethod
     def parse_events(self, soup: BeautifulSoup) -> List[ScrapedEvent]:
         """
@@ -344,7 +547,7 @@ class BaseScraper(ABC):
 
         try:
             # Seite laden
-            soup = self.fetch_page()
+            soup = self.fetch_page(parse_only=self.PARSE_ONLY)
 
             # Events parsen
             scraped_events = self.parse_events(soup)
@@ -353,8 +556,9 @@ class BaseScraper(ABC):
             if debug:
                 print(f"[DEBUG] Parsed {events_found} events from HTML")
 
-            # Events speichern
+            # Events sammeln
             seen_ids = set()
+            unique_events = []
             for i, scraped in enumerate(scraped_events):
                 if debug:
                     print(f"[DEBUG] Event {i+1}: {scraped.title[:40]}... | ID: {scraped.external_id} | Date: {scraped.event_date}")
@@ -366,16 +570,16 @@ class BaseScraper(ABC):
                     skipped += 1
                     continue
                 seen_ids.add(scraped.external_id)
+                unique_events.append(scraped)
 
-                event, is_new = self.save_event(scraped)
-                if is_new:
-                    events_new += 1
-                    if debug:
-                        print(f"  -> NEW")
-                else:
-                    events_updated += 1
-                    if debug:
-                        print(f"  -> UPDATED")
+            # Events speichern (Bulk-Upsert)
+            saved = self.save_events(unique_events)
+            events_new = sum(saved.values())
+            events_updated = len(saved) - events_new
+
+            if debug:
+                for external_id, is_new in saved.items():
+                    print(f"[DEBUG] {external_id} -> {'NEW' if is_new else 'UPDATED'}")
 
             self.finish_scrape_log(
                 ScrapeStatus.SUCCESS,
@@ -0,0 +1,32 @@
+"""
+Lazy Exports für die Scraper-Pakete (PEP 562).
+
+Die Pakete nennen ihre Scraper-Klassen samt Modul; importiert wird ein Modul
+erst beim ersten Zugriff, damit z.B. die CLI für einen einzelnen Scraper nicht
+alle Module laden muss.
+"""
+
+import importlib
+import sys
+from typing import Any, Callable, Dict, Iterable, List, Tuple
+
+
+def lazy_exports(
+    package: str, lazy: Dict[str, str], eager: Iterable[str] = ()
+) -> Tuple[Callable[[str], Any], List[str]]:
+    """
+    Liefert (__getattr__, __all__) für das Paket `package`.
+
+    `lazy` bildet Klassennamen auf Module relativ zum Paket ab, `eager` sind
+    bereits importierte Namen, die zusätzlich in __all__ stehen.
+    """
+
+    def __getattr__(name: str) -> Any:
+        if name not in lazy:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(f".{lazy[name]}", package), name)
+        # Im Paket ablegen, damit der nächste Zugriff __getattr__ nicht mehr braucht
+        setattr(sys.modules[package], name, value)
+        return value
+
+    return __getattr__, [*eager, *lazy]
@@ -12,7 +12,7 @@ from src.config import get_settings
 from src.models import GeocodingStatus
 
 
-@dataclass
+@dataclass(slots=True)
 class GeocodingResult:
     """Ergebnis eines Geocoding-Versuchs."""
     status: GeocodingStatus
@@ -37,16 +37,19 @@ class GeocodingService:
 
     API_URL = "https://maps.googleapis.com/maps/api/geocode/json"
 
-    def __init__(self, dry_run: bool = False):
+    def __init__(self, dry_run: bool = False, http_session: Optional[requests.Session] = None):
         """
         Initialisiert den Geocoding Service.
 
         Args:
             dry_run: Wenn True, werden keine API-Calls gemacht.
                      Stattdessen wird geloggt was gemacht würde.
+            http_session: Bestehende Session (z.B. die des Scrapers), damit
+                     die TLS-Verbindung zu Google wiederverwendet wird.
         """
         self.settings = get_settings()
         self.dry_run = dry_run
+        self.http_session = http_session or requests.Session()
 
     def geocode(self, raw_name: str, region: str) -> GeocodingResult:
         """
@@ -72,7 +75,7 @@ class GeocodingService:
             )
 
         try:
-            response = requests.get(
+            response = self.http_session.get(
                 self.API_URL,
                 params={
                     "address": search_address,